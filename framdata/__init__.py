@@ -3,9 +3,11 @@
 from framdata.populators.NVEEnergyModelPopulator import NVEEnergyModelPopulator
 from framdata.populators.timevector_populators import NVETimeVectorPopulator
 from framdata.populators.NVEPathManager import NVEPathManager
+from framdata.populators.ValidationReport import ValidationReport
 
 __all__ = [
     "NVEEnergyModelPopulator",
     "NVEPathManager",
     "NVETimeVectorPopulator",
+    "ValidationReport",
 ]
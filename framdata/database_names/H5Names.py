@@ -8,3 +8,29 @@ class H5Names:
     METADATA_GROUP = "metadata"
     VECTORS_GROUP = "vectors"
     COMMON_PREFIX = "common_"
+
+    # Matrix layout, storing all vectors as the columns of one 2D dataset (time x vector) instead of one dataset per vector in the vectors group
+    VECTOR_MATRIX = "vector_matrix"
+    VECTOR_MATRIX_IDS = "vector_matrix_ids"
+
+    # Version 1 stores indexes as byte strings, version 2 as int64 nanoseconds since epoch. Files without the attribute are version 1.
+    FORMAT_VERSION_ATTRIBUTE = "format_version"
+    FORMAT_VERSION = 2
+
+    # Fields describing the storage layout of a dataset
+    CHUNKS = "chunks"
+    COMPRESSION = "compression"
+    COMPRESSION_OPTS = "compression_opts"
+    SHUFFLE = "shuffle"
+    FLETCHER32 = "fletcher32"
+
+    # Curve files, storing the axes of all curves in the rows of padded 2D datasets (curve x point)
+    ENCODING = "utf-8"
+    CURVE_IDS = "curve_ids"
+    X_AXES = "x_axes"
+    Y_AXES = "y_axes"
+    CURVE_LENGTHS = "curve_lengths"
+    X_UNITS = "x_units"
+    Y_UNITS = "y_units"
+    CURVE_METADATA = "curve_metadata"
+    COMMON_CURVE_METADATA = "common_curve_metadata"
@@ -27,6 +27,8 @@ class _BaseComponentsNames(Base, ABC):
     columns: ClassVar[list[str]]  # All columns in the table.
     ref_columns: ClassVar[list[str]]  # Columns that are references to ids in other files.
 
+    VALIDATION_VERSION: ClassVar[int] = 1  # increase when the schemas or validate change, so cached validation results are not reused
+
     # Column names in Pandera's error/failure cases dataframe
     COL_SCHEMA = "schema_context"
     COL_COLUMN = "column"
@@ -0,0 +1,180 @@
+"""Contains class for editing curves in H5 files."""
+
+import json
+from pathlib import Path
+
+import h5py
+import numpy as np
+from framcore.loaders import CurveLoader
+from numpy.typing import ArrayLike, NDArray
+
+from framdata.database_names.H5Names import H5Names
+from framdata.file_editors._h5_format import check_compression
+from framdata.file_editors.NVEFileEditor import NVEFileEditor
+from framdata.loaders._file_handle_pool import file_handle_pool
+
+
+class NVEH5CurveEditor(NVEFileEditor):
+    """Class with functionality concerned with editing curves, their units and their metadata in H5 files read by NVEH5CurveLoader."""
+
+    def __init__(self, source: Path | str | None = None) -> None:
+        """
+        Set path to H5 file if supplied, and load its curves, units and metadata.
+
+        Args:
+            source (Path | str | None, optional): Path to H5 file with curves. Defaults to None.
+
+        """
+        super().__init__(source)
+
+        self._curves: dict[str, tuple[NDArray, NDArray]] = {}
+        self._units: dict[str, tuple[str, str]] = {}
+        self._metadata: dict[str, dict] = {}
+        self._common_metadata: dict = {}
+        if self._source is not None and self._source.exists():
+            self._read_curves()
+
+    def set_curve(self, curve_id: str, x_axis: ArrayLike, y_axis: ArrayLike, x_unit: str, y_unit: str) -> None:
+        """
+        Set the axes and units of a curve.
+
+        Args:
+            curve_id (str): ID of the curve.
+            x_axis (ArrayLike): Values of the x axis, increasing.
+            y_axis (ArrayLike): Values of the y axis, with the same length as the x axis.
+            x_unit (str): Unit of the x axis.
+            y_unit (str): Unit of the y axis.
+
+        Raises:
+            ValueError: If the axes are not one dimensional with equal length.
+
+        """
+        self._check_type(curve_id, str)
+        self._check_type(x_unit, str)
+        self._check_type(y_unit, str)
+        x_axis = np.asarray(x_axis, dtype=float)
+        y_axis = np.asarray(y_axis, dtype=float)
+        if x_axis.ndim != 1 or x_axis.shape != y_axis.shape:
+            msg = f"Axes of curve '{curve_id}' must be one dimensional with equal length, got shapes {x_axis.shape} and {y_axis.shape}."
+            raise ValueError(msg)
+        self._curves[curve_id] = (x_axis, y_axis)
+        self._units[curve_id] = (x_unit, y_unit)
+
+    def get_curve(self, curve_id: str) -> tuple[NDArray, NDArray]:
+        """Get the x and y axes of a curve."""
+        try:
+            return self._curves[curve_id]
+        except KeyError as e:
+            msg = f"Found no ID '{curve_id}' among curves."
+            raise KeyError(msg) from e
+
+    def get_units(self, curve_id: str) -> tuple[str, str]:
+        """Get the units of the x and y axes of a curve."""
+        try:
+            return self._units[curve_id]
+        except KeyError as e:
+            msg = f"Found no ID '{curve_id}' among curves."
+            raise KeyError(msg) from e
+
+    def get_curve_ids(self) -> list[str]:
+        """Get the IDs of all curves."""
+        return list(self._curves.keys())
+
+    def delete_curve(self, curve_id: str) -> None:
+        """Delete a curve with its units and metadata."""
+        self.get_curve(curve_id)
+        del self._curves[curve_id]
+        del self._units[curve_id]
+        self._metadata.pop(curve_id, None)
+
+    def get_metadata(self, curve_id: str) -> dict:
+        """Get a copy of the metadata of a curve."""
+        return self._metadata.get(curve_id, {}).copy()
+
+    def set_metadata(self, curve_id: str, value: dict) -> None:
+        """Set the metadata of a curve. Values must be serializable as JSON, other values are stored as strings."""
+        self._check_type(curve_id, str)
+        self._check_type(value, dict)
+        self._metadata[curve_id] = value
+
+    def get_common_metadata(self) -> dict:
+        """Get a copy of the metadata shared by all curves."""
+        return self._common_metadata.copy()
+
+    def set_common_metadata(self, value: dict) -> None:
+        """Set the metadata shared by all curves. Values must be serializable as JSON, other values are stored as strings."""
+        self._check_type(value, dict)
+        self._common_metadata = value
+
+    def set_curves_from_loader(self, loader: CurveLoader) -> None:
+        """
+        Set all curves of a CurveLoader with their units and metadata, e.g. to convert a yaml curve file to the H5 format.
+
+        Args:
+            loader (CurveLoader): Loader of the curves.
+
+        """
+        self._check_type(loader, CurveLoader)
+        for curve_id in loader.get_ids():
+            self.set_curve(curve_id, loader.get_x_axis(curve_id), loader.get_y_axis(curve_id), loader.get_x_unit(curve_id), loader.get_y_unit(curve_id))
+            self.set_metadata(curve_id, loader.get_metadata(curve_id))
+
+    def save_to_h5(self, path: Path | str, compression: str | None = None, compression_level: int | None = None) -> None:
+        """
+        Save the curves, units and metadata to a HDF5 file.
+
+        The axes of all curves are stored in the rows of two padded 2D datasets, padded with inf (x) and nan (y) after the points of each curve.
+
+        Args:
+            path (Path | str): Path to save the file to.
+            compression (str | None, optional): Compression filter of the axes, 'lzf' or 'gzip'. Defaults to None.
+            compression_level (int | None, optional): Level of gzip compression (0-9). Defaults to None.
+
+        Raises:
+            ValueError: If the compression options are not valid.
+
+        """
+        self._check_type(path, (Path, str))
+        path = Path(path)
+        check_compression(compression, compression_level)
+        axis_options = {} if compression is None else {"compression": compression, "compression_opts": compression_level, "shuffle": True}
+
+        curve_ids = self.get_curve_ids()
+        lengths = np.array([self._curves[curve_id][0].size for curve_id in curve_ids], dtype=np.int64)
+        width = max(2, lengths.max(initial=0))
+        x_axes = np.full((len(curve_ids), width), np.inf)
+        y_axes = np.full((len(curve_ids), width), np.nan)
+        for row, curve_id in enumerate(curve_ids):
+            x_axis, y_axis = self._curves[curve_id]
+            x_axes[row, : x_axis.size] = x_axis
+            y_axes[row, : y_axis.size] = y_axis
+
+        file_handle_pool.release(path)  # loaders in this process may hold the file open
+        with h5py.File(path, mode="w") as f:
+            f.attrs[H5Names.COMMON_CURVE_METADATA] = json.dumps(self._common_metadata, default=str)
+            f.create_dataset(H5Names.CURVE_IDS, data=self._encode(curve_ids))
+            f.create_dataset(H5Names.X_AXES, data=x_axes, **(axis_options if x_axes.size else {}))
+            f.create_dataset(H5Names.Y_AXES, data=y_axes, **(axis_options if y_axes.size else {}))
+            f.create_dataset(H5Names.CURVE_LENGTHS, data=lengths)
+            f.create_dataset(H5Names.X_UNITS, data=self._encode([self._units[curve_id][0] for curve_id in curve_ids]))
+            f.create_dataset(H5Names.Y_UNITS, data=self._encode([self._units[curve_id][1] for curve_id in curve_ids]))
+            metadata = [json.dumps(self._metadata.get(curve_id, {}), default=str) for curve_id in curve_ids]
+            f.create_dataset(H5Names.CURVE_METADATA, data=self._encode(metadata))
+
+    @staticmethod
+    def _encode(values: list[str]) -> NDArray:
+        return np.char.encode(np.array(values, dtype=str), encoding=H5Names.ENCODING)
+
+    def _read_curves(self) -> None:
+        with h5py.File(self._source, mode="r") as f:
+            curve_ids, x_units, y_units, metadata = (
+                np.char.decode(f[name][()], encoding=H5Names.ENCODING).tolist()
+                for name in (H5Names.CURVE_IDS, H5Names.X_UNITS, H5Names.Y_UNITS, H5Names.CURVE_METADATA)
+            )
+            x_axes, y_axes, lengths = (f[name][()] for name in (H5Names.X_AXES, H5Names.Y_AXES, H5Names.CURVE_LENGTHS))
+            self._common_metadata = json.loads(f.attrs.get(H5Names.COMMON_CURVE_METADATA, "{}"))
+
+        for row, curve_id in enumerate(curve_ids):
+            self._curves[curve_id] = (x_axes[row, : lengths[row]].copy(), y_axes[row, : lengths[row]].copy())
+            self._units[curve_id] = (x_units[row], y_units[row])
+            self._metadata[curve_id] = json.loads(metadata[row])
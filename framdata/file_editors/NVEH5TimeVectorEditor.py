@@ -1,8 +1,9 @@
 """Contains class for editing time vectors in H5 files."""
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
+from typing import ClassVar
 
 import h5py
 import numpy as np
@@ -10,7 +11,9 @@ from numpy.typing import NDArray
 
 from framdata.database_names.H5Names import H5Names
 from framdata.database_names.TimeVectorMetadataNames import TimeVectorMetadataNames as TvMn
+from framdata.file_editors._h5_format import decode_index, encode_index, get_dataset_options, write_meta_to_group
 from framdata.file_editors.NVEFileEditor import NVEFileEditor
+from framdata.loaders._file_handle_pool import file_handle_pool
 
 METADATA_TYPES = bool | int | str | datetime | timedelta | tzinfo | None
 
@@ -18,6 +21,8 @@ METADATA_TYPES = bool | int | str | datetime | timedelta | tzinfo | None
 class NVEH5TimeVectorEditor(NVEFileEditor):
     """Class with functionality concerned with editing time vectors and their metadata in H5 files."""
 
+    _MATRIX_CHUNK_COLUMNS: ClassVar[int] = 32  # vectors in each chunk of the matrix layout, so reading one vector decompresses a bounded amount
+
     def __init__(self, source: Path | str | None = None) -> None:
         """
         Set path to parquet file if supplied, load/initialize table and metadata as pd.DataFrame and dictionary respectively.
@@ -32,10 +37,13 @@ class NVEH5TimeVectorEditor(NVEFileEditor):
         self._metadata, self._common_metadata = meta_tuple
         index_tuple = (defaultdict(NDArray), None) if self._source is None or not self._source.exists() else self._read_data(H5Names.INDEX_GROUP, False)
         self._index, self._common_index = index_tuple
-        self._index = {k: v.astype(str) for k, v in self._index.items()}
+        self._index = {k: decode_index(v) for k, v in self._index.items()}
+        self._common_index = None if self._common_index is None else decode_index(self._common_index)
 
         vectors_tuple = (defaultdict(NDArray), None) if self._source is None or not self._source.exists() else self._read_data(H5Names.VECTORS_GROUP, False)
         self._vectors, __ = vectors_tuple
+        if self._source is not None and self._source.exists():
+            self._vectors.update(self._read_matrix())
 
     def get_metadata(self, vector_id: str) -> None | dict:
         """Get a copy of the metadata of the parquet file."""
@@ -101,9 +109,42 @@ class NVEH5TimeVectorEditor(NVEFileEditor):
         """Get the IDs of all vectors."""
         return list(self._vectors.keys())
 
-    def save_to_h5(self, path: Path | str) -> None:
+    def save_to_h5(
+        self,
+        path: Path | str,
+        compression: str | None = None,
+        compression_level: int | None = None,
+        chunk_size: int | None = None,
+        fletcher32: bool = False,
+        matrix_layout: bool = False,
+    ) -> None:
+        """
+        Save the vectors, indexes and metadata to a HDF5 file.
+
+        Vectors and indexes are stored contiguously by default. With compression, chunking or checksums they are stored in chunks along the time
+        dimension, and compressed datasets use the shuffle filter.
+
+        In the matrix layout all vectors are stored as the columns of one 2D dataset (time x vector) together with a dataset of their IDs, instead of
+        one dataset per vector. Reads of many vectors, or of a time window across all vectors, are then single hyperslab reads. Chunks of the matrix
+        hold a limited number of vectors.
+
+        Args:
+            path (Path | str): Path to save the file to.
+            compression (str | None, optional): Compression filter, 'lzf' or 'gzip'. Defaults to None.
+            compression_level (int | None, optional): Level of gzip compression (0-9). Defaults to None.
+            chunk_size (int | None, optional): Number of points in each chunk. Defaults to None, which uses a year of hourly values when the datasets are
+                                               chunked.
+            fletcher32 (bool, optional): Store a Fletcher32 checksum with each chunk. Defaults to False.
+            matrix_layout (bool, optional): Store the vectors in the matrix layout. Defaults to False.
+
+        Raises:
+            ValueError: If the compression options are not valid, or the vectors do not have equal length in the matrix layout.
+            KeyError: If vectors are missing indexes or metadata and there is no common index or metadata.
+
+        """
         self._check_type(path, (Path, str))
         path = Path(path)
+        dataset_options = get_dataset_options(compression, compression_level, chunk_size, fletcher32)
 
         missing_index = {v for v in self._vectors if v not in self._index}
         if self._common_index is None and len(missing_index) != 0:
@@ -115,32 +156,84 @@ class NVEH5TimeVectorEditor(NVEFileEditor):
             msg = f"Found vectors missing metadata and common metadata is not set: {missing_meta}."
             raise KeyError(msg)
 
+        matrix = self._get_matrix() if matrix_layout else None
+        index, common_index = self._collapse_indexes()
+
+        file_handle_pool.release(path)  # loaders in this process may hold the file open
         with h5py.File(path, mode="w") as f:
+            f.attrs[H5Names.FORMAT_VERSION_ATTRIBUTE] = H5Names.FORMAT_VERSION
             if self._common_metadata is not None:
                 common_meta_group = f.create_group(H5Names.COMMON_PREFIX + H5Names.METADATA_GROUP)
-                self._write_meta_to_group(common_meta_group, self._common_metadata)
-            if self._common_index is not None:
-                f.create_dataset(H5Names.COMMON_PREFIX + H5Names.INDEX_GROUP, data=self._common_index.astype(bytes))
+                write_meta_to_group(common_meta_group, self._common_metadata)
+            if common_index is not None:
+                f.create_dataset(H5Names.COMMON_PREFIX + H5Names.INDEX_GROUP, data=common_index, **self._get_chunks(common_index, dataset_options))
 
             if self._metadata:
                 meta_group = f.create_group(H5Names.METADATA_GROUP)
                 for vector_id, meta in self._metadata.items():
                     vm_group = meta_group.create_group(vector_id)
-                    self._write_meta_to_group(vm_group, meta)
+                    write_meta_to_group(vm_group, meta)
 
-            if self._index:
+            if index:
                 index_group = f.create_group(H5Names.INDEX_GROUP)
-                for vector_id, index in self._index.items():
-                    index_group.create_dataset(vector_id, data=index.astype(bytes))
-
-            if self._vectors:
+                for vector_id, encoded_index in index.items():
+                    index_group.create_dataset(vector_id, data=encoded_index, **self._get_chunks(encoded_index, dataset_options))
+
+            if matrix is not None:
+                matrix_options = self._get_chunks(matrix, dataset_options)
+                if matrix_options:
+                    matrix_options["chunks"] = (matrix_options["chunks"][0], min(self._MATRIX_CHUNK_COLUMNS, matrix.shape[1]))
+                f.create_dataset(H5Names.VECTOR_MATRIX, data=matrix, **matrix_options)
+                f.create_dataset(H5Names.VECTOR_MATRIX_IDS, data=np.char.encode(list(self._vectors), encoding=TvMn.ENCODING))
+            elif self._vectors:
                 vector_group = f.create_group(H5Names.VECTORS_GROUP)
                 for vector_id, vector in self._vectors.items():
-                    vector_group.create_dataset(vector_id, data=vector)
+                    vector_group.create_dataset(vector_id, data=vector, **self._get_chunks(vector, dataset_options))
+
+    def _get_matrix(self) -> NDArray:
+        """Stack the vectors as the columns of a 2D array (time x vector)."""
+        if not self._vectors:
+            message = "Cannot save an empty set of vectors in the matrix layout."
+            raise ValueError(message)
+        shapes = {vector_id: vector.shape for vector_id, vector in self._vectors.items()}
+        if len(set(shapes.values())) > 1 or len(next(iter(shapes.values()))) != 1:
+            message = f"All vectors must be one dimensional with equal length to be saved in the matrix layout. Got shapes {shapes}."
+            raise ValueError(message)
+        return np.column_stack(list(self._vectors.values()))
+
+    @staticmethod
+    def _get_chunks(data: NDArray, dataset_options: dict) -> dict:
+        """Get the keyword arguments of create_dataset for the data, with the chunk shape limited to the size of the data."""
+        if not dataset_options or data.size == 0:
+            return {}
+        options = {k: v for k, v in dataset_options.items() if k != "chunk_size"}
+        options["chunks"] = (min(dataset_options["chunk_size"], data.shape[0]), *data.shape[1:])
+        return options
+
+    def _collapse_indexes(self) -> tuple[dict[str, NDArray], NDArray | None]:
+        """
+        Encode the indexes and collapse identical per-vector indexes into the common index.
 
-    def _write_meta_to_group(self, meta_group: h5py.Group, metadata: dict) -> None:
-        for k, v in metadata.items():
-            meta_group.create_dataset(k, data=str(v).encode(TvMn.ENCODING))
+        Per-vector indexes equal to the common index are dropped. If there is no common index, the index shared by most vectors becomes the common
+        index when it is shared by more than one vector.
+
+        """
+        common_timezone = None if self._common_metadata is None else self._common_metadata.get(TvMn.TIMEZONE)
+        common_index = None if self._common_index is None else encode_index(self._common_index, common_timezone)
+        index = {
+            vector_id: encode_index(values, self._metadata[vector_id].get(TvMn.TIMEZONE) if vector_id in self._metadata else common_timezone)
+            for vector_id, values in self._index.items()
+        }
+
+        if common_index is None:
+            counts = Counter(values.tobytes() for values in index.values())
+            if counts and counts.most_common(1)[0][1] > 1:
+                shared = counts.most_common(1)[0][0]
+                common_index = next(values for values in index.values() if values.tobytes() == shared)
+
+        if common_index is not None:
+            index = {vector_id: values for vector_id, values in index.items() if not np.array_equal(values, common_index)}
+        return index, common_index
 
     def _read_data(
         self, group_name: str, cast_meta: bool
@@ -166,6 +259,15 @@ class NVEH5TimeVectorEditor(NVEFileEditor):
 
         return data, common_data
 
+    def _read_matrix(self) -> dict[str, NDArray]:
+        """Read the columns of the matrix of a file in the matrix layout as vectors."""
+        with h5py.File(self._source, mode="r") as f:
+            if H5Names.VECTOR_MATRIX not in f:
+                return {}
+            vector_ids = np.char.decode(f[H5Names.VECTOR_MATRIX_IDS][()], encoding=TvMn.ENCODING).tolist()
+            matrix = np.ascontiguousarray(f[H5Names.VECTOR_MATRIX][()].T)
+        return dict(zip(vector_ids, matrix, strict=True))
+
     def _read_datasets(self, field: h5py.Group | h5py.Dataset) -> dict | NDArray | bytes:
         if isinstance(field, h5py.Dataset):
             return field[()]
@@ -0,0 +1,369 @@
+"""Contains class for editing time vectors in H5 files in place."""
+
+from collections.abc import Iterable
+from datetime import tzinfo
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import h5py
+import numpy as np
+from numpy.typing import NDArray
+
+from framdata.database_names.H5Names import H5Names
+from framdata.database_names.TimeVectorMetadataNames import TimeVectorMetadataNames as TvMn
+from framdata.file_editors._h5_format import DEFAULT_CHUNK_SIZE, decode_index, encode_index, get_dataset_options, write_meta_to_group
+from framdata.file_editors.NVEFileEditor import NVEFileEditor
+from framdata.file_editors.NVEH5TimeVectorEditor import METADATA_TYPES
+from framdata.loaders._file_handle_pool import file_handle_pool
+
+
+class NVEH5TimeVectorInPlaceEditor(NVEFileEditor):
+    """
+    Class for editing time vectors and their metadata in a H5 file in place, with bounded memory.
+
+    The file is opened in append mode and nothing is read up front. Vectors, indexes and metadata are read when requested, and each change is written
+    to its own dataset in the file, so changing one vector does not rewrite the others. New datasets are chunked and resizable along the time
+    dimension, so vectors can be extended and streamed from an iterator one chunk at a time.
+
+    HDF5 does not reclaim the space of deleted or replaced datasets. Save the file with NVEH5TimeVectorEditor or run h5repack to shrink it after
+    large changes.
+
+    The editor holds the file open until close is called, use it as a context manager to close it on exit.
+
+    In SWMR (single-writer/multiple-reader) mode, loaders opened with swmr=True can read the file while the editor appends to it. The file must be
+    created by an editor opened with swmr=True, which uses the latest HDF5 file format. A SWMR writer can only change existing datasets, so the
+    vectors, indexes and metadata are created before start_swmr is called. Appended values are flushed immediately, and readers see them after
+    calling refresh.
+
+    """
+
+    def __init__(
+        self,
+        source: Path | str,
+        compression: str | None = None,
+        compression_level: int | None = None,
+        chunk_size: int | None = None,
+        fletcher32: bool = False,
+        swmr: bool = False,
+    ) -> None:
+        """
+        Open the H5 file in append mode, creating it if it does not exist.
+
+        The storage options apply to datasets created by the editor. Existing datasets keep their layout when they are written in place.
+
+        Args:
+            source (Path | str): Path to H5 file with time vectors.
+            compression (str | None, optional): Compression filter of new datasets, 'lzf' or 'gzip'. Defaults to None.
+            compression_level (int | None, optional): Level of gzip compression (0-9). Defaults to None.
+            chunk_size (int | None, optional): Number of points in each chunk of new datasets. Defaults to None, which uses a year of hourly values.
+            fletcher32 (bool, optional): Store a Fletcher32 checksum with each chunk of new datasets. Defaults to False.
+            swmr (bool, optional): Open the file with the latest file format, so writing can be switched to SWMR mode with start_swmr. Defaults to
+                                   False.
+
+        Raises:
+            ValueError: If the compression options are not valid, or the file stores its vectors in the matrix layout.
+
+        """
+        super().__init__(source)
+        chunk_size = DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size
+        self._dataset_options = get_dataset_options(compression, compression_level, chunk_size, fletcher32)
+
+        file_handle_pool.release(self._source)  # loaders in this process may hold the file open
+        self._file = h5py.File(self._source, mode="a", libver="latest") if swmr else h5py.File(self._source, mode="a")
+        if H5Names.VECTOR_MATRIX in self._file:
+            self._file.close()
+            message = f"{self._source} stores its vectors in the matrix layout, which can not be edited in place. Use NVEH5TimeVectorEditor."
+            raise ValueError(message)
+        self._swmr = swmr
+
+    def __enter__(self) -> Self:
+        """Return the editor."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Close the file."""
+        self.close()
+
+    def start_swmr(self) -> None:
+        """
+        Switch to SWMR writing, after which loaders opened with swmr=True can read the file while values are appended.
+
+        Only existing datasets can be changed after the switch, and new datasets can not be created.
+
+        Raises:
+            RuntimeError: If the editor was not opened with swmr=True.
+
+        """
+        if not self._swmr:
+            message = f"Editor of {self._source} must be opened with swmr=True to start SWMR writing."
+            raise RuntimeError(message)
+        self._file.swmr_mode = True
+
+    def close(self) -> None:
+        """Flush the changes and close the file."""
+        if self._file.id.valid:
+            self._file.close()
+        file_handle_pool.release(self._source)
+
+    def flush(self) -> None:
+        """Flush the changes to disk without closing the file."""
+        self._file.flush()
+
+    def get_vector_ids(self) -> list[str]:
+        """Get the IDs of all vectors."""
+        group = self._file.get(H5Names.VECTORS_GROUP)
+        return [] if group is None else list(group.keys())
+
+    def get_vector(self, vector_id: str, positions: slice | None = None) -> NDArray:
+        """
+        Read a vector, or a range of positions of it, from the file.
+
+        Args:
+            vector_id (str): ID of the vector.
+            positions (slice | None, optional): Range of positions to read. Defaults to None, which reads the whole vector.
+
+        Returns:
+            NDArray: Values of the vector.
+
+        """
+        dataset = self._get_dataset(H5Names.VECTORS_GROUP, vector_id)
+        return dataset[()] if positions is None else dataset[positions]
+
+    def set_vector(self, vector_id: str, values: NDArray) -> None:
+        """
+        Set a whole vector.
+
+        An existing vector is overwritten in place when the new values fit its dataset, otherwise the dataset is replaced.
+
+        Args:
+            vector_id (str): ID of the vector.
+            values (NDArray): Values of the vector.
+
+        """
+        self._check_type(vector_id, str)
+        self._check_type(values, np.ndarray)
+        self._write_dataset(H5Names.VECTORS_GROUP, vector_id, values)
+
+    def set_vector_values(self, vector_id: str, start: int, values: NDArray) -> None:
+        """
+        Overwrite part of an existing vector in place, starting at a position.
+
+        Args:
+            vector_id (str): ID of the vector.
+            start (int): Position of the first value to overwrite.
+            values (NDArray): New values.
+
+        Raises:
+            IndexError: If the values extend past the end of the vector.
+
+        """
+        self._check_type(start, int)
+        self._check_type(values, np.ndarray)
+        dataset = self._get_dataset(H5Names.VECTORS_GROUP, vector_id)
+        if start < 0 or start + values.shape[0] > dataset.shape[0]:
+            message = f"Cannot write {values.shape[0]} values at position {start} of vector '{vector_id}' with {dataset.shape[0]} values."
+            raise IndexError(message)
+        dataset[start : start + values.shape[0]] = values
+        if self._file.swmr_mode:  # make the values visible to readers
+            dataset.flush()
+
+    def extend_vector(self, vector_id: str, values: NDArray) -> None:
+        """
+        Append values to the end of an existing vector.
+
+        Contiguous datasets, such as those written by NVEH5TimeVectorEditor without chunking, are first copied to a resizable dataset chunk by chunk.
+
+        Args:
+            vector_id (str): ID of the vector.
+            values (NDArray): Values to append.
+
+        """
+        self._check_type(values, np.ndarray)
+        self._extend_dataset(self._get_resizable_dataset(self._get_dataset(H5Names.VECTORS_GROUP, vector_id)), values)
+
+    def set_vector_from_chunks(self, vector_id: str, chunks: Iterable[NDArray]) -> None:
+        """
+        Set a whole vector from an iterable of consecutive chunks of its values, holding one chunk in memory at a time.
+
+        An existing vector is replaced. The data type of the vector is the data type of the first chunk.
+
+        Args:
+            vector_id (str): ID of the vector.
+            chunks (Iterable[NDArray]): Consecutive chunks of the values of the vector.
+
+        Raises:
+            ValueError: If chunks is empty.
+
+        """
+        self._check_type(vector_id, str)
+        iterator = iter(chunks)
+        first = next(iterator, None)
+        if first is None:
+            message = f"Cannot set vector '{vector_id}' from an empty iterable of chunks."
+            raise ValueError(message)
+        self._delete(H5Names.VECTORS_GROUP, vector_id)
+        dataset = self._create_dataset(self._file.require_group(H5Names.VECTORS_GROUP), vector_id, np.asarray(first))
+        for chunk in iterator:
+            self._extend_dataset(dataset, np.asarray(chunk))
+
+    def delete_vector(self, vector_id: str) -> None:
+        """Delete a vector together with its own index and metadata."""
+        self._get_dataset(H5Names.VECTORS_GROUP, vector_id)
+        for group_name in (H5Names.VECTORS_GROUP, H5Names.INDEX_GROUP, H5Names.METADATA_GROUP):
+            self._delete(group_name, vector_id)
+
+    def get_index(self, vector_id: str) -> NDArray:
+        """Read the index of a vector as datetime64."""
+        return decode_index(self._get_dataset(H5Names.INDEX_GROUP, vector_id)[()])
+
+    def set_index(self, vector_id: str, index: NDArray) -> None:
+        """Set the index of a vector, stored as int64 nanoseconds since epoch. Time zone aware points require TimeZone in the metadata of the vector."""
+        self._check_type(vector_id, str)
+        self._check_type(index, np.ndarray)
+        self._write_dataset(H5Names.INDEX_GROUP, vector_id, encode_index(index, self._get_timezone(vector_id)))
+        self._file.attrs[H5Names.FORMAT_VERSION_ATTRIBUTE] = H5Names.FORMAT_VERSION
+
+    def extend_index(self, vector_id: str, index: NDArray) -> None:
+        """Append points to the end of the index of a vector."""
+        self._check_type(index, np.ndarray)
+        self._extend_index(self._get_dataset(H5Names.INDEX_GROUP, vector_id), index, self._get_timezone(vector_id))
+
+    def get_common_index(self) -> NDArray | None:
+        """Read the common index, or None if the file has no common index."""
+        dataset = self._file.get(H5Names.COMMON_PREFIX + H5Names.INDEX_GROUP)
+        return None if dataset is None else decode_index(dataset[()])
+
+    def set_common_index(self, index: NDArray) -> None:
+        """Set the common index, stored as int64 nanoseconds since epoch. Time zone aware points require TimeZone in the common metadata."""
+        self._check_type(index, np.ndarray)
+        self._write_dataset(None, H5Names.COMMON_PREFIX + H5Names.INDEX_GROUP, encode_index(index, self._get_timezone(None)))
+        self._file.attrs[H5Names.FORMAT_VERSION_ATTRIBUTE] = H5Names.FORMAT_VERSION
+
+    def extend_common_index(self, index: NDArray) -> None:
+        """Append points to the end of the common index."""
+        self._check_type(index, np.ndarray)
+        dataset = self._file.get(H5Names.COMMON_PREFIX + H5Names.INDEX_GROUP)
+        if not isinstance(dataset, h5py.Dataset):
+            msg = f"Found no common index in {self._source}."
+            raise KeyError(msg)
+        self._extend_index(dataset, index, self._get_timezone(None))
+
+    def get_metadata(self, vector_id: str) -> dict[str, METADATA_TYPES]:
+        """Read the metadata of a vector."""
+        group = self._get_group(H5Names.METADATA_GROUP, vector_id, h5py.Group)
+        metadata, __ = TvMn.cast_meta({key: dataset[()] for key, dataset in group.items()})
+        return metadata
+
+    def set_metadata(self, vector_id: str, value: dict[str, METADATA_TYPES]) -> None:
+        """Set the metadata of a vector, replacing its existing metadata."""
+        self._check_type(vector_id, str)
+        self._check_type(value, dict)
+        self._delete(H5Names.METADATA_GROUP, vector_id)
+        write_meta_to_group(self._file.require_group(H5Names.METADATA_GROUP).create_group(vector_id), value)
+
+    def get_common_metadata(self) -> dict[str, METADATA_TYPES] | None:
+        """Read the common metadata, or None if the file has no common metadata."""
+        group = self._file.get(H5Names.COMMON_PREFIX + H5Names.METADATA_GROUP)
+        if group is None:
+            return None
+        metadata, __ = TvMn.cast_meta({key: dataset[()] for key, dataset in group.items()})
+        return metadata
+
+    def set_common_metadata(self, value: dict[str, METADATA_TYPES]) -> None:
+        """Set the common metadata, replacing the existing common metadata."""
+        self._check_type(value, dict)
+        name = H5Names.COMMON_PREFIX + H5Names.METADATA_GROUP
+        if name in self._file:
+            del self._file[name]
+        write_meta_to_group(self._file.create_group(name), value)
+
+    def _get_timezone(self, vector_id: str | None) -> tzinfo | None:
+        """Get the TimeZone in the metadata of a vector, or in the common metadata if the vector has none or vector_id is None."""
+        group = self._file.get(H5Names.METADATA_GROUP)
+        if vector_id is not None and group is not None and vector_id in group:
+            return self.get_metadata(vector_id).get(TvMn.TIMEZONE)
+        metadata = self.get_common_metadata()
+        return None if metadata is None else metadata.get(TvMn.TIMEZONE)
+
+    def _get_group(self, group_name: str, vector_id: str, expected_type: type) -> h5py.Group | h5py.Dataset:
+        group = self._file.get(group_name)
+        if group is None or vector_id not in group:
+            msg = f"Found no ID '{vector_id}' in '{group_name}' group of {self._source}."
+            raise KeyError(msg)
+        item = group[vector_id]
+        if not isinstance(item, expected_type):
+            msg = f"Expected {expected_type} for ID '{vector_id}' in '{group_name}' group of {self._source}, but found {type(item)}."
+            raise TypeError(msg)
+        return item
+
+    def _get_dataset(self, group_name: str, vector_id: str) -> h5py.Dataset:
+        return self._get_group(group_name, vector_id, h5py.Dataset)
+
+    def _delete(self, group_name: str, vector_id: str) -> None:
+        group = self._file.get(group_name)
+        if group is not None and vector_id in group:
+            del group[vector_id]
+
+    def _write_dataset(self, group_name: str | None, name: str, values: NDArray) -> None:
+        """Write values to a dataset in place if they fit it, otherwise replace the dataset. A group name of None writes to the root of the file."""
+        group = self._file if group_name is None else self._file.require_group(group_name)
+        dataset = group.get(name)
+        if isinstance(dataset, h5py.Dataset) and dataset.dtype == values.dtype and dataset.shape[1:] == values.shape[1:]:
+            if dataset.shape == values.shape:
+                dataset[...] = values
+                return
+            if dataset.maxshape[0] is None:
+                dataset.resize(values.shape[0], axis=0)
+                dataset[...] = values
+                return
+        if dataset is not None:
+            del group[name]
+        self._create_dataset(group, name, values)
+
+    def _create_dataset(self, group: h5py.Group, name: str, values: NDArray) -> h5py.Dataset:
+        """Create a dataset which is chunked and resizable along the time dimension."""
+        options = {k: v for k, v in self._dataset_options.items() if k != "chunk_size"}
+        return group.create_dataset(
+            name,
+            data=values,
+            maxshape=(None, *values.shape[1:]),
+            chunks=(self._dataset_options["chunk_size"], *values.shape[1:]),
+            **options,
+        )
+
+    def _extend_index(self, dataset: h5py.Dataset, index: NDArray, timezone: tzinfo | None) -> None:
+        if dataset.dtype.kind == "S":
+            message = f"Cannot extend index '{dataset.name}' stored in the legacy string format. Set the whole index first."
+            raise ValueError(message)
+        self._extend_dataset(self._get_resizable_dataset(dataset), encode_index(index, timezone))
+
+    def _get_resizable_dataset(self, dataset: h5py.Dataset) -> h5py.Dataset:
+        """Get a dataset, first copying it chunk by chunk to a resizable dataset if it is stored contiguously."""
+        if dataset.maxshape[0] is None:
+            return dataset
+        if self._file.swmr_mode:
+            message = f"Cannot extend '{dataset.name}' in SWMR mode, since it is not resizable. Extend it before start_swmr to make it resizable."
+            raise ValueError(message)
+
+        group = dataset.parent
+        name = dataset.name.rsplit("/", 1)[-1]
+        tmp_name = f"{name}.resizable"
+        chunk_size = self._dataset_options["chunk_size"]
+        resizable = self._create_dataset(group, tmp_name, dataset[:0])
+        for start in range(0, dataset.shape[0], chunk_size):
+            self._extend_dataset(resizable, dataset[start : start + chunk_size])
+        del group[name]
+        group.move(tmp_name, name)
+        return group[name]
+
+    @staticmethod
+    def _extend_dataset(dataset: h5py.Dataset, values: NDArray) -> None:
+        if values.shape[1:] != dataset.shape[1:]:
+            message = f"Cannot extend dataset '{dataset.name}' with shape {dataset.shape} by values with shape {values.shape}."
+            raise ValueError(message)
+        size = dataset.shape[0]
+        dataset.resize(size + values.shape[0], axis=0)
+        dataset[size:] = values
+        if dataset.file.swmr_mode:  # make the values visible to readers
+            dataset.flush()
@@ -3,12 +3,14 @@
 from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 from framdata.database_names.TimeVectorMetadataNames import TimeVectorMetadataNames as TvMn
 from framdata.file_editors.NVEFileEditor import NVEFileEditor
+from framdata.loaders._file_handle_pool import file_handle_pool
 
 
 class NVEParquetTimeVectorEditor(NVEFileEditor):
@@ -30,6 +32,9 @@ class NVEParquetTimeVectorEditor(NVEFileEditor):
         """
         Save the edited dataframe and metadata to parquet file.
 
+        If the frequency is not set in the metadata and the points of the index column are evenly spaced, the start, frequency and number of points of
+        the index are written to the metadata, so loaders do not have to read the index column.
+
         Args:
             path (Path): Path to save tha file to. Must be defined to force user to explicitly overwrite the original file if they want.
 
@@ -38,10 +43,15 @@ class NVEParquetTimeVectorEditor(NVEFileEditor):
         path = Path(path)
         table = pa.Table.from_pandas(self._data)
 
+        metadata = self._metadata.copy()
+        if metadata.get(TvMn.FREQUENCY) is None:
+            metadata.update(self._get_regular_index_metadata())
+
         # ensure binary strings with defined encoding, since parquet encodes metadata anyway
-        schema_with_meta = table.schema.with_metadata({str(k).encode(TvMn.ENCODING): str(v).encode(TvMn.ENCODING) for k, v in self._metadata.items()})
+        schema_with_meta = table.schema.with_metadata({str(k).encode(TvMn.ENCODING): str(v).encode(TvMn.ENCODING) for k, v in metadata.items()})
         table = pa.Table.from_pandas(self._data, schema=schema_with_meta)
 
+        file_handle_pool.release(path)  # loaders in this process may hold the file open
         pq.write_table(table, path)
 
     def get_metadata(self):
@@ -99,6 +109,16 @@ class NVEParquetTimeVectorEditor(NVEFileEditor):
             raise KeyError(message)
         return self._data[TvMn.DATETIME_COL].copy()
 
+    def _get_regular_index_metadata(self) -> dict[str, datetime | timedelta | int]:
+        """Get start, frequency and number of points of the index column if its points are evenly spaced, otherwise an empty dict."""
+        if TvMn.DATETIME_COL not in self._data or len(self._data) < 2:  # noqa: PLR2004
+            return {}
+        datetimes = pd.DatetimeIndex(self._data[TvMn.DATETIME_COL])
+        steps = np.diff(datetimes.as_unit("ns").asi8)
+        if steps[0] <= 0 or np.any(steps != steps[0]):
+            return {}
+        return {TvMn.START: datetimes[0], TvMn.FREQUENCY: pd.Timedelta(int(steps[0]), unit="ns"), TvMn.NUM_POINTS: len(datetimes)}
+
     def _read_metadata(self) -> tuple[dict[str, bool | int | str | datetime | timedelta | tzinfo | None], set[str]]:
         if self._source is None:
             message = "Must set a source before reading file."
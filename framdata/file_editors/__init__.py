@@ -1,10 +1,14 @@
 # framdata/file_editors/__init__.py
 
+from framdata.file_editors.NVEH5CurveEditor import NVEH5CurveEditor
 from framdata.file_editors.NVEH5TimeVectorEditor import NVEH5TimeVectorEditor
+from framdata.file_editors.NVEH5TimeVectorInPlaceEditor import NVEH5TimeVectorInPlaceEditor
 from framdata.file_editors.NVEParquetTimeVectorEditor import NVEParquetTimeVectorEditor
 
 
 __all__ = [
+    "NVEH5CurveEditor",
     "NVEH5TimeVectorEditor",
+    "NVEH5TimeVectorInPlaceEditor",
     "NVEParquetTimeVectorEditor",
 ]
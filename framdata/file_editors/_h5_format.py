@@ -0,0 +1,106 @@
+"""Storage options and encodings of the H5 files written by the H5 editors."""
+
+from datetime import tzinfo
+
+import h5py
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from framdata.database_names.TimeVectorMetadataNames import TimeVectorMetadataNames as TvMn
+
+COMPRESSIONS = {"lzf", "gzip"}
+DEFAULT_CHUNK_SIZE = 8760  # a year of hourly values, so time window reads decompress few chunks
+
+
+def check_compression(compression: str | None, compression_level: int | None) -> None:
+    """
+    Check that a compression filter and level are supported by the editors.
+
+    Args:
+        compression (str | None): Compression filter, 'lzf' or 'gzip'.
+        compression_level (int | None): Level of gzip compression (0-9).
+
+    Raises:
+        ValueError: If the compression is not supported, or a level is given for another compression than gzip.
+
+    """
+    if compression is not None and compression not in COMPRESSIONS:
+        message = f"Unsupported compression '{compression}'. Supported compressions are {COMPRESSIONS}."
+        raise ValueError(message)
+    if compression_level is not None and compression != "gzip":
+        message = f"compression_level is only supported for gzip compression, got compression '{compression}'."
+        raise ValueError(message)
+
+
+def get_dataset_options(compression: str | None, compression_level: int | None, chunk_size: int | None, fletcher32: bool) -> dict:
+    """
+    Get the storage options of time vector and index datasets.
+
+    Args:
+        compression (str | None): Compression filter, 'lzf' or 'gzip'.
+        compression_level (int | None): Level of gzip compression (0-9).
+        chunk_size (int | None): Number of points in each chunk, or None to use a year of hourly values when the datasets are chunked.
+        fletcher32 (bool): Store a Fletcher32 checksum with each chunk.
+
+    Returns:
+        dict: Keyword arguments of create_dataset together with the chunk size, or an empty dict for contiguous datasets.
+
+    Raises:
+        ValueError: If the options are not valid.
+
+    """
+    check_compression(compression, compression_level)
+    if chunk_size is not None and chunk_size < 1:
+        message = f"chunk_size must be a positive integer, got {chunk_size}."
+        raise ValueError(message)
+
+    if compression is None and chunk_size is None and not fletcher32:
+        return {}
+    options = {"chunk_size": DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size, "fletcher32": fletcher32}
+    if compression is not None:
+        options.update(compression=compression, compression_opts=compression_level, shuffle=True)
+    return options
+
+
+def encode_index(index: NDArray, timezone: tzinfo | str | None) -> NDArray:
+    """
+    Encode an index as int64 nanoseconds since epoch.
+
+    The file only records the time zone in the TimeZone metadata of the vectors, so time zone aware points are stored as their local time in that time
+    zone.
+
+    Args:
+        index (NDArray): Points of the index, as datetimes, strings or byte strings.
+        timezone (tzinfo | str | None): TimeZone in the metadata of the vectors using the index.
+
+    Returns:
+        NDArray: Encoded index.
+
+    Raises:
+        ValueError: If the points are time zone aware and the metadata has no TimeZone.
+
+    """
+    if np.issubdtype(index.dtype, np.integer):
+        return index.astype(np.int64)
+    datetimes = pd.DatetimeIndex(np.char.decode(index, encoding=TvMn.ENCODING) if index.dtype.kind == "S" else index)
+    if datetimes.tz is not None:
+        if timezone is None:
+            message = f"Index with time zone {datetimes.tz} can only be stored for vectors with {TvMn.TIMEZONE} in their metadata."
+            raise ValueError(message)
+        datetimes = datetimes.tz_convert(timezone).tz_localize(None)
+    return datetimes.as_unit("ns").asi8
+
+
+def decode_index(index: NDArray) -> NDArray:
+    """Decode an index read from file, stored as int64 nanoseconds since epoch or as byte strings in the legacy format, to datetime64."""
+    if np.issubdtype(index.dtype, np.integer):
+        return index.astype(np.int64).view("datetime64[ns]")
+    datetimes = pd.DatetimeIndex(np.char.decode(index, encoding=TvMn.ENCODING))
+    return (datetimes if datetimes.tz is None else datetimes.tz_localize(None)).as_unit("ns").to_numpy()
+
+
+def write_meta_to_group(meta_group: h5py.Group, metadata: dict) -> None:
+    """Write each metadata field as an encoded string dataset in a group."""
+    for k, v in metadata.items():
+        meta_group.create_dataset(k, data=str(v).encode(TvMn.ENCODING))
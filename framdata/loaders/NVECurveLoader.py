@@ -0,0 +1,156 @@
+"""
+Loader for NVE curve data.
+
+This module provides the NVECurveLoader class, which extends FileLoader and CurveLoader to hold the curves of a file packed in padded 2D arrays, and to
+evaluate many of them in one batched call.
+"""
+
+from abc import abstractmethod
+from pathlib import Path
+
+import numpy as np
+from framcore.loaders import CurveLoader, FileLoader
+from numpy.typing import ArrayLike, NDArray
+
+
+class NVECurveLoader(FileLoader, CurveLoader):
+    """
+    Common functionality for NVE CurveLoaders.
+
+    Subclasses parse their file in _parse_file, which must set the row of each curve ID, the padded x and y axes and the number of points of each curve.
+    Row i of the axes holds the curve in row i, and only its first lengths[i] points belong to it. X values after them are padded with inf and y values
+    with nan.
+
+    """
+
+    def __init__(self, source: Path | str, relative_loc: Path | str | None = None) -> None:
+        """
+        Initialize NVECurveLoader with source and optional relative location.
+
+        Args:
+            source (Path | str): Path or string to the source file.
+            relative_loc (Path | str | None, optional): Relative location, defaults to None.
+
+        """
+        super().__init__(source, relative_loc)
+
+        self._rows: dict[str, int] = None
+        self._x_block: NDArray = None
+        self._y_block: NDArray = None
+        self._lengths: NDArray = None
+
+    @abstractmethod
+    def _parse_file(self) -> None:
+        """Read the file, setting the rows of the curves, their padded axes and their lengths."""
+
+    def get_axes(self, curve_ids: list[str] | None = None) -> tuple[NDArray, NDArray, NDArray]:
+        """
+        Get the axes of several curves packed in padded 2D arrays, with one row per curve.
+
+        Row i of the arrays holds curve_ids[i]. Only the first lengths[i] points of a row belong to the curve, x values after them are padded with inf and
+        y values with nan.
+
+        Args:
+            curve_ids (list[str] | None, optional): IDs of the curves. Defaults to None, which gets all curves in the file in the order of get_ids().
+
+        Returns:
+            tuple[NDArray, NDArray, NDArray]: Padded x axes, padded y axes and number of points of each curve.
+
+        """
+        rows = self._get_rows(curve_ids)
+        return self._x_block[rows], self._y_block[rows], self._lengths[rows]
+
+    def interpolate(self, curve_ids: list[str], x: ArrayLike) -> NDArray:
+        """
+        Interpolate many curves at many points in one batched call.
+
+        Each curve is linearly interpolated like np.interp, with the y values of the first and last points used outside the x axis of the curve. The x
+        axes of the curves must be increasing.
+
+        Args:
+            curve_ids (list[str]): IDs of the curves to interpolate.
+            x (ArrayLike): Points to interpolate at. Either a 1D array of points used for all curves, or a 2D array with one row of points per curve.
+
+        Raises:
+            ValueError: If x is not 1D, or 2D with one row per curve.
+
+        Returns:
+            NDArray: 2D array with the interpolated values of curve_ids[i] in row i.
+
+        """
+        rows = self._get_rows(curve_ids)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        if x.ndim > 2 or (x.ndim == 2 and x.shape[0] != rows.size):  # noqa: PLR2004
+            message = f"Points to interpolate at must be a 1D array or a 2D array with one row per curve, got shape {x.shape} for {rows.size} curves in {self}."
+            raise ValueError(message)
+        x = np.broadcast_to(x, (rows.size, x.shape[-1]))
+
+        x_axes, y_axes, lengths = self._x_block[rows], self._y_block[rows], self._lengths[rows]
+        # Number of curve points at or before each point, searched one curve at a time to keep memory use proportional to the output. The x padding is
+        # inf, so it never counts.
+        counts = np.empty(x.shape, dtype=np.intp)
+        for i in range(rows.size):
+            counts[i] = np.searchsorted(x_axes[i], x[i], side="right")
+        upper = np.clip(counts, 1, np.maximum(lengths - 1, 1)[:, np.newaxis])
+        upper = np.minimum(upper, x_axes.shape[1] - 1)
+        lower = np.maximum(upper - 1, 0)
+
+        x0, x1 = np.take_along_axis(x_axes, lower, axis=1), np.take_along_axis(x_axes, upper, axis=1)
+        y0, y1 = np.take_along_axis(y_axes, lower, axis=1), np.take_along_axis(y_axes, upper, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = np.clip((x - x0) / (x1 - x0), 0.0, 1.0)
+        weights = np.where(x1 == x0, 1.0, weights)  # repeated x values or a curve with one point
+        values = y0 + weights * (y1 - y0)
+        single = lengths == 1
+        values[single] = y_axes[single, :1]
+        return values
+
+    def get_x_axis(self, curve_id: str) -> NDArray:
+        """
+        Get values of x axis.
+
+        Args:
+            curve_id (str): Unique id of the curve in the Loader source.
+
+        Returns:
+            NDArray: Read-only numpy array with values of x axis.
+
+        """
+        row = self._get_rows([curve_id])[0]
+        return self._x_block[row, : self._lengths[row]]
+
+    def get_y_axis(self, curve_id: str) -> NDArray:
+        """
+        Get values of y axis.
+
+        Args:
+            curve_id (str): Unique id of the curve in the Loader source.
+
+        Returns:
+            NDArray: Read-only numpy array with values of y axis.
+
+        """
+        row = self._get_rows([curve_id])[0]
+        return self._y_block[row, : self._lengths[row]]
+
+    def _get_ids(self) -> list[str]:
+        if self._content_ids is None:
+            if self._rows is None:
+                self._parse_file()
+            self._content_ids = list(self._rows.keys())
+        return self._content_ids
+
+    def _get_rows(self, curve_ids: list[str] | None) -> NDArray:
+        if self._rows is None:
+            self._parse_file()
+        if curve_ids is None:
+            return np.arange(len(self._rows))
+        return np.fromiter((self._rows[curve_id] for curve_id in curve_ids), dtype=np.intp, count=len(curve_ids))
+
+    def clear_cache(self) -> None:
+        """Clear cached data."""
+        self._content_ids = None
+        self._rows = None
+        self._x_block = None
+        self._y_block = None
+        self._lengths = None
@@ -5,12 +5,17 @@ This module provides the NVETimeVectorLoader class, which extends FileLoader and
 to handle metadata and validation for time vector data from NVE parquet files.
 """
 
+from abc import abstractmethod
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import numpy as np
+import pandas as pd
 from framcore.loaders import FileLoader, TimeVectorLoader
+from framcore.timeindexes import FixedFrequencyTimeIndex, ListTimeIndex, TimeIndex
 from framcore.timevectors import ReferencePeriod
 from numpy.typing import NDArray
 
@@ -20,7 +25,17 @@ from framdata.database_names.TimeVectorMetadataNames import TimeVectorMetadataNa
 class NVETimeVectorLoader(FileLoader, TimeVectorLoader):
     """Common interface for metadata in NVE TimeVectorLoaders."""
 
-    def __init__(self, source: Path | str, require_whole_years: bool, relative_loc: Path | str | None = None) -> None:
+    _CHUNK_SIZE: ClassVar[int] = 2**16
+    _VALIDATION_ELEMENTS: ClassVar[int] = 2**22  # values held at once by validation, bounding its memory regardless of the number of vectors
+    VALIDATION_VERSION: ClassVar[int] = 1  # increase when validate_vectors changes, so cached validation results are not reused
+
+    def __init__(
+        self,
+        source: Path | str,
+        require_whole_years: bool,
+        relative_loc: Path | str | None = None,
+        time_window: tuple[datetime | None, datetime | None] | None = None,
+    ) -> None:
         """
         Initialize NVETimeVectorLoader with source and optional relative location.
 
@@ -28,6 +43,8 @@ class NVETimeVectorLoader(FileLoader, TimeVectorLoader):
             source (Path | str): Path or string to the source file.
             require_whole_years (bool): Flag for validating that the time vectors in the source contain data for complete years.
             relative_loc (Path | str | None, optional): Relative location, defaults to None.
+            time_window (tuple[datetime | None, datetime | None] | None, optional): Start and end of the period the Loader is limited to. Points
+                                                                                   outside it are not read or validated. Defaults to None.
 
         """
         super().__init__(source, relative_loc)
@@ -37,6 +54,12 @@ class NVETimeVectorLoader(FileLoader, TimeVectorLoader):
 
         self._require_whole_years = require_whole_years
 
+        if time_window is not None and len(time_window) != 2:  # noqa: PLR2004
+            message = f"{self}: time_window must be a tuple of start and end, got {time_window}."
+            raise ValueError(message)
+        self._time_window = time_window
+        self._positions: dict[str, slice] = {}
+
     def is_max_level(self, vector_id: str) -> bool | None:
         """
         Check if the time vector is classified as a max level vector.
@@ -105,10 +128,94 @@ class NVETimeVectorLoader(FileLoader, TimeVectorLoader):
             raise ValueError(message)
         return ref_period
 
+    def get_time_window(self) -> tuple[datetime | None, datetime | None] | None:
+        """
+        Get the start and end of the period the Loader is limited to.
+
+        Returns:
+            tuple[datetime | None, datetime | None] | None: The time window, or None if the Loader reads the whole time dimension of its source.
+
+        """
+        return self._time_window
+
+    def get_values_many(self, vector_ids: list[str] | None = None, start: datetime | None = None, end: datetime | None = None) -> dict[str, NDArray]:
+        """
+        Get numpy arrays with the values of several vectors in the Loader's source.
+
+        Loaders which are able to read many vectors in a single pass over their file override this method. The default implementation calls get_values
+        for each vector.
+
+        Args:
+            vector_ids (list[str] | None, optional): IDs of the vectors to read. Defaults to None, which reads all vectors in the source.
+            start (datetime | None, optional): Only read values describing the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only read values describing the period until this point in time. Defaults to None.
+
+        Returns:
+            dict[str, NDArray]: Vector IDs mapped to numpy arrays with values.
+
+        """
+        if vector_ids is None:
+            vector_ids = self.get_ids()
+        return {vector_id: self.get_values(vector_id, start=start, end=end) for vector_id in vector_ids}
+
+    def load_all(self) -> dict[str, NDArray]:
+        """
+        Read and cache the values of all vectors in the Loader's source.
+
+        Returns:
+            dict[str, NDArray]: Vector IDs mapped to numpy arrays with values.
+
+        """
+        return self.get_values_many(self.get_ids())
+
+    def iter_chunks(self, vector_ids: str | list[str] | None = None, chunk_size: int | None = None) -> Iterator[dict[str, NDArray]]:
+        """
+        Iterate over the values of vectors in chunks along the time dimension.
+
+        Loaders which are able to read parts of their source override this method to only read one chunk at a time, so vectors larger than the available
+        memory can be processed. The default implementation reads the vectors with get_values_many and yields views of them.
+
+        Args:
+            vector_ids (str | list[str] | None, optional): ID or IDs of the vectors to iterate over. Defaults to None, which iterates over all vectors in
+                                                          the source.
+            chunk_size (int | None, optional): Maximum number of values of each vector in a chunk. Defaults to None, which uses the chunk size of the
+                                               Loader class.
+
+        Yields:
+            dict[str, NDArray]: Vector IDs mapped to the values of the chunk. Vectors which have no values left are left out.
+
+        """
+        vector_ids, chunk_size = self._check_chunk_args(vector_ids, chunk_size)
+        values = self.get_values_many(vector_ids)
+        for slices in self._iter_slices({vector_id: values[vector_id].size for vector_id in vector_ids}, chunk_size):
+            yield {vector_id: values[vector_id][chunk] for vector_id, chunk in slices.items()}
+
+    def _check_chunk_args(self, vector_ids: str | list[str] | None, chunk_size: int | None) -> tuple[list[str], int]:
+        if vector_ids is None:
+            vector_ids = self.get_ids()
+        elif isinstance(vector_ids, str):
+            vector_ids = [vector_ids]
+        if chunk_size is None:
+            chunk_size = self._CHUNK_SIZE
+        if chunk_size < 1:
+            message = f"{self}: chunk_size must be a positive integer, got {chunk_size}."
+            raise ValueError(message)
+        return list(dict.fromkeys(vector_ids)), chunk_size
+
+    @staticmethod
+    def _iter_slices(sizes: dict[str, int], chunk_size: int) -> Iterator[dict[str, slice]]:
+        """Split vectors of the given sizes into consecutive slices of at most chunk_size values."""
+        for lower in range(0, max(sizes.values(), default=0), chunk_size):
+            yield {vector_id: slice(lower, min(lower + chunk_size, size)) for vector_id, size in sizes.items() if lower < size}
+
     def validate_vectors(self) -> None:
         """
         Validate data in all vectors contained in the Loader.
 
+        The values are streamed through iter_chunks for groups of vectors, sized so a chunk of a group holds a bounded number of values. The memory used
+        by validation therefore does not grow with the length or the number of vectors for Loaders which read their source in parts. Vectors of equal
+        length in a chunk are stacked into a 2D block and counted in one pass, and the checks of an index shared by several vectors are only run once.
+
         Conditions validated:
             - If vector contains negative values.
             (- If vector is a zero one profile and contains values outside the unit interval.) * not in use currently
@@ -117,9 +224,12 @@ class NVETimeVectorLoader(FileLoader, TimeVectorLoader):
             ValueError: When conditions are violated.
 
         """
+        vector_ids = self.get_ids()
+        summaries = self._summarize_values(vector_ids)
+        index_checks: dict[int, tuple[TimeIndex, int, bool]] = {}
         errors = set()
-        for vector_id in self.get_ids():
-            errors |= self._validate_vector(vector_id)
+        for vector_id in vector_ids:
+            errors |= self._validate_vector(vector_id, summaries[vector_id], index_checks)
 
         if errors:
             message = f"Found errors in {self}:"
@@ -128,6 +238,143 @@ class NVETimeVectorLoader(FileLoader, TimeVectorLoader):
 
             raise ValueError(message)
 
+    def _summarize_values(self, vector_ids: list[str]) -> dict[str, Counter]:
+        """Count the number of values, negative values and nan values of vectors while streaming groups of them chunk by chunk."""
+        summaries = {vector_id: Counter() for vector_id in vector_ids}
+        chunk_size = min(self._CHUNK_SIZE, self._VALIDATION_ELEMENTS)
+        group_size = max(1, self._VALIDATION_ELEMENTS // chunk_size)
+        for lower in range(0, len(vector_ids), group_size):
+            for chunk in self.iter_chunks(vector_ids[lower : lower + group_size], chunk_size):
+                for block_ids, block in self._stack_chunk(chunk):
+                    negatives = np.count_nonzero(block < 0, axis=1)
+                    nans = np.count_nonzero(np.isnan(block), axis=1)
+                    for vector_id, num_negatives, num_nans in zip(block_ids, negatives.tolist(), nans.tolist(), strict=True):
+                        summary = summaries[vector_id]
+                        summary["size"] += block.shape[1]
+                        summary["negatives"] += num_negatives
+                        summary["nans"] += num_nans
+        return summaries
+
+    @staticmethod
+    def _stack_chunk(chunk: dict[str, NDArray]) -> Iterator[tuple[list[str], NDArray]]:
+        """Group the vectors of a chunk by length, and stack the vectors of each group as the rows of a 2D block."""
+        groups: dict[int, list[str]] = defaultdict(list)
+        for vector_id, values in chunk.items():
+            groups[values.size].append(vector_id)
+        for block_ids in groups.values():
+            if len(block_ids) == 1:
+                yield block_ids, chunk[block_ids[0]].reshape(1, -1)
+            else:
+                yield block_ids, np.stack([chunk[vector_id].ravel() for vector_id in block_ids])
+
+    def _get_positions(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> slice:
+        """
+        Get the positions along the time dimension of the source which are read for a vector.
+
+        The positions of the Loader's time window are cached per vector. A vector whose index does not overlap the time window at all is not limited by
+        it, since its index then describes another period (e.g. the weather years of a profile) than the one the window is defined for. Start and end
+        given in a call further limit the positions.
+
+        Args:
+            vector_id (str): ID of the vector.
+            start (datetime | None, optional): Start of the period requested in the call. Defaults to None.
+            end (datetime | None, optional): End of the period requested in the call. Defaults to None.
+
+        Returns:
+            slice: Positions in the vector's full index.
+
+        """
+        if self._time_window is None and start is None and end is None:
+            return slice(None)
+
+        if vector_id not in self._positions:
+            positions = slice(None)
+            if self._time_window is not None:
+                windowed = self._index_positions(vector_id, *self._time_window)
+                if windowed.start < windowed.stop:
+                    positions = windowed
+            self._positions[vector_id] = positions
+        positions = self._positions[vector_id]
+
+        if start is None and end is None:
+            return positions
+        requested = self._index_positions(vector_id, start, end)
+        if positions == slice(None):
+            return requested
+        lower = max(positions.start, requested.start)
+        return slice(lower, max(lower, min(positions.stop, requested.stop)))
+
+    @abstractmethod
+    def _index_positions(self, vector_id: str, start: datetime | None, end: datetime | None) -> slice:
+        """Get the positions in the full index of a vector which are needed to describe the period between start and end."""
+        pass
+
+    @staticmethod
+    def _align_timestamp(value: datetime | None, tz: tzinfo | None) -> pd.Timestamp | None:
+        """Convert a point in time to a timestamp which can be compared with an index in the given time zone."""
+        if value is None:
+            return None
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is None and tz is not None:
+            return timestamp.tz_localize(tz)
+        if timestamp.tzinfo is not None and tz is None:
+            return timestamp.tz_localize(None)
+        return timestamp
+
+    @staticmethod
+    def _list_positions(datetimes: pd.DatetimeIndex, start: datetime | None, end: datetime | None) -> slice:
+        """
+        Get the positions of the points in a list index which describe the period between start and end.
+
+        Every point is valid until the next one, so the last point at or before start and the first point at or after end are included.
+
+        """
+        start = NVETimeVectorLoader._align_timestamp(start, datetimes.tz)
+        end = NVETimeVectorLoader._align_timestamp(end, datetimes.tz)
+        if datetimes.size == 0 or (start is not None and start > datetimes[-1]) or (end is not None and end <= datetimes[0]):
+            return slice(0, 0)
+        lower = 0 if start is None else max(int(datetimes.searchsorted(start, side="right")) - 1, 0)
+        upper = datetimes.size if end is None else min(int(datetimes.searchsorted(end, side="left")) + 1, datetimes.size)
+        return slice(lower, upper)
+
+    @staticmethod
+    def _fixed_frequency_positions(first: datetime, frequency: timedelta, num_points: int, start: datetime | None, end: datetime | None) -> slice:
+        """Get the positions of the periods in a fixed frequency index which overlap the period between start and end."""
+        first = pd.Timestamp(first)
+        frequency = pd.Timedelta(frequency)
+        start = NVETimeVectorLoader._align_timestamp(start, first.tz)
+        end = NVETimeVectorLoader._align_timestamp(end, first.tz)
+        lower = 0 if start is None else min(max((start - first) // frequency, 0), num_points)
+        upper = num_points if end is None else min(max(-((first - end) // frequency), 0), num_points)
+        return slice(lower, max(lower, upper))
+
+    def _create_list_index(self, datetime_list: list[datetime], meta: dict[str, Any]) -> ListTimeIndex:
+        return ListTimeIndex(
+            datetime_list=datetime_list,
+            is_52_week_years=meta[TvMn.IS_52_WEEK_YEARS],
+            extrapolate_first_point=meta[TvMn.EXTRAPOLATE_FISRT_POINT],
+            extrapolate_last_point=meta[TvMn.EXTRAPOLATE_LAST_POINT],
+        )
+
+    def _create_fixed_frequency_index(
+        self,
+        first: datetime,
+        frequency: timedelta,
+        num_points: int,
+        positions: slice,
+        meta: dict[str, Any],
+    ) -> FixedFrequencyTimeIndex:
+        """Create a fixed frequency index of the periods at the given positions of the full index starting at first."""
+        lower, upper, __ = positions.indices(num_points)
+        return FixedFrequencyTimeIndex(
+            first if lower == 0 else first + lower * frequency,
+            frequency,
+            upper - lower,
+            is_52_week_years=meta[TvMn.IS_52_WEEK_YEARS],
+            extrapolate_first_point=meta[TvMn.EXTRAPOLATE_FISRT_POINT],
+            extrapolate_last_point=meta[TvMn.EXTRAPOLATE_LAST_POINT],
+        )
+
     def _process_meta(self, raw_meta: dict[str | bytes, str | bytes | int | bool | None]) -> dict[str, Any]:
         processed_meta, missing_keys = TvMn.cast_meta(raw_meta)
 
@@ -140,26 +387,33 @@ class NVETimeVectorLoader(FileLoader, TimeVectorLoader):
 
         return processed_meta
 
-    def _validate_vector(self, vector_id: str) -> set[str]:
+    def _validate_vector(self, vector_id: str, summary: Counter | None = None, index_checks: dict[int, tuple[TimeIndex, int, bool]] | None = None) -> set[str]:
+        if summary is None:
+            summary = self._summarize_values([vector_id])[vector_id]
         index = self.get_index(vector_id)
-        values = self.get_values(vector_id)
+
+        # Loaders return the same index object for vectors sharing an index, so its properties are only computed once. The index is kept in the
+        # tuple so its id is not reused.
+        if index_checks is None:
+            index_checks = {}
+        if id(index) not in index_checks:
+            index_checks[id(index)] = (index, index.get_num_periods(), not self._require_whole_years or index.is_whole_years())
+        __, num_periods, is_valid_years = index_checks[id(index)]
 
         errors = set()
 
         # validate index length
-        if index.get_num_periods() not in range(values.size - 1, values.size + 1):  # Since ListTimeIndex objects' num_periods can vary.
-            errors.add(f"{vector_id} - {type(index)} with {index.get_num_periods()} periods and vector with size ({values.size}) do not match.")
+        if num_periods not in range(summary["size"] - 1, summary["size"] + 1):  # Since ListTimeIndex objects' num_periods can vary.
+            errors.add(f"{vector_id} - {type(index)} with {num_periods} periods and vector with size ({summary['size']}) do not match.")
 
         # validate negative and missing values
-        negatives = values < 0
-        if np.any(negatives):
-            errors.add(f"{vector_id} contains {negatives.sum()} negative values.")
-        nans = np.isnan(values)
-        if np.any(nans):
-            errors.add(f"{vector_id} contains {nans.sum()} nan values.")
+        if summary["negatives"]:
+            errors.add(f"{vector_id} contains {summary['negatives']} negative values.")
+        if summary["nans"]:
+            errors.add(f"{vector_id} contains {summary['nans']} nan values.")
 
         # validate that index is whole years if required
-        if self._require_whole_years and not index.is_whole_years():
+        if not is_valid_years:
             errors.add(f"{vector_id} is required to contain whole years but its index ({index}) is not classified as is_whole_years.")
 
         # outside_unit_interval = ((0 <= values) & (values <= 1))
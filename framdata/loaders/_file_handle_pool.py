@@ -0,0 +1,225 @@
+"""
+Process-wide pool of open file handles shared by the NVE loaders.
+
+Loaders ask the pool for handles instead of opening their files themselves, so each file is opened once per process no matter how many loaders and
+calls read from it. Items derived from a file (e.g. its metadata and vector IDs) are cached alongside the handles, shared by the loaders of the file. An
+item is owned by the loaders which requested it, and is dropped when all of them have cleared their caches or been garbage collected. The number of files
+with derived items is bounded like the number of handles.
+
+Entries are keyed by the resolved path of the file and validated against its modification time and size on every access, so a file which is rewritten
+is reopened, except HDF5 files opened for single-writer/multiple-reader (SWMR) access, which are expected to change while they are read. The number of
+open handles is bounded, the least recently used handle is dropped from the pool when the bound is exceeded. Handles are not shared with child processes,
+the pool is emptied in the child after a fork.
+
+Code writing to a file which may be read by a loader in the same process should call release on the path first.
+
+"""
+
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+import h5py
+import pyarrow.parquet as pq
+
+
+class FileHandlePool:
+    """Pool of open Parquet and HDF5 file handles and items derived from the files, bounded by a least recently used policy."""
+
+    def __init__(self, max_open_files: int = 64, max_derived_files: int = 64) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_open_files (int, optional): Maximum number of handles kept in the pool. Defaults to 64.
+            max_derived_files (int, optional): Maximum number of files with derived items kept in the pool. The items of the least recently used file
+                                               are dropped when the bound is exceeded. Defaults to 64.
+
+        """
+        self._max_open_files = max_open_files
+        self._max_derived_files = max_derived_files
+        self._handles: OrderedDict[tuple, tuple[tuple[int, int], Any]] = OrderedDict()
+        self._derived: OrderedDict[str, tuple[tuple[int, int], dict[Hashable, tuple[Any, dict[int, weakref.ref] | None]]]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    def get_parquet_file(self, path: Path | str, memory_map: bool = False) -> pq.ParquetFile:
+        """
+        Get an open ParquetFile for a path.
+
+        Args:
+            path (Path | str): Path to the parquet file.
+            memory_map (bool, optional): Open the file through a memory map. Defaults to False.
+
+        Returns:
+            pq.ParquetFile: Open handle shared with other readers of the file.
+
+        """
+        return self._get_handle(path, ("parquet", memory_map), lambda p: pq.ParquetFile(p, memory_map=memory_map))
+
+    def get_h5_file(self, path: Path | str, swmr: bool = False) -> h5py.File:
+        """
+        Get a HDF5 file opened in read mode for a path.
+
+        Args:
+            path (Path | str): Path to the HDF5 file.
+            swmr (bool, optional): Open the file for reading while a SWMR writer appends to it. The handle is then kept when the file changes, and
+                                   readers call refresh on its datasets to see appended data. Defaults to False.
+
+        Returns:
+            h5py.File: Open handle shared with other readers of the file.
+
+        """
+        return self._get_handle(path, ("h5", swmr), lambda p: h5py.File(p, mode="r", swmr=swmr), validate=not swmr)
+
+    def get_derived(self, path: Path | str, key: Hashable, factory: Callable[[], Any], owner: object | None = None) -> Any:  # noqa: ANN401
+        """
+        Get an item derived from the contents of a file, creating it with factory if it is not cached for the current version of the file.
+
+        Args:
+            path (Path | str): Path to the file the item is derived from.
+            key (Hashable): Key identifying the item among the items derived from the file.
+            factory (Callable[[], Any]): Function creating the item.
+            owner (object | None, optional): Object using the item, typically a loader, which releases it with release_derived. The item is dropped when
+                                             it has no owners left. Defaults to None, which keeps the item until the file changes, is released or
+                                             its items are dropped by the bound on the number of files.
+
+        Returns:
+            Any: The cached or created item. Shared with other callers, so it must not be mutated.
+
+        """
+        path = self._resolve(path)
+        with self._lock:
+            self._check_process()
+            fingerprint = self._fingerprint(path)
+            cached = self._derived.get(path)
+            entry = None if cached is None or cached[0] != fingerprint else cached[1].get(key)
+            if entry is None or not self._is_owned(entry):
+                self._drop_unowned()
+                cached = self._derived.get(path)
+                if cached is None or cached[0] != fingerprint:
+                    cached = (fingerprint, {})
+                    self._derived[path] = cached
+                entry = (factory(), None if owner is None else {})
+                cached[1][key] = entry
+            self._derived.move_to_end(path)
+            while len(self._derived) > self._max_derived_files:
+                self._derived.popitem(last=False)
+            if owner is not None and entry[1] is not None:
+                entry[1][id(owner)] = weakref.ref(owner)  # by identity, loaders may not be hashable
+            return entry[0]
+
+    def release_derived(self, path: Path | str, owner: object) -> None:
+        """
+        Release the items derived from a file which are owned by an object, dropping the items without other owners.
+
+        Args:
+            path (Path | str): Path to the file.
+            owner (object): Owner of the items, typically a loader clearing its cache.
+
+        """
+        path = self._resolve(path)
+        with self._lock:
+            self._check_process()
+            cached = self._derived.get(path)
+            if cached is None:
+                return
+            items = cached[1]
+            for key, entry in list(items.items()):
+                owners = entry[1]
+                ref = None if owners is None else owners.get(id(owner))
+                if ref is not None and ref() is owner:
+                    del owners[id(owner)]
+                    if not self._is_owned(entry):
+                        del items[key]
+            if not items:
+                del self._derived[path]
+
+    def release(self, path: Path | str) -> None:
+        """
+        Close all handles to a file and forget the items derived from it.
+
+        Args:
+            path (Path | str): Path to the file.
+
+        """
+        path = self._resolve(path)
+        with self._lock:
+            for key in [key for key in self._handles if key[0] == path]:
+                self._close(self._handles.pop(key)[1])
+            self._derived.pop(path, None)
+
+    def clear(self) -> None:
+        """Close all handles and forget all derived items."""
+        with self._lock:
+            while self._handles:
+                self._close(self._handles.popitem()[1][1])
+            self._derived.clear()
+
+    def _get_handle(self, path: Path | str, options: tuple, opener: Callable[[str], Any], validate: bool = True) -> Any:  # noqa: ANN401
+        path = self._resolve(path)
+        key = (path, *options)
+        with self._lock:
+            self._check_process()
+            fingerprint = self._fingerprint(path)
+            entry = self._handles.get(key)
+            if entry is not None and (entry[0] == fingerprint or not validate):
+                self._handles.move_to_end(key)
+                return entry[1]
+            if entry is not None:  # file has been rewritten since it was opened
+                self._close(self._handles.pop(key)[1])
+
+            handle = opener(path)
+            self._handles[key] = (fingerprint, handle)
+            while len(self._handles) > self._max_open_files:
+                # Not closed explicitly, since a reader may still use it. It is closed when the last reference to it is dropped.
+                self._handles.popitem(last=False)
+            return handle
+
+    @staticmethod
+    def _is_owned(entry: tuple[Any, dict[int, weakref.ref] | None]) -> bool:
+        """Check whether a derived item is kept without owners, or has an owner which is not garbage collected."""
+        owners = entry[1]
+        return owners is None or any(ref() is not None for ref in owners.values())
+
+    def _drop_unowned(self) -> None:
+        """Drop derived items whose owners have all released them or been garbage collected."""
+        for path, (__, items) in list(self._derived.items()):
+            for key in [key for key, entry in items.items() if not self._is_owned(entry)]:
+                del items[key]
+            if not items:
+                del self._derived[path]
+
+    def _check_process(self) -> None:
+        if os.getpid() != self._pid:
+            self._reset_after_fork()
+
+    def _reset_after_fork(self) -> None:
+        # Handles inherited from the parent process are not safe to use, drop them without closing the parent's files.
+        self._handles = OrderedDict()
+        self._derived = OrderedDict()
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    @staticmethod
+    def _resolve(path: Path | str) -> str:
+        return str(Path(path).resolve())
+
+    @staticmethod
+    def _fingerprint(path: str) -> tuple[int, int]:
+        stat = os.stat(path)  # noqa: PTH116
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _close(handle: h5py.File | pq.ParquetFile) -> None:
+        handle.close()
+
+
+file_handle_pool = FileHandlePool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=file_handle_pool._reset_after_fork)  # noqa: SLF001
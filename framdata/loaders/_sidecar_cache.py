@@ -0,0 +1,165 @@
+"""
+Binary sidecar cache of time vector files which are slow to parse, like Excel and YAML files.
+
+After a file is parsed, its arrays are stored as .npy files and the rest of the parsed content is pickled, in an entry of a cache directory. Later
+loads of the file memory-map the arrays and skip the parsing. An entry is used as long as the file has the same path, size and modification time as when
+the entry was written. Files are only hashed when their modification time is too recent to tell a later write apart, and the entry is then only used
+while the content hash is the same.
+
+Contract of the cache directory, which also holds the validation results and snapshots of the populators in subdirectories:
+- It must only be writable by trusted users, since its content is unpickled.
+- Writing is best effort. Content which can not be written is skipped, and the next run parses, validates or populates again.
+
+"""
+
+import hashlib
+import os
+import pickle
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class SidecarCache:
+    """Cache of parsed file contents in a directory, with arrays stored in a memory-mappable format."""
+
+    _FORMAT_VERSION = 1
+    _HEADER_NAME = "header.pickle"
+    _HASH_BLOCK_SIZE = 2**20
+    _RACY_NS = 2 * 10**9  # writes within this time of the modification time may not change it on file systems with coarse timestamps
+
+    def __init__(self, cache_dir: Path | str) -> None:
+        """
+        Initialize a cache stored in a directory, which is created when the first entry is written.
+
+        Args:
+            cache_dir (Path | str): Directory of the cache.
+
+        """
+        self._cache_dir = Path(cache_dir)
+
+    def load(self, source: Path | str, kind: str) -> tuple[dict[str, NDArray], Any] | None:
+        """
+        Load the parsed content of a file from the cache.
+
+        Args:
+            source (Path | str): Path to the parsed file.
+            kind (str): Kind of parsed content, e.g. the name of the loader class parsing the file.
+
+        Returns:
+            tuple[dict[str, NDArray], Any] | None: Read-only memory maps of the arrays, and the rest of the content, or None if the cache has no valid
+                                                   entry for the current version of the file.
+
+        """
+        source = Path(source).resolve()
+        entry = self._get_entry(source, kind)
+        try:
+            with (entry / self._HEADER_NAME).open("rb") as f:
+                header = pickle.load(f)  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if header.get("format_version") != self._FORMAT_VERSION or header.get("path") != str(source):
+            return None
+
+        stat = source.stat()
+        if header["size"] != stat.st_size or header["mtime_ns"] != stat.st_mtime_ns:
+            return None
+        if header["sha256"] is not None:  # the entry was written while the modification time was too recent to be trusted
+            if header["sha256"] != self._hash(source):
+                return None
+            header["sha256"] = self._get_racy_hash(source, stat)
+            if header["sha256"] is None:  # the modification time can be trusted now, avoid hashing the file on the next load
+                try:
+                    self._write_header(entry, header)
+                except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                    pass
+
+        try:
+            arrays = {name: self._load_array(entry / file_name) for name, file_name in header["arrays"].items()}
+        except (OSError, ValueError):
+            return None
+        return arrays, header["content"]
+
+    @staticmethod
+    def _load_array(path: Path) -> NDArray:
+        try:
+            return np.load(path, mmap_mode="r", allow_pickle=False)
+        except ValueError:  # empty arrays can not be memory-mapped
+            array = np.load(path, allow_pickle=False)
+            array.flags.writeable = False
+            return array
+
+    def save(self, source: Path | str, kind: str, arrays: dict[str, NDArray], content: object) -> bool:
+        """
+        Store the parsed content of a file in the cache, replacing an existing entry.
+
+        Args:
+            source (Path | str): Path to the parsed file.
+            kind (str): Kind of parsed content, e.g. the name of the loader class parsing the file.
+            arrays (dict[str, NDArray]): Arrays of the content, stored so they can be memory-mapped. Must not contain Python objects.
+            content (object): The rest of the content, stored with pickle.
+
+        Returns:
+            bool: Whether the entry was written.
+
+        """
+        source = Path(source).resolve()
+        entry = self._get_entry(source, kind)
+        stat = source.stat()
+        header = {
+            "format_version": self._FORMAT_VERSION,
+            "path": str(source),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": self._get_racy_hash(source, stat),
+            "content": content,
+        }
+        token = uuid.uuid4().hex  # new file names, so readers of the previous entry keep valid memory maps
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            header["arrays"] = {}
+            for name, array in arrays.items():
+                file_name = f"{name}-{token}.npy"
+                np.save(entry / file_name, np.ascontiguousarray(array), allow_pickle=False)
+                header["arrays"][name] = file_name
+            self._write_header(entry, header)
+        except (OSError, ValueError, pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        for path in entry.glob("*.npy"):
+            if path.name not in header["arrays"].values():
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:  # still mapped by a reader on platforms which do not allow removing mapped files
+                    pass
+        return True
+
+    def _get_entry(self, source: Path, kind: str) -> Path:
+        return self._cache_dir / hashlib.sha256(f"{kind}:{source}".encode()).hexdigest()
+
+    def _write_header(self, entry: Path, header: dict) -> None:
+        tmp_path = entry / f"{self._HEADER_NAME}.{uuid.uuid4().hex}.tmp"
+        try:
+            with tmp_path.open("wb") as f:
+                pickle.dump(header, f)
+            os.replace(tmp_path, entry / self._HEADER_NAME)  # noqa: PTH105
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _get_racy_hash(self, source: Path, stat: os.stat_result) -> str | None:
+        """Hash a file if its modification time is so recent that a write may follow without changing it, otherwise return None."""
+        if time.time_ns() - stat.st_mtime_ns < self._RACY_NS:
+            return self._hash(source)
+        return None
+
+    def _hash(self, source: Path) -> str:
+        sha256 = hashlib.sha256()
+        with source.open("rb") as f:
+            while block := f.read(self._HASH_BLOCK_SIZE):
+                sha256.update(block)
+        return sha256.hexdigest()
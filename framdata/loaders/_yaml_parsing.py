@@ -0,0 +1,26 @@
+"""Parsing of yaml files, using the C implementation of the safe loader when PyYAML is built with libyaml."""
+
+from pathlib import Path
+from typing import Any
+
+import yaml  # type: ignore
+
+from framdata.database_names.YamlNames import YamlNames
+
+# Constructs the same Python objects as SafeLoader, but scans and parses in C
+SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(path: Path) -> Any:  # noqa: ANN401
+    """
+    Parse a yaml file with the fastest available safe loader.
+
+    Args:
+        path (Path): Path to the yaml file.
+
+    Returns:
+        Any: The parsed content of the file.
+
+    """
+    with path.open(encoding=YamlNames.encoding) as f:
+        return yaml.load(f, Loader=SAFE_LOADER)  # noqa: S506
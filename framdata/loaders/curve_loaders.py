@@ -1,17 +1,21 @@
-"""Contains class for loading Curve data from NVE yaml files."""
+"""Contains classes for loading Curve data from NVE yaml and HDF5 files."""
 
+import json
 from pathlib import Path
 from typing import ClassVar
 
+import h5py
 import numpy as np
-import yaml  # type: ignore
-from framcore.loaders import CurveLoader, FileLoader
 from numpy.typing import NDArray
 
+from framdata.database_names.H5Names import H5Names
 from framdata.database_names.YamlNames import YamlNames
+from framdata.loaders._file_handle_pool import file_handle_pool
+from framdata.loaders._yaml_parsing import load_yaml
+from framdata.loaders.NVECurveLoader import NVECurveLoader
 
 
-class NVEYamlCurveLoader(FileLoader, CurveLoader):
+class NVEYamlCurveLoader(NVECurveLoader):
     """Handle reading of Curve data from a yaml File of NVE specific format."""
 
     _SUPPORTED_SUFFIXES: ClassVar[list[str]] = [".yaml", ".yml"]
@@ -27,42 +31,127 @@ class NVEYamlCurveLoader(FileLoader, CurveLoader):
         """
         super().__init__(source, relative_loc)
 
-        self._data = None
+        self._metadata: dict = None
         self._x_meta: str = None
         self._y_meta: str = None
 
-        self._x_label: str = None
-        self._y_label: str = None
-
-    def get_x_axis(self, curve_id: str) -> NDArray:
+    def get_x_unit(self, curve_id: str) -> str:
         """
-        Get values of x axis.
+        Get the unit of the x axis for the specified curve.
 
         Args:
             curve_id (str): Unique id of the curve in the Loader source.
 
         Returns:
-            NDArray: Numpy array with values of x axis.
+            str: Unit of the x axis.
 
         """
-        if self._data is None:
+        if self._rows is None:
             self._parse_file()
-        return np.asarray(self._data[curve_id][self._x_label])
+        return self._x_meta[YamlNames.unit]
 
-    def get_y_axis(self, curve_id: str) -> NDArray:
+    def get_y_unit(self, curve_id: str) -> str:
         """
-        Get values of y axis.
+        Get the unit of the y axis for the specified curve.
 
         Args:
             curve_id (str): Unique id of the curve in the Loader source.
 
         Returns:
-            NDArray: Numpy array with values of y axis.
+            str: Unit of the y axis.
+
+        """
+        if self._rows is None:
+            self._parse_file()
+        return self._y_meta[YamlNames.unit]
+
+    def get_metadata(self, content_id: str) -> dict:
+        """
+        Retrieve metadata for the specified content ID.
+
+        Args:
+            content_id (str): Unique identifier for the content.
+
+        Returns:
+            dict: Metadata associated with the content.
 
         """
-        if self._data is None:
+        if self._rows is None:
             self._parse_file()
-        return np.asarray(self._data[curve_id][self._y_label])
+        return self._metadata
+
+    def _parse_file(self) -> None:
+        """Parse the file, packing the axes of all curves into padded read-only 2D arrays once."""
+        d = load_yaml(self.get_source())
+        self._metadata = d.pop(YamlNames.metadata_field)
+        self._x_meta = self._metadata[YamlNames.x_field]
+        self._y_meta = self._metadata[YamlNames.y_field]
+
+        x_label = self._x_meta[YamlNames.attribute]
+        y_label = self._y_meta[YamlNames.attribute]
+        for curve_id, curve in d.items():
+            if len(curve[x_label]) != len(curve[y_label]):
+                message = f"Curve {curve_id} in {self} has {len(curve[x_label])} x values and {len(curve[y_label])} y values."
+                raise ValueError(message)
+
+        self._rows = {curve_id: row for row, curve_id in enumerate(d)}
+        self._lengths = np.fromiter((len(curve[x_label]) for curve in d.values()), dtype=np.int64, count=len(d))
+        self._x_block = self._pack([curve[x_label] for curve in d.values()], np.inf)
+        self._y_block = self._pack([curve[y_label] for curve in d.values()], np.nan)
+        self._lengths.flags.writeable = False
+
+    def _pack(self, axes: list[list], padding: float) -> NDArray:
+        """Pack axes of varying length into the rows of a 2D float array, padding the end of the shorter rows."""
+        block = np.full((len(axes), max(2, self._lengths.max(initial=0))), padding)
+        for row, axis in enumerate(axes):
+            try:
+                block[row, : len(axis)] = axis
+            except (TypeError, ValueError) as e:
+                message = f"{self} got non numeric values in curve {list(self._rows)[row]}."
+                raise ValueError(message) from e
+        block.flags.writeable = False  # shared by all callers
+        return block
+
+    def clear_cache(self) -> None:
+        """Clear cached data."""
+        super().clear_cache()
+        self._metadata = None
+        self._x_meta = None
+        self._y_meta = None
+
+
+class NVEH5CurveLoader(NVECurveLoader):
+    """
+    Handle reading of Curve data from a HDF5 file of NVE specific format.
+
+    Meant for large sets of curves. The file stores the axes of all curves in padded 2D datasets, which are read with one read per dataset and shared by
+    all loaders of the file in the process.
+    Supported format:
+        - curve_ids: IDs of the curves, one per row of the other datasets.
+        - x_axes and y_axes: Axes of the curves in the rows of 2D datasets, padded with inf and nan respectively after the points of each curve.
+        - curve_lengths: Number of points of each curve.
+        - x_units and y_units: Units of the axes of each curve.
+        - curve_metadata: Metadata of each curve as JSON objects, and a common_curve_metadata attribute with metadata shared by all curves.
+
+    """
+
+    _SUPPORTED_SUFFIXES: ClassVar[list[str]] = [".h5", ".hdf5"]
+
+    def __init__(self, source: Path | str, relative_loc: Path | str | None = None) -> None:
+        """
+        Handle reading of curves from a single HDF5 file.
+
+        Args:
+            source (Path | str): Absolute Path to database or HDF5 file path.
+            relative_loc (Path | str | None, optional): Path to HDF5 file relative to source. Defaults to None.
+
+        """
+        super().__init__(source, relative_loc)
+
+        self._x_units: list[str] = None
+        self._y_units: list[str] = None
+        self._metadata: list[str] = None
+        self._common_metadata: dict = None
 
     def get_x_unit(self, curve_id: str) -> str:
         """
@@ -75,9 +164,8 @@ class NVEYamlCurveLoader(FileLoader, CurveLoader):
             str: Unit of the x axis.
 
         """
-        if self._data is None:
-            self._parse_file()
-        return self._x_meta[YamlNames.unit]
+        row = self._get_rows([curve_id])[0]  # parses the file if needed
+        return self._x_units[row]
 
     def get_y_unit(self, curve_id: str) -> str:
         """
@@ -90,9 +178,8 @@ class NVEYamlCurveLoader(FileLoader, CurveLoader):
             str: Unit of the y axis.
 
         """
-        if self._data is None:
-            self._parse_file()
-        return self._y_meta[YamlNames.unit]
+        row = self._get_rows([curve_id])[0]  # parses the file if needed
+        return self._y_units[row]
 
     def get_metadata(self, content_id: str) -> dict:
         """
@@ -102,38 +189,41 @@ class NVEYamlCurveLoader(FileLoader, CurveLoader):
             content_id (str): Unique identifier for the content.
 
         Returns:
-            dict: Metadata associated with the content.
+            dict: The common metadata of the file updated with the metadata of the curve.
 
         """
-        if self._data is None:
-            self._parse_file()
-        return self._data[YamlNames.metadata_field]
-
-    def _get_ids(self) -> list[str]:
-        if self._content_ids is None:
-            if self._data is None:
-                self._parse_file()
-            ids_list = list(self._data.keys())
-            ids_list.remove(YamlNames.metadata_field)
-            self._content_ids = ids_list
-        return self._content_ids
+        row = self._get_rows([content_id])[0]
+        return {**self._common_metadata, **json.loads(self._metadata[row])}
 
     def _parse_file(self) -> None:
-        with self.get_source().open(encoding=YamlNames.encoding) as f:
-            d = yaml.safe_load(f)
-            self._x_meta = d[YamlNames.metadata_field][YamlNames.x_field]
-            self._y_meta = d[YamlNames.metadata_field][YamlNames.y_field]
-
-            self._x_label = self._x_meta[YamlNames.attribute]
-            self._y_label = self._y_meta[YamlNames.attribute]
-
-            self._data = d
+        """Read all datasets of the file once per process, as read-only arrays."""
+        h5f = file_handle_pool.get_h5_file(self.get_source())
+        content = file_handle_pool.get_derived(self.get_source(), "curves", lambda: self._read_curves(h5f), owner=self)
+        self._rows, self._x_block, self._y_block, self._lengths, self._x_units, self._y_units, self._metadata, self._common_metadata = content
+
+    def _read_curves(self, h5f: h5py.File) -> tuple:
+        if H5Names.CURVE_IDS not in h5f:
+            message = f"{self} is not a curve file, it has no dataset '{H5Names.CURVE_IDS}'."
+            raise ValueError(message)
+        arrays = [h5f[name][()] for name in (H5Names.X_AXES, H5Names.Y_AXES, H5Names.CURVE_LENGTHS)]
+        for array in arrays:
+            array.flags.writeable = False  # shared by all loaders of the file
+        curve_ids, x_units, y_units, metadata = (
+            self._decode(h5f[name][()]) for name in (H5Names.CURVE_IDS, H5Names.X_UNITS, H5Names.Y_UNITS, H5Names.CURVE_METADATA)
+        )
+        common_metadata = json.loads(h5f.attrs.get(H5Names.COMMON_CURVE_METADATA, "{}"))
+        rows = {curve_id: row for row, curve_id in enumerate(curve_ids)}
+        return rows, *arrays, x_units, y_units, metadata, common_metadata
+
+    @staticmethod
+    def _decode(values: NDArray) -> list[str]:
+        return np.char.decode(values, encoding=H5Names.ENCODING).tolist()
 
     def clear_cache(self) -> None:
-        """Clear cached data."""
-        self._data = None
-        self._x_meta = None
-        self._y_meta = None
-
-        self._x_label = None
-        self._y_label = None
+        """Clear cached data, and release the items derived from the file in the file handle pool."""
+        super().clear_cache()
+        file_handle_pool.release_derived(self.get_source(), self)
+        self._x_units = None
+        self._y_units = None
+        self._metadata = None
+        self._common_metadata = None
@@ -9,21 +9,27 @@ This module provides:
 
 """
 
+import hashlib
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta, tzinfo
 from pathlib import Path
 from typing import ClassVar
 
 import h5py
 import numpy as np
+import openpyxl
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
-import yaml
 from framcore.timeindexes import ConstantTimeIndex, FixedFrequencyTimeIndex, ListTimeIndex, TimeIndex
 from numpy.typing import NDArray
 
 from framdata.database_names.H5Names import H5Names
 from framdata.database_names.TimeVectorMetadataNames import TimeVectorMetadataNames as TvMn
 from framdata.database_names.YamlNames import YamlNames
+from framdata.loaders._file_handle_pool import file_handle_pool
+from framdata.loaders._sidecar_cache import SidecarCache
+from framdata.loaders._yaml_parsing import load_yaml
 from framdata.loaders.NVETimeVectorLoader import NVETimeVectorLoader
 
 
@@ -41,8 +47,23 @@ class NVEExcelTimeVectorLoader(NVETimeVectorLoader):
     _SUPPORTED_SUFFIXES: ClassVar[list] = [".xlsx"]
     _DATA_SHEET = "Data"
     _METADATA_SHEET = "Metadata"
-
-    def __init__(self, source: Path | str, require_whole_years: bool, relative_loc: Path | str | None = None, validate: bool = True) -> None:
+    # formats of dates with day defined, by the number of space and colon separated segments
+    _DATETIME_FORMATS: ClassVar[dict[tuple[int, int], str]] = {
+        (1, 1): "%Y-%m-%d",
+        (2, 1): "%Y-%m-%d %H",
+        (2, 2): "%Y-%m-%d %H:%M",
+        (2, 3): "%Y-%m-%d %H:%M:%S",
+    }
+
+    def __init__(
+        self,
+        source: Path | str,
+        require_whole_years: bool,
+        relative_loc: Path | str | None = None,
+        validate: bool = True,
+        time_window: tuple[datetime | None, datetime | None] | None = None,
+        cache_dir: Path | str | None = None,
+    ) -> None:
         """
         Intitialize loader instance and connect it to an Excel file containing time vector data.
 
@@ -51,10 +72,18 @@ class NVEExcelTimeVectorLoader(NVETimeVectorLoader):
             require_whole_years (bool): Flag for validating that the time vectors in the source contain data for complete years.
             relative_loc (Path | str | None, optional): Path to excel file relative to source. Defaults to None.
             validate (bool, optional): Flag to turn on validation of timevectors. NB! Loads all data into memory at once. Defaults to True.
+            time_window (tuple[datetime | None, datetime | None] | None, optional): Start and end of the period the loader is limited to. Defaults to
+                                                                                   None.
+            cache_dir (Path | str | None, optional): Directory of a cache of parsed workbooks. The values are memory-mapped from the cache, and the
+                                                     workbook is only parsed when it has changed. Defaults to None, which disables the cache.
 
         """
-        super().__init__(source, require_whole_years, relative_loc)
+        super().__init__(source, require_whole_years, relative_loc, time_window)
         self._index: TimeIndex = None
+        self._columns: dict[str, int] = None
+        self._datetimes: pd.DatetimeIndex = None
+        self._raw_meta: dict | None = None
+        self._cache_dir = cache_dir
 
         if validate:
             self.validate_vectors()
@@ -73,59 +102,75 @@ class NVEExcelTimeVectorLoader(NVETimeVectorLoader):
         """
         return self.get_metadata("")[TvMn.UNIT]
 
-    def get_values(self, vector_id: str) -> NDArray:
+    def get_values(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> NDArray:
         """
         Get numpy array with all the values of a given vector in the Loader's excel file.
 
         Args:
             vector_id (str): Unique id of the vector in the file.
+            start (datetime | None, optional): Only get values describing the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only get values describing the period until this point in time. Defaults to None.
 
         Returns:
             NDArray: Numpy array with values.
 
         """
-        if self._data is None:
-            self._data = pd.DataFrame()
-        if vector_id not in self._data.columns:
-            issmallformat = self._is_horizontal_format()
-            column_filter = [vector_id]
-            usecols = None
-            if not issmallformat:
-                usecols = column_filter
-
-            values_df = pd.read_excel(self.get_source(), sheet_name=self._DATA_SHEET, usecols=usecols)
-
-            if issmallformat:  # Convert the table to large time series format
-                values_df = self._process_horizontal_format(values_df)
-                values_df = self._enforce_dtypes(values_df, issmallformat)
-                self._data = values_df
-            else:
-                values_df = self._enforce_dtypes(values_df, issmallformat)
-                self._data[vector_id] = values_df
-        return self._data[vector_id].to_numpy()
+        return self.get_values_many([vector_id], start, end)[vector_id]
+
+    def get_values_many(self, vector_ids: list[str] | None = None, start: datetime | None = None, end: datetime | None = None) -> dict[str, NDArray]:
+        """
+        Get numpy arrays with the values of several vectors in the Loader's excel file.
+
+        The workbook is parsed once, and the values of each vector are a row of the parsed 2D array.
+
+        Args:
+            vector_ids (list[str] | None, optional): IDs of the vectors to read. Defaults to None, which reads all vectors in the file.
+            start (datetime | None, optional): Only get values describing the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only get values describing the period until this point in time. Defaults to None.
+
+        Raises:
+            KeyError: If a vector is not found in the file.
 
-    def get_index(self, vector_id: str) -> ListTimeIndex:
+        Returns:
+            dict[str, NDArray]: Vector IDs mapped to numpy arrays with values.
+
+        """
+        if vector_ids is None:
+            vector_ids = self.get_ids()
+        self._parse_workbook()
+        missing_ids = [vector_id for vector_id in vector_ids if vector_id not in self._columns]
+        if missing_ids:
+            message = f"{self} found no vectors {missing_ids} in file."
+            raise KeyError(message)
+        positions = self._get_positions("", start, end)
+        return {vector_id: self._data[self._columns[vector_id], positions] for vector_id in vector_ids}
+
+    def get_index(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> ListTimeIndex:
         """
         Get the TimeIndex describing the time dimension of the vectors in the file.
 
         Args:
             vector_id (str): Not used since all vectors in the NVE excel files have the same index.
+            start (datetime | None, optional): Only describe the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only describe the period until this point in time. Defaults to None.
 
         Returns:
             TimeIndex: TimeIndex object describing the excel file's index.
 
         """
         meta = self.get_metadata("")
-        if self._index is None:
-            self.get_values(TvMn.DATETIME_COL)
-            self._index = ListTimeIndex(
-                self._data[TvMn.DATETIME_COL].tolist(),
-                is_52_week_years=meta[TvMn.IS_52_WEEK_YEARS],
-                extrapolate_first_point=meta[TvMn.EXTRAPOLATE_FISRT_POINT],
-                extrapolate_last_point=meta[TvMn.EXTRAPOLATE_LAST_POINT],
-            )
+        if self._index is None or start is not None or end is not None:
+            self._parse_workbook()
+            index = self._create_list_index(self._datetimes[self._get_positions("", start, end)].tolist(), meta)
+            if start is not None or end is not None:
+                return index
+            self._index = index
         return self._index
 
+    def _index_positions(self, vector_id: str, start: datetime | None, end: datetime | None) -> slice:
+        self._parse_workbook()
+        return self._list_positions(self._datetimes, start, end)
+
     def get_metadata(self, vector_id: str) -> dict[str, bool | int | str | datetime | timedelta | tzinfo | None]:
         """
         Read Excel file metadata.
@@ -141,48 +186,101 @@ class NVEExcelTimeVectorLoader(NVETimeVectorLoader):
 
         """
         if self._meta is None:
-            path = self.get_source()
-            raw_meta = pd.read_excel(path, sheet_name=self._METADATA_SHEET, na_values=[""]).replace([np.nan], [None]).to_dict("records")[0]
-
-            self._meta = self._process_meta(raw_meta)
+            self._parse_workbook()
+            if self._raw_meta is None:
+                message = f"{self} found no '{self._METADATA_SHEET}' sheet with a row of metadata in file."
+                raise KeyError(message)
+            self._meta = self._process_meta(self._raw_meta)
         return self._meta
 
-    def _enforce_dtypes(self, values_df: pd.DataFrame | pd.Series, issmallformat: bool) -> pd.DataFrame:
-        set_dtypes = "float"
-        if isinstance(values_df, pd.DataFrame):
-            set_dtypes = {c: "float" for c in values_df.columns if c != TvMn.DATETIME_COL}
+    def _parse_workbook(self) -> None:
+        """
+        Parse the data and metadata sheets of the workbook once, in read-only streaming mode.
 
-        # ensure correct dtypes
+        The values are stored as a 2D float array with one row per vector, together with a map from vector ID to row and the datetimes of the index.
+        The parsed workbook is shared by all loaders of the file through the file handle pool.
+
+        """
+        if self._data is None:
+            workbook = file_handle_pool.get_derived(self.get_source(), "workbook", self._load_workbook, owner=self)
+            self._data, self._columns, self._datetimes, self._raw_meta = workbook
+
+    def _load_workbook(self) -> tuple[NDArray, dict[str, int], pd.DatetimeIndex, dict | None]:
+        """Load the parsed workbook from the sidecar cache if it is enabled and up to date, otherwise parse it and store it in the cache."""
+        cache = None if self._cache_dir is None else SidecarCache(self._cache_dir)
+        if cache is not None:
+            cached = cache.load(self.get_source(), type(self).__name__)
+            if cached is not None:
+                arrays, (vector_ids, raw_meta) = cached
+                return arrays["values"], {vector_id: row for row, vector_id in enumerate(vector_ids)}, pd.DatetimeIndex(arrays["index"]), raw_meta
+
+        values, columns, datetimes, raw_meta = self._read_workbook()
+        if cache is not None and datetimes.tz is None:
+            cache.save(self.get_source(), type(self).__name__, {"values": values, "index": datetimes.to_numpy()}, (list(columns), raw_meta))
+        return values, columns, datetimes, raw_meta
+
+    def _read_workbook(self) -> tuple[NDArray, dict[str, int], pd.DatetimeIndex, dict | None]:
+        workbook = openpyxl.load_workbook(self.get_source(), read_only=True, data_only=True)
+        try:
+            if self._DATA_SHEET not in workbook.sheetnames:
+                message = f"{self} found no '{self._DATA_SHEET}' sheet in file."
+                raise RuntimeError(message)
+            data_rows = self._read_rows(workbook[self._DATA_SHEET])
+            meta_rows = self._read_rows(workbook[self._METADATA_SHEET]) if self._METADATA_SHEET in workbook.sheetnames else []
+        finally:
+            workbook.close()
+
+        raw_meta = dict(zip(meta_rows[0], meta_rows[1], strict=True)) if len(meta_rows) > 1 else None
+        if not data_rows:
+            message = f"{self}: found problem with TimeVector IDs."
+            raise RuntimeError(message)
+        header, body = data_rows[0], data_rows[1:]
+
+        if TvMn.ID_COLUMN_NAME in header:  # horizontal format, vectors as rows and the index as column names
+            id_column = header.index(TvMn.ID_COLUMN_NAME)
+            value_columns = [i for i, name in enumerate(header) if i != id_column]
+            vector_ids = [row[id_column] for row in body]
+            # It is possible to write only year or year-month as column names in the table, so they are converted to datetimes
+            datetimes = pd.DatetimeIndex(self._to_iso_datetimes(pd.Series([header[i] for i in value_columns])))
+            values = self._to_float_array([[row[i] for i in value_columns] for row in body], TvMn.ID_COLUMN_NAME)
+        else:
+            if TvMn.DATETIME_COL not in header:
+                message = f"{self}: found problem with TimeVector IDs."
+                raise RuntimeError(message)
+            datetime_column = header.index(TvMn.DATETIME_COL)
+            value_columns = [i for i, name in enumerate(header) if i != datetime_column]
+            vector_ids = [header[i] for i in value_columns]
+            datetimes = pd.DatetimeIndex([row[datetime_column] for row in body])
+            values = self._to_float_array([[row[i] for i in value_columns] for row in body], TvMn.DATETIME_COL).T
+
+        values = np.ascontiguousarray(values.reshape(len(vector_ids), len(datetimes)))
+        values.flags.writeable = False  # shared by all loaders of the file
+        return values, {vector_id: row for row, vector_id in enumerate(vector_ids)}, datetimes, raw_meta
+
+    @staticmethod
+    def _read_rows(sheet: object) -> list[list]:
+        """Read the non-empty rows of a sheet, leaving out columns without a name."""
+        rows = [list(row) for row in sheet.iter_rows(values_only=True) if any(cell is not None for cell in row)]
+        if not rows:
+            return rows
+        columns = [i for i, name in enumerate(rows[0]) if name is not None]
+        return [[row[i] if i < len(row) else None for i in columns] for row in rows]
+
+    def _to_float_array(self, rows: list[list], index_column: str) -> NDArray:
         try:
-            return values_df.astype(set_dtypes)
-        except ValueError as e:
-            index_column = TvMn.ID_COLUMN_NAME if issmallformat else TvMn.DATETIME_COL
+            return np.array(rows, dtype=float)
+        except (TypeError, ValueError) as e:
             message = f"Error in {self} while reading file. All columns except '{index_column}' must consist of only float or integer numbers."
             raise RuntimeError(message) from e
 
-    def _process_horizontal_format(self, horizontal_format_df: pd.DataFrame) -> pd.DataFrame:
-        # We have to read the whole file to find the correct series
-
-        # Rename the id column name and then transpose to get the correct format
-        # Since the columns are counted as indices when transposing, we need to reset the index (but keep the DateTime
-        # column)
-        reformat_df = horizontal_format_df.rename(columns={TvMn.ID_COLUMN_NAME: TvMn.DATETIME_COL}).T.reset_index(drop=False)
-
-        # after transposing, column names are set a the first row, which is DateTime, IDs
-        reformat_df.columns = reformat_df.iloc[0]
-        # We reindex by dropping the first row, thus removing the row of DateTime, IDs
-        reformat_df = reformat_df.reindex(reformat_df.index.drop(0)).reset_index(drop=True)
-
-        # Since It is possible to write only year or year-month as timestamp in the table,
-        # we need to reformat to correct datetime format
-        reformat_df[TvMn.DATETIME_COL] = self._to_iso_datetimes(reformat_df[TvMn.DATETIME_COL])
-
-        return reformat_df
-
     def _to_iso_datetimes(self, series: pd.Series) -> list[datetime]:
         """
         Convert a series of dates to ISO datetime format.
 
+        Values are grouped by their format (year, year-month, date, date and hour, and so on) and each group is converted in bulk. Year-only values
+        become the first day of the first ISO week of the year. Values which can not be converted in bulk are converted one by one, so errors are
+        reported for the first invalid value.
+
         Args:
             series (pd.Series): Series which values will be converted to ISO format.
 
@@ -190,74 +288,87 @@ class NVEExcelTimeVectorLoader(NVETimeVectorLoader):
             RuntimeError: When an input value which cannot be converted is encountered.
 
         Returns:
-            list[datetime]: List of formatted datetimes.
+            list[datetime]: Sorted list of formatted datetimes.
 
         """
-        reformatted = []
+        strings = series.astype(str).reset_index(drop=True)
+        date_split = strings.str.count("-") + 1
+        space_split = strings.str.count(" ") + 1
+        time_split = strings.str.count(":") + 1
+        parsed = pd.Series(pd.NaT, index=strings.index, dtype="datetime64[ns]")
+
+        year_only = (date_split == 1) & strings.str.fullmatch(r"\d{4}")
+        if year_only.any():
+            # the first ISO week of a year is the week containing January 4th
+            january_4th = pd.to_datetime(strings[year_only] + "-01-04", format="%Y-%m-%d")
+            parsed[year_only] = january_4th - pd.to_timedelta(january_4th.dt.weekday, unit="D")
+        year_month = date_split == 2  # noqa: PLR2004
+        if year_month.any():
+            parsed[year_month] = pd.to_datetime(strings[year_month] + "-01", format="%Y-%m-%d", errors="coerce")
+        for (spaces, colons), datetime_format in self._DATETIME_FORMATS.items():
+            group = (date_split == 3) & (space_split == spaces) & (time_split == colons)  # noqa: PLR2004
+            if group.any():
+                parsed[group] = pd.to_datetime(strings[group], format=datetime_format, errors="coerce")
+
+        failed = parsed.isna()
+        if not failed.any():
+            return pd.DatetimeIndex(parsed).sort_values().to_pydatetime().tolist()
+        reformatted = pd.DatetimeIndex(parsed).to_pydatetime().tolist()
+        for position in np.flatnonzero(failed.to_numpy()):
+            reformatted[position] = self._to_iso_datetime(strings[position])
+        return sorted(reformatted)
+
+    def _to_iso_datetime(self, value: str) -> datetime:
+        """Convert a single date to ISO datetime format."""
         three_segments = 3
         two_segments = 2
         one_segment = 1
-        for i in series:
-            new_i = str(i)
-            date_split = len(new_i.split("-"))
-            space_split = len(new_i.split(" "))
-            time_split = len(new_i.split(":"))
-            try:
-                if date_split == one_segment:  # Only year is defined
-                    # get datetime for first week first day
-                    new_i = datetime.fromisocalendar(int(new_i), 1, 1)
-                elif date_split == two_segments:
-                    # Year and month is defined
-                    new_i = datetime.strptime(new_i + "-01", "%Y-%m-%d")  # Add first day
-                elif date_split == three_segments and space_split == one_segment and time_split == one_segment:
-                    # days defined but not time
-                    new_i = datetime.strptime(new_i, "%Y-%m-%d")
-                elif date_split == three_segments and space_split == two_segments and time_split == one_segment:
-                    new_i = datetime.strptime(new_i, "%Y-%m-%d %H")
-                elif date_split == three_segments and space_split == two_segments and time_split == two_segments:
-                    new_i = datetime.strptime(new_i, "%Y-%m-%d %H:%M")
-                elif date_split == three_segments and space_split == two_segments and time_split == three_segments:
-                    # Assume time is defined
-                    new_i = datetime.strptime(new_i, "%Y-%m-%d %H:%M:%S")
-                else:
-                    msg = f"Could not convert value '{new_i}' to datetime format."
-                    raise ValueError(msg)
-            except Exception as e:
-                msg = f"Loader {self} could not convert value '{new_i}' to datetime format. Check formatting, for example number of spaces."
-                raise RuntimeError(msg) from e
-            reformatted.append(new_i)
-        return sorted(reformatted)
-
-    def _is_horizontal_format(self) -> bool:
-        """Determine if the file strucure is the NVE small format."""
-        column_names = pd.read_excel(self.get_source(), nrows=0, sheet_name=self._DATA_SHEET).columns.tolist()
-        return TvMn.ID_COLUMN_NAME in column_names
+        new_i = value
+        date_split = len(new_i.split("-"))
+        space_split = len(new_i.split(" "))
+        time_split = len(new_i.split(":"))
+        try:
+            if date_split == one_segment:  # Only year is defined
+                # get datetime for first week first day
+                new_i = datetime.fromisocalendar(int(new_i), 1, 1)
+            elif date_split == two_segments:
+                # Year and month is defined
+                new_i = datetime.strptime(new_i + "-01", "%Y-%m-%d")  # Add first day
+            elif date_split == three_segments and space_split == one_segment and time_split == one_segment:
+                # days defined but not time
+                new_i = datetime.strptime(new_i, "%Y-%m-%d")
+            elif date_split == three_segments and space_split == two_segments and time_split == one_segment:
+                new_i = datetime.strptime(new_i, "%Y-%m-%d %H")
+            elif date_split == three_segments and space_split == two_segments and time_split == two_segments:
+                new_i = datetime.strptime(new_i, "%Y-%m-%d %H:%M")
+            elif date_split == three_segments and space_split == two_segments and time_split == three_segments:
+                # Assume time is defined
+                new_i = datetime.strptime(new_i, "%Y-%m-%d %H:%M:%S")
+            else:
+                msg = f"Could not convert value '{new_i}' to datetime format."
+                raise ValueError(msg)
+        except Exception as e:
+            msg = f"Loader {self} could not convert value '{new_i}' to datetime format. Check formatting, for example number of spaces."
+            raise RuntimeError(msg) from e
+        return new_i
 
     def _get_ids(self) -> list[str]:
         if self._content_ids is not None:
             return self._content_ids
-        try:
-            if self._is_horizontal_format():
-                self._content_ids = pd.read_excel(
-                    self.get_source(),
-                    usecols=[TvMn.ID_COLUMN_NAME],
-                    sheet_name=self._DATA_SHEET,
-                )[TvMn.ID_COLUMN_NAME].tolist()
-            else:
-                columns_list = pd.read_excel(self.get_source(), nrows=0, sheet_name=self._DATA_SHEET).columns.tolist()
-                columns_list.remove(TvMn.DATETIME_COL)
-                self._content_ids = columns_list
-        except ValueError as e:
-            message = f"{self}: found problem with TimeVector IDs."
-            raise RuntimeError(message) from e
-
+        self._parse_workbook()
+        self._content_ids = list(self._columns)
         return self._content_ids
 
     def clear_cache(self) -> None:
-        """Clear cached data."""
+        """Clear cached data, and release the items derived from the file in the file handle pool."""
+        file_handle_pool.release_derived(self.get_source(), self)
         self._data = None
+        self._columns = None
+        self._datetimes = None
+        self._raw_meta = None
         self._meta = None
         self._index = None
+        self._positions = {}
 
 
 class NVEH5TimeVectorLoader(NVETimeVectorLoader):
@@ -275,11 +386,25 @@ class NVEH5TimeVectorLoader(NVETimeVectorLoader):
         - vectors (h5py.Group): Contains numpy arrays containing the vector values connected to a unique ID. The same ID is used to connect the vector to an
                                 index or metadata.
 
+    Alternatively, vectors of equal length can be stored in the matrix layout, replacing the vectors group:
+        - vector_matrix (h5py.Dataset): 2D array (time x vector) with one column per vector. Reads of many vectors, or of a time window across all
+                                        vectors, are then single hyperslab reads.
+        - vector_matrix_ids (h5py.Dataset): Encoded IDs of the columns of vector_matrix. Indexes and metadata are connected to the IDs as above.
+
     """
 
     _SUPPORTED_SUFFIXES: ClassVar[list] = [".h5", ".hdf5"]
 
-    def __init__(self, source: Path | str, require_whole_years: bool, relative_loc: Path | str | None = None, validate: bool = True) -> None:
+    def __init__(
+        self,
+        source: Path | str,
+        require_whole_years: bool,
+        relative_loc: Path | str | None = None,
+        validate: bool = True,
+        memory_map: bool = False,
+        time_window: tuple[datetime | None, datetime | None] | None = None,
+        swmr: bool = False,
+    ) -> None:
         """
         Intitialize loader instance and connect it to a H5 file containing time vector data.
 
@@ -287,74 +412,341 @@ class NVEH5TimeVectorLoader(NVETimeVectorLoader):
             source (Path | str): Absolute Path to database or HDF5 file.
             require_whole_years (bool): Flag for validating that the time vectors in the source contain data for complete years.
             relative_loc (Path | str | None, optional): Path to HDF5 file relative to source. Defaults to None.
-            validate (bool, optional): Whether to validate vectors after loading. NB! Loads all data into memory at once. Defaults to True.
+            validate (bool, optional): Whether to validate vectors after loading. The vectors are streamed in chunks. Defaults to True.
+            memory_map (bool, optional): Return values of contiguous, uncompressed datasets as read-only numpy memory maps of the file instead of
+                                         copies, so processes reading the same file share the page cache. Chunked and compressed datasets are read
+                                         normally. The file must not be rewritten while values are mapped. Defaults to False.
+            time_window (tuple[datetime | None, datetime | None] | None, optional): Start and end of the period the loader is limited to. Defaults to
+                                                                                   None.
+            swmr (bool, optional): Read the file while a single writer appends to it in SWMR mode. Call refresh to see the appended values. Defaults
+                                   to False.
 
         """
-        super().__init__(source, require_whole_years, relative_loc)
-        self._index: TimeIndex = None
-        self._file_pointer = None
+        super().__init__(source, require_whole_years, relative_loc, time_window)
+        self._memory_map = memory_map
+        self._swmr = swmr
+        self._vector_index: dict[str, TimeIndex] = None
+        self._vector_meta: dict[str, dict[str, bool | int | str | datetime | timedelta | tzinfo | None]] = None
+        self._interned: dict[tuple, TimeIndex | dict | tuple] = {}
 
         if validate:
             self.validate_vectors()
 
-    def get_values(self, vector_id: str) -> NDArray:
+    def get_values(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> NDArray:
         """
         Get numpy array with all the values of a given vector in the Loader's HDF5 file.
 
         Args:
             vector_id (str): Unique id of the vector in the file.
+            start (datetime | None, optional): Only read values describing the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only read values describing the period until this point in time. Defaults to None.
 
         Returns:
-            NDArray: Numpy array with values.
+            NDArray: Numpy array with values. A read-only memory map if the loader is in memory map mode and the dataset is contiguous.
+
+        """
+        return self.get_values_many([vector_id], start, end)[vector_id]
+
+    def get_values_many(self, vector_ids: list[str] | None = None, start: datetime | None = None, end: datetime | None = None) -> dict[str, NDArray]:
+        """
+        Get numpy arrays with the values of several vectors in the Loader's HDF5 file.
+
+        All vectors which are not already cached are read while the file is opened once. Only the selected part (hyperslab) of each dataset is read
+        when the loader or the call is limited to a time window. Values read for a window given in the call are not cached.
+
+        Args:
+            vector_ids (list[str] | None, optional): IDs of the vectors to read. Defaults to None, which reads all vectors in the file.
+            start (datetime | None, optional): Only read values describing the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only read values describing the period until this point in time. Defaults to None.
+
+        Returns:
+            dict[str, NDArray]: Vector IDs mapped to numpy arrays with values.
 
         """
+        if vector_ids is None:
+            vector_ids = self.get_ids()
         if self._data is None:
             self._data = dict()
-        if vector_id not in self._data:
-            with h5py.File(self.get_source(), mode="r") as h5f:
-                self._data[vector_id] = self._read_vector_field(h5f, H5Names.VECTORS_GROUP, vector_id, field_type=h5py.Dataset, use_fallback=False)[()]
-        return self._data[vector_id]
+        windowed = start is not None or end is not None
+        missing_ids = [vector_id for vector_id in dict.fromkeys(vector_ids) if windowed or vector_id not in self._data]
+        if not missing_ids:
+            return {vector_id: self._data[vector_id] for vector_id in vector_ids}
+
+        positions = {vector_id: self._get_positions(vector_id, start, end) for vector_id in missing_ids}
+        values = {}
+        h5f = self._get_file()
+        if self._is_matrix_layout(h5f):
+            values = self._read_matrix(h5f[H5Names.VECTOR_MATRIX], positions)
+        for vector_id in [vector_id for vector_id in missing_ids if vector_id not in values]:
+            dataset = self._read_vector_field(h5f, H5Names.VECTORS_GROUP, vector_id, field_type=h5py.Dataset, use_fallback=False)
+            mapped = self._get_memmap(h5f, dataset)
+            stored = dataset if mapped is None else mapped
+            values[vector_id] = stored[()] if positions[vector_id] == slice(None) else stored[positions[vector_id]]
+        if windowed:
+            return values
+        self._data.update(values)
+        return {vector_id: self._data[vector_id] for vector_id in vector_ids}
+
+    def iter_chunks(self, vector_ids: str | list[str] | None = None, chunk_size: int | None = None) -> Iterator[dict[str, NDArray]]:
+        """
+        Iterate over the values of vectors in chunks along the time dimension.
+
+        The file is kept open during the iteration and only one slab of each dataset is read at a time. Vectors which are already cached are sliced from
+        the cache.
+
+        Args:
+            vector_ids (str | list[str] | None, optional): ID or IDs of the vectors to iterate over. Defaults to None, which iterates over all vectors in
+                                                          the file.
+            chunk_size (int | None, optional): Maximum number of values of each vector in a chunk. Defaults to None, which uses the chunk size of the
+                                               Loader class.
+
+        Yields:
+            dict[str, NDArray]: Vector IDs mapped to the values of the chunk. Vectors which have no values left are left out.
 
-    def get_index(self, vector_id: str) -> TimeIndex:
         """
-        Get the TimeIndex describing the time dimension of the vectors in the file.
+        vector_ids, chunk_size = self._check_chunk_args(vector_ids, chunk_size)
+        if self._data is not None and all(vector_id in self._data for vector_id in vector_ids):
+            yield from super().iter_chunks(vector_ids, chunk_size)
+            return
+
+        positions = {vector_id: self._get_positions(vector_id) for vector_id in vector_ids}
+        h5f = self._get_file()
+        matrix = h5f[H5Names.VECTOR_MATRIX] if self._is_matrix_layout(h5f) else None
+        if matrix is not None:
+            self._get_matrix_columns(h5f, vector_ids)  # fail before the first chunk if a vector is missing
+            datasets = dict.fromkeys(vector_ids, matrix)
+        else:
+            datasets = {
+                vector_id: self._read_vector_field(h5f, H5Names.VECTORS_GROUP, vector_id, field_type=h5py.Dataset, use_fallback=False)
+                for vector_id in vector_ids
+            }
+        chunk_lengths = [dataset.chunks[0] for dataset in datasets.values() if dataset.chunks]
+        if chunk_lengths:  # read whole stored chunks, so compressed chunks are decoded once
+            chunk_size = max(chunk_size // max(chunk_lengths), 1) * max(chunk_lengths)
+        bounds = {vector_id: positions[vector_id].indices(datasets[vector_id].shape[0])[:2] for vector_id in vector_ids}
+        sizes = {vector_id: max(upper - lower, 0) for vector_id, (lower, upper) in bounds.items()}
+        if matrix is None:
+            mapped = {vector_id: self._get_memmap(h5f, dataset) for vector_id, dataset in datasets.items()}
+            datasets = {vector_id: dataset if mapped[vector_id] is None else mapped[vector_id] for vector_id, dataset in datasets.items()}
+        for slices in self._iter_slices(sizes, chunk_size):
+            chunk_positions = {
+                vector_id: slice(bounds[vector_id][0] + chunk.start, bounds[vector_id][0] + chunk.stop) for vector_id, chunk in slices.items()
+            }
+            if matrix is not None:
+                yield self._read_matrix(matrix, chunk_positions)
+            else:
+                yield {vector_id: datasets[vector_id][vector_positions] for vector_id, vector_positions in chunk_positions.items()}
+
+    def _is_matrix_layout(self, h5f: h5py.File) -> bool:
+        return H5Names.VECTORS_GROUP not in h5f and H5Names.VECTOR_MATRIX in h5f
+
+    def _get_matrix_columns(self, h5f: h5py.File, vector_ids: list[str]) -> list[int]:
+        """Get the columns of vectors in the matrix of a file in the matrix layout."""
+        columns = file_handle_pool.get_derived(
+            self.get_source(),
+            H5Names.VECTOR_MATRIX_IDS,
+            lambda: {vector_id: column for column, vector_id in enumerate(self._decode_matrix_ids(h5f))},
+            owner=self,
+        )
+        missing = [vector_id for vector_id in vector_ids if vector_id not in columns]
+        if missing:
+            message = f"{self} expected {missing} in {h5py.Dataset} '{H5Names.VECTOR_MATRIX_IDS}' but they were not found."
+            raise KeyError(message)
+        return [columns[vector_id] for vector_id in vector_ids]
+
+    @staticmethod
+    def _decode_matrix_ids(h5f: h5py.File) -> list[str]:
+        return np.char.decode(h5f[H5Names.VECTOR_MATRIX_IDS][()], encoding=TvMn.ENCODING).tolist()
+
+    def _read_matrix(self, matrix: h5py.Dataset, positions: dict[str, slice]) -> dict[str, NDArray]:
+        """
+        Read positions of vectors from the matrix, with one hyperslab read for all vectors with the same positions.
+
+        Columns which are close together are read as one block of adjacent columns, otherwise the selected columns are read by a point selection.
+
+        """
+        groups: dict[tuple[int, int], list[str]] = {}
+        for vector_id, vector_positions in positions.items():
+            lower, upper = vector_positions.indices(matrix.shape[0])[:2]
+            groups.setdefault((lower, max(upper, lower)), []).append(vector_id)
+
+        values = {}
+        mapped = self._get_memmap(matrix.file, matrix)
+        for (lower, upper), vector_ids in groups.items():
+            columns = self._get_matrix_columns(matrix.file, vector_ids)
+            if mapped is not None:  # strided views of the columns
+                values.update({vector_id: mapped[lower:upper, column] for vector_id, column in zip(vector_ids, columns, strict=True)})
+                continue
+            first, last = min(columns), max(columns)
+            if last - first + 1 <= 2 * len(columns):
+                block = matrix[lower:upper, first : last + 1]
+                offsets = [column - first for column in columns]
+            else:
+                selected = sorted(set(columns))
+                block = matrix[lower:upper, selected]
+                offsets = [selected.index(column) for column in columns]
+            block = np.ascontiguousarray(block.T)  # each vector becomes a contiguous row
+            values.update({vector_id: block[offset] for vector_id, offset in zip(vector_ids, offsets, strict=True)})
+        return values
+
+    def _get_memmap(self, h5f: h5py.File, dataset: h5py.Dataset) -> np.memmap | None:
+        """Get a read-only memory map of a dataset, or None if the loader is not in memory map mode or the dataset can not be mapped."""
+        if not self._memory_map or dataset.chunks is not None or dataset.dtype.kind not in "biuf" or dataset.size == 0:
+            return None
+        # shared by all loaders of the file in memory map mode, so the dataset is mapped once per process
+        return file_handle_pool.get_derived(self.get_source(), ("memmap", dataset.name), lambda: self._map_dataset(h5f, dataset), owner=self)
+
+    @staticmethod
+    def _map_dataset(h5f: h5py.File, dataset: h5py.Dataset) -> np.memmap | None:
+        offset = dataset.id.get_offset()  # None if the data is not allocated or stored externally
+        if offset is None:
+            return None
+        return np.memmap(h5f.filename, dtype=dataset.dtype, mode="r", offset=offset, shape=dataset.shape)
+
+    def get_layout(self, vector_id: str) -> dict[str, tuple[int, ...] | str | int | bool | None]:
+        """
+        Get the storage layout of the dataset of a vector in the HDF5 file. In the matrix layout it is the layout of the matrix.
 
         Args:
-            vector_id (str): Not used since all vectors in the NVE parquet files have the same index.
+            vector_id (str): Unique id of the vector in the file.
 
         Returns:
-            TimeIndex: TimeIndex object describing the parquet file's index.
+            dict[str, tuple[int, ...] | str | int | bool | None]: Chunk shape (None if stored contiguously), compression filter and its options, and
+                                                                  whether the shuffle filter and Fletcher32 checksums are used.
 
         """
-        if self._index is None:
-            meta = self.get_metadata("")
+        h5f = self._get_file()
+        if self._is_matrix_layout(h5f):
+            self._get_matrix_columns(h5f, [vector_id])
+            dataset = h5f[H5Names.VECTOR_MATRIX]
+        else:
+            dataset = self._read_vector_field(h5f, H5Names.VECTORS_GROUP, vector_id, field_type=h5py.Dataset, use_fallback=False)
+        return {
+            H5Names.CHUNKS: dataset.chunks,
+            H5Names.COMPRESSION: dataset.compression,
+            H5Names.COMPRESSION_OPTS: dataset.compression_opts,
+            H5Names.SHUFFLE: dataset.shuffle,
+            H5Names.FLETCHER32: dataset.fletcher32,
+        }
+
+    def get_index(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> TimeIndex:
+        """
+        Get the TimeIndex describing the time dimension of a vector in the file.
 
-            if meta[TvMn.FREQUENCY] is None:
-                self._index = ListTimeIndex(
-                    datetime_list=self._read_index(vector_id),
-                    is_52_week_years=meta[TvMn.IS_52_WEEK_YEARS],
-                    extrapolate_first_point=meta[TvMn.EXTRAPOLATE_FISRT_POINT],
-                    extrapolate_last_point=meta[TvMn.EXTRAPOLATE_LAST_POINT],
-                )
-                return self._index
+        The indexes of all vectors are created in one pass over the file the first time an index is requested. Vectors with identical indexes and
+        metadata share the same TimeIndex object.
+
+        Args:
+            vector_id (str): Unique id of the vector in the file.
+            start (datetime | None, optional): Only describe the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only describe the period until this point in time. Defaults to None.
+
+        Returns:
+            TimeIndex: TimeIndex object describing the vector's index.
 
-            start = pd.to_datetime(self._read_index(vector_id)[0]) if meta[TvMn.START] is None else meta[TvMn.START]
-            num_points = self._read_index(vector_id).size if meta[TvMn.NUM_POINTS] is None else meta[TvMn.NUM_POINTS]
+        """
+        if start is not None or end is not None:
+            return self._create_index(vector_id, self.get_metadata(vector_id), self._get_positions(vector_id, start, end))
+
+        if self._vector_index is None:
+            self._vector_index = {}
+            h5f = self._get_file()
+            for content_id in self.get_ids():
+                self._vector_index[content_id] = self._get_interned_index(h5f, content_id)
+        if vector_id not in self._vector_index:
+            self._vector_index[vector_id] = self._get_interned_index(self._get_file(), vector_id)
+        return self._vector_index[vector_id]
+
+    def _get_interned_index(self, h5f: h5py.File, vector_id: str) -> TimeIndex:
+        meta = self.get_metadata(vector_id)
+        positions = self._get_positions(vector_id)
+        key = ("time_index", id(meta), positions.start, positions.stop, self._get_index_key(h5f, vector_id, meta))
+        if key not in self._interned:
+            self._interned[key] = self._create_index(vector_id, meta, positions)
+        return self._interned[key]
+
+    def _get_index_key(self, h5f: h5py.File, vector_id: str, meta: dict) -> tuple | None:
+        """Get a key identifying the contents of the stored index of a vector, or None if its index is fully described by its metadata."""
+        if meta[TvMn.FREQUENCY] is not None and meta[TvMn.START] is not None and meta[TvMn.NUM_POINTS] is not None:
+            return None
+        dataset = self._read_vector_field(h5f, H5Names.INDEX_GROUP, vector_id, h5py.Dataset)
+        dataset_key = ("index_dataset", dataset.name)
+        if dataset_key not in self._interned:
+            # the decoded index is kept by the file handle pool, so creating the TimeIndex afterwards does not read the dataset again.
+            index = self._read_index(vector_id)
+            self._interned[dataset_key] = ("index", index.size, hashlib.blake2b(index.asi8.tobytes()).digest())
+        return self._interned[dataset_key]
+
+    def _create_index(self, vector_id: str, meta: dict, positions: slice) -> TimeIndex:
+        if meta[TvMn.FREQUENCY] is None:
+            return self._create_list_index(self._read_index(vector_id)[positions].tolist(), meta)
+        first, num_points = self._get_start_and_num_points(vector_id, meta)
+        return self._create_fixed_frequency_index(first, meta[TvMn.FREQUENCY], num_points, positions, meta)
+
+    def _index_positions(self, vector_id: str, start: datetime | None, end: datetime | None) -> slice:
+        meta = self.get_metadata(vector_id)
+        if meta[TvMn.FREQUENCY] is None:
+            return self._list_positions(self._read_index(vector_id), start, end)
+        first, num_points = self._get_start_and_num_points(vector_id, meta)
+        return self._fixed_frequency_positions(first, meta[TvMn.FREQUENCY], num_points, start, end)
+
+    def _get_start_and_num_points(self, vector_id: str, meta: dict) -> tuple[datetime, int]:
+        """Get start and number of points of a fixed frequency index from metadata, or from the stored index where they are not defined."""
+        index = None
+        if meta[TvMn.START] is None or meta[TvMn.NUM_POINTS] is None:
+            index = self._read_index(vector_id)
+        start = index[0] if meta[TvMn.START] is None else meta[TvMn.START]
+        num_points = index.size if meta[TvMn.NUM_POINTS] is None else meta[TvMn.NUM_POINTS]
+        return start, num_points
+
+    def _get_file(self) -> h5py.File:
+        return file_handle_pool.get_h5_file(self.get_source(), swmr=self._swmr)
+
+    def refresh(self) -> None:
+        """
+        Refresh the extents of the vector and index datasets of a file appended to by a SWMR writer, without reopening the file.
 
-            self._index = FixedFrequencyTimeIndex(
-                start,
-                meta[TvMn.FREQUENCY],
-                num_points,
-                is_52_week_years=meta[TvMn.IS_52_WEEK_YEARS],
-                extrapolate_first_point=meta[TvMn.EXTRAPOLATE_FISRT_POINT],
-                extrapolate_last_point=meta[TvMn.EXTRAPOLATE_LAST_POINT],
-            )
+        Values, indexes and positions read before are dropped, so the next reads include the appended data. Metadata and IDs are kept, since a SWMR
+        writer can only append to existing datasets. The vectors are not validated again.
 
-        return self._index
+        Raises:
+            RuntimeError: If the loader does not read the file in SWMR mode.
+
+        """
+        if not self._swmr:
+            message = f"{self} can only refresh files read in SWMR mode."
+            raise RuntimeError(message)
+        h5f = self._get_file()
+        datasets = [h5f.get(H5Names.COMMON_PREFIX + H5Names.INDEX_GROUP), h5f.get(H5Names.VECTOR_MATRIX)]
+        for group_name in (H5Names.VECTORS_GROUP, H5Names.INDEX_GROUP):
+            if isinstance(h5f.get(group_name), h5py.Group):
+                datasets.extend(h5f[group_name].values())
+        for dataset in datasets:
+            if isinstance(dataset, h5py.Dataset):
+                dataset.refresh()
+
+        self._data = None
+        self._vector_index = None
+        self._interned = {}
+        self._positions = {}
+
+    def _read_index(self, vector_id: str) -> pd.DatetimeIndex:
+        h5f = self._get_file()
+        dataset = self._read_vector_field(h5f, H5Names.INDEX_GROUP, vector_id, h5py.Dataset)
+        # decoded indexes are shared by all loaders of the file, and the common index by all vectors using it.
+        return file_handle_pool.get_derived(self.get_source(), (H5Names.INDEX_GROUP, dataset.name), lambda: self._decode_index(h5f, dataset), owner=self)
+
+    def _decode_index(self, h5f: h5py.File, dataset: h5py.Dataset) -> pd.DatetimeIndex:
+        """Decode an index stored as int64 nanoseconds since epoch, or as byte strings in files of the legacy format."""
+        version = h5f.attrs.get(H5Names.FORMAT_VERSION_ATTRIBUTE, 1)
+        if version > H5Names.FORMAT_VERSION:
+            message = f"{self} supports HDF5 files up to format version {H5Names.FORMAT_VERSION}, but {h5f.filename} has format version {version}."
+            raise ValueError(message)
 
-    def _read_index(self, vector_id: str) -> NDArray:
-        with h5py.File(self.get_source(), mode="r") as h5f:
-            return np.char.decode(self._read_vector_field(h5f, H5Names.INDEX_GROUP, vector_id, h5py.Dataset)[()], encoding="utf-8").astype(datetime)
+        values = dataset[()]
+        if np.issubdtype(values.dtype, np.integer):
+            return pd.DatetimeIndex(values.astype(np.int64).view("datetime64[ns]"))
+        return pd.DatetimeIndex(np.char.decode(values, encoding="utf-8").astype(datetime))
 
     def _read_vector_field(
         self,
@@ -404,10 +796,13 @@ class NVEH5TimeVectorLoader(NVETimeVectorLoader):
 
     def get_metadata(self, vector_id: str) -> dict[str, bool | int | str | datetime | timedelta | tzinfo | None]:
         """
-        Retrieve and decodes custom metadata from parquet file.
+        Retrieve and decode the metadata of a vector in the HDF5 file.
+
+        The metadata of all vectors are read in one pass over the file the first time metadata is requested. Vectors with identical metadata share the
+        same dictionary.
 
         Args:
-            vector_id (str): Not used
+            vector_id (str): Unique id of the vector in the file. Vectors without their own metadata get the common metadata of the file.
 
         Raises:
             KeyError: If any of the expected metadata keys is not found in file.
@@ -416,32 +811,51 @@ class NVEH5TimeVectorLoader(NVETimeVectorLoader):
             dict: Dictionary with decoded metadata.
 
         """
-        if self._meta is None:
+        if self._vector_meta is None:
+            self._vector_meta = {}
+            h5f = self._get_file()
+            for content_id in self.get_ids():
+                self._vector_meta[content_id] = self._get_interned_meta(h5f, content_id)
+        if vector_id not in self._vector_meta:
+            self._vector_meta[vector_id] = self._get_interned_meta(self._get_file(), vector_id)
+        return self._vector_meta[vector_id]
+
+    def _get_interned_meta(self, h5f: h5py.File, vector_id: str) -> dict[str, bool | int | str | datetime | timedelta | tzinfo | None]:
+        meta_group = self._read_vector_field(h5f, H5Names.METADATA_GROUP, vector_id, h5py.Group)
+        group_key = ("metadata_group", meta_group.name)
+        if group_key not in self._interned:
             errors = set()
             meta = {}
-            with h5py.File(self.get_source(), mode="r") as h5f:
-                meta_group = self._read_vector_field(h5f, H5Names.METADATA_GROUP, vector_id, h5py.Group)
-                for k, m in meta_group.items():
-                    if isinstance(m, h5py.Dataset):
-                        meta[k] = m[()]
-                    else:
-                        errors.add(f"Improper metadata format: Metadata key {k} exists but is a h5 group when it should be a h5 dataset.")
+            for k, m in meta_group.items():
+                if isinstance(m, h5py.Dataset):
+                    meta[k] = m[()]
+                else:
+                    errors.add(f"Improper metadata format: Metadata key {k} exists but is a h5 group when it should be a h5 dataset.")
             self._report_errors(errors)
-            self._meta = self._process_meta(meta)
-        return self._meta
+
+            content_key = ("metadata", tuple(sorted((k, v.tobytes() if isinstance(v, np.ndarray) else v) for k, v in meta.items())))
+            if content_key not in self._interned:
+                self._interned[content_key] = self._process_meta(meta)
+            self._interned[group_key] = self._interned[content_key]
+        return self._interned[group_key]
 
     def _get_ids(self) -> list[str]:
-        with h5py.File(self.get_source(), mode="r") as h5f:
-            if H5Names.VECTORS_GROUP in h5f:
-                return list(h5f[H5Names.VECTORS_GROUP].keys())
-            message = f"{self} required key '{H5Names.VECTORS_GROUP}' was not found in file."
-            raise KeyError(message)
+        h5f = self._get_file()
+        if H5Names.VECTORS_GROUP in h5f:
+            return list(file_handle_pool.get_derived(self.get_source(), "ids", lambda: tuple(h5f[H5Names.VECTORS_GROUP].keys()), owner=self))
+        if H5Names.VECTOR_MATRIX in h5f and H5Names.VECTOR_MATRIX_IDS in h5f:
+            return list(file_handle_pool.get_derived(self.get_source(), "ids", lambda: tuple(self._decode_matrix_ids(h5f)), owner=self))
+        message = f"{self} required key '{H5Names.VECTORS_GROUP}', or '{H5Names.VECTOR_MATRIX}' and '{H5Names.VECTOR_MATRIX_IDS}', was not found in file."
+        raise KeyError(message)
 
     def clear_cache(self) -> None:
-        """Clear cached data."""
+        """Clear cached data, and release the items derived from the file in the file handle pool."""
+        file_handle_pool.release_derived(self.get_source(), self)
         self._data = None
-        self._meta = None
-        self._index = None
+        self._vector_meta = None
+        self._vector_index = None
+        self._interned = {}
+        self._positions = {}
 
 
 class NVEYamlTimeVectoroader(NVETimeVectorLoader):
@@ -458,7 +872,15 @@ class NVEYamlTimeVectoroader(NVETimeVectorLoader):
 
     _SUPPORTED_SUFFIXES: ClassVar[list] = [".yaml", ".yml"]
 
-    def __init__(self, source: Path | str, require_whole_years: bool, relative_loc: Path | str | None = None, validate: bool = True) -> None:
+    def __init__(
+        self,
+        source: Path | str,
+        require_whole_years: bool,
+        relative_loc: Path | str | None = None,
+        validate: bool = True,
+        time_window: tuple[datetime | None, datetime | None] | None = None,
+        cache_dir: Path | str | None = None,
+    ) -> None:
         """
         Intitialize loader instance and connect it to an Yaml file containing time vector data.
 
@@ -467,23 +889,31 @@ class NVEYamlTimeVectoroader(NVETimeVectorLoader):
             require_whole_years (bool): Flag for validating that the time vectors in the source contain data for complete years.
             relative_loc (Path | str | None, optional): Path to excel file relative to source. Defaults to None.
             validate (bool, optional): Flag to turn on validation of timevectors. NB! Loads all data into memory at once. Defaults to True.
+            time_window (tuple[datetime | None, datetime | None] | None, optional): Start and end of the period the loader is limited to. Defaults to
+                                                                                   None.
+            cache_dir (Path | str | None, optional): Directory of a cache of parsed files. The values and indexes are memory-mapped from the cache, and
+                                                     the file is only parsed when it has changed. Defaults to None, which disables the cache.
 
         """
-        super().__init__(source, require_whole_years, relative_loc)
+        super().__init__(source, require_whole_years, relative_loc, time_window)
         self._content_ids: list[str] = None
 
-        self._values_label: str = None
-        self._index_label: str = None
+        self._datetimes: dict[str, pd.DatetimeIndex | None] = None
+        self._vector_index: dict[str, TimeIndex] = {}
+        self._raw_meta: dict = None
+        self._cache_dir = cache_dir
 
         if validate:
             self.validate_vectors()
 
-    def get_values(self, vector_id: str) -> NDArray:
+    def get_values(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> NDArray:
         """
         Get values of vector.
 
         Args:
             vector_id (str): Unique id of the curve in the Loader source.
+            start (datetime | None, optional): Only get values describing the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only get values describing the period until this point in time. Defaults to None.
 
         Returns:
             NDArray: Numpy array with values of vector.
@@ -491,29 +921,29 @@ class NVEYamlTimeVectoroader(NVETimeVectorLoader):
         """
         if self._data is None:
             self._parse_file()
-        values_list = self._data[vector_id][self._values_label]
-        if len(values_list) == 0:
+        values = self._data[vector_id]
+        if values.size == 0:
             message = f"Time vector {vector_id} in {self} contains no points."
             raise ValueError(message)
-        return np.asarray(values_list)
+        return values[self._get_positions(vector_id, start, end)]
 
-    def get_index(self, vector_id: str) -> TimeIndex:
+    def get_index(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> TimeIndex:
         """
         Get index of vector.
 
+        The index of the whole vector (limited by the time window of the Loader) is created once and cached.
+
         Args:
             vector_id (str): Unique id of the curve in the Loader source.
+            start (datetime | None, optional): Only describe the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only describe the period until this point in time. Defaults to None.
 
         Returns:
             NDArray: Numpy array with index of vector.
 
         """
         meta = self.get_metadata("")
-        try:
-            datetime_list = [self._date_to_datetime(index_val) for index_val in self._data[vector_id][self._index_label]]
-        except ValueError as e:
-            message = f"{self} got non date or none datetime values in index field of vector {vector_id}."
-            raise ValueError(message) from e
+        datetime_list = self._get_datetimes(vector_id)
 
         if len(datetime_list) == 0:
             message = f"Index of {vector_id} in {self} contains no points."
@@ -533,12 +963,23 @@ class NVEYamlTimeVectoroader(NVETimeVectorLoader):
             #     raise ValueError(message)
             return ConstantTimeIndex()
 
-        return ListTimeIndex(
-            datetime_list=datetime_list,
-            is_52_week_years=meta[TvMn.IS_52_WEEK_YEARS],
-            extrapolate_first_point=meta[TvMn.EXTRAPOLATE_FISRT_POINT],
-            extrapolate_last_point=meta[TvMn.EXTRAPOLATE_LAST_POINT],
-        )
+        if start is not None or end is not None:
+            return self._create_list_index(datetime_list[self._get_positions(vector_id, start, end)].tolist(), meta)
+        if vector_id not in self._vector_index:
+            self._vector_index[vector_id] = self._create_list_index(datetime_list[self._get_positions(vector_id)].tolist(), meta)
+        return self._vector_index[vector_id]
+
+    def _index_positions(self, vector_id: str, start: datetime | None, end: datetime | None) -> slice:
+        return self._list_positions(self._get_datetimes(vector_id), start, end)
+
+    def _get_datetimes(self, vector_id: str) -> pd.DatetimeIndex:
+        if self._data is None:
+            self._parse_file()
+        datetimes = self._datetimes[vector_id]
+        if datetimes is None:
+            message = f"{self} got non date or none datetime values in index field of vector {vector_id}."
+            raise ValueError(message)
+        return datetimes
 
     def get_metadata(self, vector_id: str) -> dict[str, bool | int | str | datetime | timedelta | tzinfo | None]:
         """
@@ -555,30 +996,77 @@ class NVEYamlTimeVectoroader(NVETimeVectorLoader):
 
         """
         if self._meta is None:
-            raw_meta = self._data[YamlNames.metadata_field][YamlNames.x_field]
-
-            self._meta = self._process_meta(raw_meta)
+            if self._data is None:
+                self._parse_file()
+            self._meta = self._process_meta(self._raw_meta)
         return self._meta
 
     def _get_ids(self) -> list[str]:
         if self._content_ids is None:
             if self._data is None:
                 self._parse_file()
-            ids_list = list(self._data.keys())
-            ids_list.remove(YamlNames.metadata_field)
-            self._content_ids = ids_list
+            self._content_ids = list(self._data.keys())
         return self._content_ids
 
     def _parse_file(self) -> None:
-        with self.get_source().open(encoding=YamlNames.encoding) as f:
-            d = yaml.safe_load(f)
-            self._x_meta = d[YamlNames.metadata_field][YamlNames.x_field]
-            self._y_meta = d[YamlNames.metadata_field][YamlNames.y_field]
+        """
+        Parse the file, converting the values and index of each vector to numpy arrays.
 
-            self._values_label = self._x_meta[YamlNames.attribute]
-            self._index_label = self._y_meta[YamlNames.attribute]
+        With a cache directory, the converted vectors are loaded from the sidecar cache if it is up to date, otherwise they are stored in it after
+        parsing. Cached values and indexes are concatenated in one memory-mapped array each, and the vectors are views of them.
 
-            self._data = d
+        """
+        cache = None if self._cache_dir is None else SidecarCache(self._cache_dir)
+        cached = None if cache is None else cache.load(self.get_source(), type(self).__name__)
+        if cached is not None:
+            self._unpack(*cached)
+            return
+
+        d = load_yaml(self.get_source())
+        values_label = d[YamlNames.metadata_field][YamlNames.x_field][YamlNames.attribute]
+        index_label = d[YamlNames.metadata_field][YamlNames.y_field][YamlNames.attribute]
+
+        self._raw_meta = d[YamlNames.metadata_field][YamlNames.x_field]
+        self._data = {}
+        self._datetimes = {}
+        for vector_id, vector in d.items():
+            if vector_id == YamlNames.metadata_field:
+                continue
+            try:
+                self._data[vector_id] = np.asarray(vector[values_label], dtype=float)
+            except (TypeError, ValueError) as e:
+                message = f"{self} got non numeric values in values field of vector {vector_id}."
+                raise ValueError(message) from e
+            try:
+                self._datetimes[vector_id] = pd.DatetimeIndex([self._date_to_datetime(index_val) for index_val in vector[index_label]])
+            except ValueError:
+                self._datetimes[vector_id] = None  # reported when the index is requested
+
+        if cache is not None:
+            cache.save(self.get_source(), type(self).__name__, *self._pack())
+
+    def _pack(self) -> tuple[dict[str, NDArray], tuple]:
+        """Concatenate the values and indexes of the vectors, for storing them in the sidecar cache."""
+        datetimes = {vector_id: pd.DatetimeIndex([]) if index is None else index for vector_id, index in self._datetimes.items()}
+        arrays = {
+            "values": np.concatenate([np.empty(0), *self._data.values()]),
+            "index": np.concatenate([np.empty(0, dtype="datetime64[ns]"), *(index.to_numpy(dtype="datetime64[ns]") for index in datetimes.values())]),
+        }
+        sizes = [(values.size, datetimes[vector_id].size) for vector_id, values in self._data.items()]
+        invalid_ids = {vector_id for vector_id, index in self._datetimes.items() if index is None}
+        return arrays, (list(self._data), sizes, invalid_ids, self._raw_meta)
+
+    def _unpack(self, arrays: dict[str, NDArray], content: tuple) -> None:
+        vector_ids, sizes, invalid_ids, self._raw_meta = content
+        self._data = {}
+        self._datetimes = {}
+        values_offset = index_offset = 0
+        for vector_id, (values_size, index_size) in zip(vector_ids, sizes, strict=True):
+            self._data[vector_id] = arrays["values"][values_offset : values_offset + values_size]
+            index = arrays["index"][index_offset : index_offset + index_size]
+            self._datetimes[vector_id] = None if vector_id in invalid_ids else pd.DatetimeIndex(index)
+            values_offset += values_size
+            index_offset += index_size
 
     def _date_to_datetime(self, value: date | datetime) -> datetime:
         if isinstance(value, date):
@@ -594,9 +1082,11 @@ class NVEYamlTimeVectoroader(NVETimeVectorLoader):
         self._meta = None
 
         self._content_ids = None
+        self._positions = {}
 
-        self._values_label = None
-        self._index_label = None
+        self._datetimes = None
+        self._vector_index = {}
+        self._raw_meta = None
 
 
 class NVEParquetTimeVectorLoader(NVETimeVectorLoader):
@@ -611,7 +1101,15 @@ class NVEParquetTimeVectorLoader(NVETimeVectorLoader):
 
     _SUPPORTED_SUFFIXES: ClassVar[list] = [".parquet"]
 
-    def __init__(self, source: Path | str, require_whole_years: bool, relative_loc: Path | str | None = None, validate: bool = True) -> None:
+    def __init__(
+        self,
+        source: Path | str,
+        require_whole_years: bool,
+        relative_loc: Path | str | None = None,
+        validate: bool = True,
+        memory_map: bool = False,
+        time_window: tuple[datetime | None, datetime | None] | None = None,
+    ) -> None:
         """
         Intitialize loader instance and connect it to an Parquet file containing time vector data.
 
@@ -619,85 +1117,271 @@ class NVEParquetTimeVectorLoader(NVETimeVectorLoader):
             source (Path | str): Absolute Path to database or parquet file.
             require_whole_years (bool): Flag for validating that the time vectors in the source contain data for complete years.
             relative_loc (Path | str | None, optional): Path to parquet file relative to source. Defaults to None.
-            validate (bool, optional): Flag to turn on validation of timevectors. NB! Loads all data into memory at once. Defaults to True.
+            validate (bool, optional): Flag to turn on validation of timevectors. The vectors are streamed in chunks of row groups. Defaults to True.
+            memory_map (bool, optional): Read the file through a memory map and keep the decoded Arrow buffers. Values read from a single row group
+                                         are then returned as read-only numpy views of the Arrow buffers instead of copies, while values spanning
+                                         several row groups are copied into one contiguous array. Defaults to False.
+            time_window (tuple[datetime | None, datetime | None] | None, optional): Start and end of the period the loader is limited to. Only the
+                                                                                   row groups overlapping it are read. Defaults to None.
 
         """
-        super().__init__(source, require_whole_years, relative_loc)
+        super().__init__(source, require_whole_years, relative_loc, time_window)
         self._index: TimeIndex = None
+        self._memory_map = memory_map
         if validate:
             self.validate_vectors()
 
-    def get_values(self, vector_id: str) -> NDArray:
+    def get_values(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> NDArray:
         """
         Get numpy array with all the values of a given vector in the Loader's parquet file.
 
         Args:
             vector_id (str): Unique id of the vector in the file.
+            start (datetime | None, optional): Only read values describing the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only read values describing the period until this point in time. Defaults to None.
 
         Returns:
-            NDArray: Numpy array with values.
+            NDArray: Numpy array with values. Read-only if the loader is in memory map mode.
+
+        """
+        return self.get_values_many([vector_id], start, end)[vector_id]
+
+    def get_values_many(self, vector_ids: list[str] | None = None, start: datetime | None = None, end: datetime | None = None) -> dict[str, NDArray]:
+        """
+        Get numpy arrays with the values of several vectors in the Loader's parquet file.
+
+        All vectors which are not already cached are read as columns of a single table read. Only the row groups overlapping the time window of the
+        loader or the call are read. Values read for a window given in the call are not cached.
+
+        Args:
+            vector_ids (list[str] | None, optional): IDs of the vectors to read. Defaults to None, which reads all vectors in the file.
+            start (datetime | None, optional): Only read values describing the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only read values describing the period until this point in time. Defaults to None.
+
+        Returns:
+            dict[str, NDArray]: Vector IDs mapped to numpy arrays with values.
 
         """
+        if vector_ids is None:
+            vector_ids = self.get_ids()
+        if start is not None or end is not None:
+            return self._read_values(list(dict.fromkeys(vector_ids)), self._get_positions("", start, end))
+
         if self._data is None:
             self._data = dict()
-        if vector_id not in self._data:
-            table = pq.read_table(self.get_source(), columns=[vector_id])
-            self._data[vector_id] = table[vector_id].to_numpy()
-        # if self._data is None:
-        #     self._data = pq.read_table(self.get_source())
-        return self._data[vector_id]  # .to_numpy()
+        missing_ids = [vector_id for vector_id in dict.fromkeys(vector_ids) if vector_id not in self._data]
+        if missing_ids:
+            self._data.update(self._read_values(missing_ids, self._get_positions("")))
+        return {vector_id: self._data[vector_id] for vector_id in vector_ids}
+
+    def _read_values(self, vector_ids: list[str], positions: slice) -> dict[str, NDArray]:
+        table = self._read_table(vector_ids, positions)
+        if self._memory_map:
+            return self._arrow_views(table)
+        return {vector_id: table[vector_id].to_numpy() for vector_id in vector_ids}
+
+    def _read_table(self, columns: list[str], positions: slice) -> pa.Table:
+        """Read columns of the rows at the given positions, decoding only the row groups containing them."""
+        parquet_file = self._get_parquet_file()
+        if positions == slice(None):
+            return parquet_file.read(columns=columns)
+
+        lower, upper, __ = positions.indices(parquet_file.metadata.num_rows)
+        if lower >= upper:
+            return parquet_file.schema_arrow.empty_table().select(columns)
+
+        row_groups, offset = self._get_row_groups(parquet_file.metadata, lower, upper)
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+        return table.slice(lower - offset, upper - lower)
+
+    @staticmethod
+    def _get_row_groups(metadata: pq.FileMetaData, lower: int, upper: int) -> tuple[list[int], int]:
+        """Get the row groups containing the rows from lower to upper, and the position of the first row of the first of them."""
+        offsets = np.cumsum([0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)])
+        first_group = int(np.searchsorted(offsets, lower, side="right")) - 1
+        last_group = int(np.searchsorted(offsets, upper, side="left")) - 1
+        return list(range(first_group, last_group + 1)), int(offsets[first_group])
+
+    def iter_chunks(self, vector_ids: str | list[str] | None = None, chunk_size: int | None = None) -> Iterator[dict[str, NDArray]]:
+        """
+        Iterate over the values of vectors in chunks along the time dimension.
+
+        Batches of rows are streamed from the row groups in the time window of the loader, so only one row group is decoded at a time. Vectors which are
+        already cached are sliced from the cache.
+
+        Args:
+            vector_ids (str | list[str] | None, optional): ID or IDs of the vectors to iterate over. Defaults to None, which iterates over all vectors in
+                                                          the file.
+            chunk_size (int | None, optional): Maximum number of values of each vector in a chunk. Defaults to None, which uses the chunk size of the
+                                               Loader class.
+
+        Yields:
+            dict[str, NDArray]: Vector IDs mapped to the values of the chunk.
+
+        """
+        vector_ids, chunk_size = self._check_chunk_args(vector_ids, chunk_size)
+        if self._data is not None and all(vector_id in self._data for vector_id in vector_ids):
+            yield from super().iter_chunks(vector_ids, chunk_size)
+            return
+
+        parquet_file = self._get_parquet_file()
+        lower, upper, __ = self._get_positions("").indices(parquet_file.metadata.num_rows)
+        if lower >= upper:
+            return
+
+        row_groups, position = self._get_row_groups(parquet_file.metadata, lower, upper)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, row_groups=row_groups, columns=vector_ids):
+            batch_lower, batch_upper = max(lower - position, 0), min(upper - position, batch.num_rows)
+            position += batch.num_rows
+            if batch_lower < batch_upper:
+                batch = batch.slice(batch_lower, batch_upper - batch_lower)
+                yield {vector_id: batch.column(vector_id).to_numpy(zero_copy_only=False) for vector_id in vector_ids}
+
+    @staticmethod
+    def _arrow_views(table: pa.Table) -> dict[str, NDArray]:
+        """
+        Get read-only numpy views of the Arrow buffers of the columns in a table read through a memory map.
+
+        The views keep a reference to the Arrow buffers they are created from, so the buffers live as long as the cached arrays. Only columns decoded into
+        a single chunk, i.e. read from a single row group, can be viewed. Columns spanning several row groups, and columns which cannot be viewed
+        without a copy (e.g. if they contain nulls), are copied once into a read-only array, one column at a time to limit the peak memory use.
 
-    def get_index(self, vector_id: str) -> TimeIndex:  # Could be more types of indexes?
+        """
+        views = {}
+        for vector_id in table.column_names:
+            column = table.column(vector_id)
+            if column.num_chunks != 1:
+                values = column.to_numpy()
+            else:
+                try:
+                    values = column.chunk(0).to_numpy(zero_copy_only=True)
+                except pa.ArrowInvalid:
+                    values = column.chunk(0).to_numpy(zero_copy_only=False)
+            values.flags.writeable = False
+            views[vector_id] = values
+        return views
+
+    def get_index(self, vector_id: str, start: datetime | None = None, end: datetime | None = None) -> TimeIndex:  # Could be more types of indexes?
         """
         Get the TimeIndex describing the time dimension of the vectors in the file.
 
         Args:
             vector_id (str): Not used since all vectors in the NVE parquet files have the same index.
+            start (datetime | None, optional): Only describe the period from this point in time. Defaults to None.
+            end (datetime | None, optional): Only describe the period until this point in time. Defaults to None.
 
         Returns:
             TimeIndex: TimeIndex object describing the parquet file's index.
 
         """
-        if self._index is None:
+        windowed = start is not None or end is not None
+        if self._index is None or windowed:
             meta = self.get_metadata("")
+            positions = self._get_positions("", start, end)
 
-            if TvMn.FREQUENCY not in meta or (TvMn.FREQUENCY in meta and meta[TvMn.FREQUENCY] is None):
+            regular_index = self._get_regular_index(meta)
+            if regular_index is None:
                 datetime_index = pd.DatetimeIndex(
-                    pd.read_parquet(self.get_source(), columns=[TvMn.DATETIME_COL])[TvMn.DATETIME_COL],
+                    self._read_table([TvMn.DATETIME_COL], positions).column(TvMn.DATETIME_COL).to_pandas(),
                     tz=meta[TvMn.TIMEZONE],
                 ).tolist()
-                self._index = ListTimeIndex(
-                    datetime_list=datetime_index,
-                    is_52_week_years=meta[TvMn.IS_52_WEEK_YEARS],
-                    extrapolate_first_point=meta[TvMn.EXTRAPOLATE_FISRT_POINT],
-                    extrapolate_last_point=meta[TvMn.EXTRAPOLATE_LAST_POINT],
-                )
-                return self._index
-
-            parquet_file = None
-            if TvMn.START not in meta or (TvMn.START in meta and meta[TvMn.START] is None):
-                parquet_file = pq.ParquetFile(self.get_source())
-                start = pd.to_datetime(next(parquet_file.iter_batches(batch_size=1, columns=[TvMn.DATETIME_COL])))
+                index = self._create_list_index(datetime_index, meta)
             else:
-                start = meta[TvMn.START]
+                first, frequency, num_points = regular_index
+                index = self._create_fixed_frequency_index(first, frequency, num_points, positions, meta)
 
-            if TvMn.NUM_POINTS not in meta or (TvMn.NUM_POINTS in meta and meta[TvMn.NUM_POINTS] is None):
-                if parquet_file is None:
-                    parquet_file = pq.ParquetFile(self.get_source())
-                num_points = parquet_file.metadata.num_rows
-            else:
-                num_points = meta[TvMn.NUM_POINTS]
-            self._index = FixedFrequencyTimeIndex(
-                start,
-                meta[TvMn.FREQUENCY],
-                num_points,
-                is_52_week_years=meta[TvMn.IS_52_WEEK_YEARS],
-                extrapolate_first_point=meta[TvMn.EXTRAPOLATE_FISRT_POINT],
-                extrapolate_last_point=meta[TvMn.EXTRAPOLATE_LAST_POINT],
-            )
+            if windowed:
+                return index
+            self._index = index
 
         return self._index
 
+    def _index_positions(self, vector_id: str, start: datetime | None, end: datetime | None) -> slice:
+        meta = self.get_metadata(vector_id)
+        regular_index = self._get_regular_index(meta)
+        if regular_index is None:
+            return self._list_positions_from_statistics(meta, start, end)
+        return self._fixed_frequency_positions(*regular_index, start, end)
+
+    def _get_regular_index(self, meta: dict) -> tuple[datetime, timedelta, int] | None:
+        """
+        Get start, frequency and number of points of the file's index if it has a fixed frequency.
+
+        The frequency is taken from the metadata. If it is not defined, the DateTime column is checked for evenly spaced points, so only truly irregular
+        indexes are described by a list of points.
+
+        """
+        if meta.get(TvMn.FREQUENCY) is not None:
+            first, num_points = self._get_start_and_num_points(meta)
+            return first, meta[TvMn.FREQUENCY], num_points
+
+        detected = file_handle_pool.get_derived(self.get_source(), "regular_index", lambda: self._detect_regular_index(meta[TvMn.TIMEZONE]), owner=self)
+        if detected is None:
+            return None
+        first, frequency = detected
+        return first, frequency, self._get_parquet_file().metadata.num_rows
+
+    def _detect_regular_index(self, tz: tzinfo | None) -> tuple[pd.Timestamp, pd.Timedelta] | None:
+        """Get the first point and the spacing of the DateTime column if its points are evenly spaced, otherwise None."""
+        column = self._get_parquet_file().read(columns=[TvMn.DATETIME_COL]).column(TvMn.DATETIME_COL)
+        if len(column) < 2:  # noqa: PLR2004
+            return None
+        steps = np.diff(column.to_numpy().astype("datetime64[ns]").view(np.int64))
+        if steps[0] <= 0 or np.any(steps != steps[0]):
+            return None
+        first = pd.DatetimeIndex([column[0].as_py()], tz=tz)[0]
+        return first, pd.Timedelta(int(steps[0]), unit="ns")
+
+    def _get_start_and_num_points(self, meta: dict) -> tuple[datetime, int]:
+        """Get start and number of points of a fixed frequency index from metadata, or from the file where they are not defined."""
+        if meta.get(TvMn.START) is None:
+            start = file_handle_pool.get_derived(self.get_source(), "start", lambda: self._read_first_datetime(meta[TvMn.TIMEZONE]), owner=self)
+        else:
+            start = meta[TvMn.START]
+        num_points = self._get_parquet_file().metadata.num_rows if meta.get(TvMn.NUM_POINTS) is None else meta[TvMn.NUM_POINTS]
+        return start, num_points
+
+    def _read_first_datetime(self, tz: tzinfo | None) -> pd.Timestamp:
+        """Get the first point of the DateTime column in the time zone of the file."""
+        batch = next(self._get_parquet_file().iter_batches(batch_size=1, columns=[TvMn.DATETIME_COL]))
+        return pd.DatetimeIndex([batch.column(0)[0].as_py()], tz=tz)[0]
+
+    def _list_positions_from_statistics(self, meta: dict, start: datetime | None, end: datetime | None) -> slice:
+        """
+        Get the positions of the points in the DateTime column describing the period between start and end.
+
+        The min and max statistics of the row groups are used to only read the DateTime column of the row groups which can contain the bounding points.
+        All row groups are read if the file lacks statistics.
+
+        """
+        parquet_file = self._get_parquet_file()
+        metadata = parquet_file.metadata
+        column = parquet_file.schema.names.index(TvMn.DATETIME_COL)
+        statistics = [metadata.row_group(i).column(column).statistics for i in range(metadata.num_row_groups)]
+        offsets = np.cumsum([0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)])
+
+        first_group, last_group = 0, metadata.num_row_groups - 1
+        if all(s is not None and s.has_min_max for s in statistics):
+            minimums = pd.DatetimeIndex([s.min for s in statistics], tz=meta[TvMn.TIMEZONE])
+            maximums = pd.DatetimeIndex([s.max for s in statistics], tz=meta[TvMn.TIMEZONE])
+            aligned_start = self._align_timestamp(start, minimums.tz)
+            aligned_end = self._align_timestamp(end, maximums.tz)
+            if aligned_start is not None:
+                first_group = max(int(minimums.searchsorted(aligned_start, side="right")) - 1, 0)
+            if aligned_end is not None:
+                last_group = min(int(maximums.searchsorted(aligned_end, side="left")), last_group)
+            last_group = max(first_group, last_group)
+
+        datetimes = pd.DatetimeIndex(
+            parquet_file.read_row_groups(list(range(first_group, last_group + 1)), columns=[TvMn.DATETIME_COL]).column(TvMn.DATETIME_COL).to_pandas(),
+            tz=meta[TvMn.TIMEZONE],
+        )
+        local = self._list_positions(datetimes, start, end)
+        if local.start >= local.stop:
+            return slice(0, 0)
+        offset = int(offsets[first_group])
+        return slice(offset + local.start, offset + local.stop)
+
     def get_metadata(self, vector_id: str) -> dict[str, bool | int | str | datetime | timedelta | tzinfo | None]:
         """
         Retrieve and decodes custom metadata from parquet file.
@@ -713,20 +1397,23 @@ class NVEParquetTimeVectorLoader(NVETimeVectorLoader):
 
         """
         if self._meta is None:
-            path = self.get_source()
-            raw_meta = pq.ParquetFile(path).schema_arrow.metadata
+            raw_meta = self._get_parquet_file().schema_arrow.metadata
 
             self._meta = self._process_meta(raw_meta)
         return self._meta
 
+    def _get_parquet_file(self) -> pq.ParquetFile:
+        return file_handle_pool.get_parquet_file(self.get_source(), memory_map=self._memory_map)
+
     def _get_ids(self) -> list[str]:
-        parquet_file = pq.ParquetFile(self.get_source())
-        time_vector_ids: list[str] = parquet_file.schema_arrow.names
+        time_vector_ids: list[str] = self._get_parquet_file().schema_arrow.names
         time_vector_ids.remove(TvMn.DATETIME_COL)
         return time_vector_ids
 
     def clear_cache(self) -> None:
-        """Clear cached data."""
+        """Clear cached data, and release the items derived from the file in the file handle pool."""
+        file_handle_pool.release_derived(self.get_source(), self)
         self._data = None
         self._meta = None
         self._index = None
+        self._positions = {}
@@ -1,5 +1,8 @@
 """Contain the NVEEnergyModelPopulator class."""
 
+import threading
+from collections.abc import Callable
+from datetime import datetime
 from pathlib import Path
 from time import time
 from typing import ClassVar
@@ -32,7 +35,12 @@ from framdata.database_names.TransmissionNames import TransmissionNames
 from framdata.database_names.WindSolarNames import SolarNames, WindNames
 from framdata.populators._DatabaseInterpreter import _DatabaseInterpreter
 from framdata.populators._DataObjectManager import _DataObjectManager
+from framdata.populators._FileManifest import _FileManifest
+from framdata.populators._PopulateSnapshot import _PopulateSnapshot
+from framdata.populators._TaskRunner import _TaskRunner
+from framdata.populators._ValidationCache import _ValidationCache
 from framdata.populators.NVEPathManager import NVEPathManager
+from framdata.populators.ValidationReport import ValidationReport
 
 
 class NVEEnergyModelPopulator(Populator):
@@ -107,6 +115,15 @@ class NVEEnergyModelPopulator(Populator):
         self,
         source: NVEPathManager | Path | str,  # take path to db instead?
         validate: bool = True,
+        preload: bool = False,
+        memory_map: bool = False,
+        horizon: tuple[datetime, datetime] | None = None,
+        cache_dir: Path | str | None = None,
+        background_validation: bool = False,
+        executor: str | None = None,
+        max_workers: int | None = None,
+        incremental: bool = False,
+        warm_start: bool = False,
     ) -> None:
         """
         Initialize instance and set up obejcts and attributes used by this class.
@@ -119,17 +136,79 @@ class NVEEnergyModelPopulator(Populator):
             source (Path): path manager to a database hierarchy where each database follows the
                            structure defined by DatabaseNames.
             validate (bool): Toggle data validation.
+            preload (bool): Read all vectors of each time vector file into memory in a single pass when its time vectors are created.
+            memory_map (bool): Read time vector files through memory maps and share their buffers instead of copying values where supported.
+            horizon (tuple[datetime, datetime] | None): Start and end of the model horizon. Time vectors are only read and validated for the period
+                                                         they need to describe it.
+            cache_dir (Path | str | None): Directory of a binary cache of parsed Excel and YAML time vector files, which are then only parsed when
+                                           they change, and of validation results of time vector files and attribute tables, which are then only
+                                           validated when they change. Disabled if None.
+            background_validation (bool): Validate time vector files and attribute tables on worker threads while the model is built, instead of
+                                          before the objects of each file are created. The results are collected in the report returned by
+                                          get_validation_report, which must be checked before the model is used. The populator owns the report,
+                                          whose worker threads are released once it has been checked or waited for.
+            executor (str | None): Process the time vector, curve and attribute files in parallel, on a 'thread' pool (suited for parquet and HDF5
+                                   files) or a 'process' pool (suited for Excel files and validation of attribute tables). Files are processed largest
+                                   first, and results and debug events are merged in the same order as when processed serially. Defaults to None,
+                                   which processes the files serially.
+            max_workers (int | None): Maximum number of workers of the executor. Defaults to None, which uses the default of the executor.
+            incremental (bool): Keep a manifest of the fingerprints (size and modification time) of the database files and the objects created from
+                                them. When populate is called again, only the time vectors and curves of changed files, and the components and
+                                attribute objects of changed files or referencing objects of changed files, are created again. Other objects are
+                                reused. Defaults to False.
+            warm_start (bool): Store a snapshot of the populated objects in cache_dir, with references to their loaders but not the loaded data.
+                               While the database files (by path, size and modification time), the framdata version and the arguments of the
+                               populator are unchanged, populate restores the snapshot instead of creating the objects. Snapshots are not stored
+                               while background validation is unfinished or has found errors. Requires cache_dir. Defaults to False.
+
+        Raises:
+            ValueError: If warm_start is enabled without a cache_dir.
 
         """
         super().__init__()
+        if warm_start and cache_dir is None:
+            message = "warm_start requires a cache_dir to store snapshots of the populated objects in."
+            raise ValueError(message)
         self._source: Path = self._set_source(source)
         self._validate = validate
+        self._validation_report = ValidationReport() if validate and background_validation else None
         self.database_interpreter = _DatabaseInterpreter(self._source)
-        self.data_object_manager = _DataObjectManager(validate=self._validate)
+        self.data_object_manager = _DataObjectManager(
+            validate=self._validate,
+            preload=preload,
+            memory_map=memory_map,
+            time_window=horizon,
+            cache_dir=cache_dir,
+            validation_report=self._validation_report,
+        )
 
         self._attribute_objects: dict[str, Component | TimeVector | Curve | Expr | None] = {}
         self._data: dict[str, Component | TimeVector | Curve | Expr] = {}
         self._validation_errors: dict[str, dict[str, pd.DataFrame]] = {}
+        self._validation_errors_lock = threading.Lock()  # errors are also added by background validation threads
+        self._validation_cache = None if cache_dir is None else _ValidationCache(cache_dir)
+        self._task_runner = _TaskRunner(executor, max_workers)
+
+        self._incremental = incremental
+        self._manifest = _FileManifest()
+        self._file_objects: dict[Path, dict[str, TimeVector | Curve]] = {}
+        self._table_objects: dict[str, tuple[pd.DataFrame, pd.DataFrame, Path, list[tuple[dict, set[str]]], list[set[str]]]] = {}
+        self._changed_ids: set[str] = set()
+
+        self._snapshot = _PopulateSnapshot(cache_dir) if warm_start else None
+        self._snapshot_options = (type(self).__qualname__, str(self._source), validate, preload, memory_map, horizon)
+        self._registrations: list[tuple[str, tuple]] = []
+        self._registered: set[tuple] = set()
+
+    def get_validation_report(self) -> ValidationReport | None:
+        """
+        Get the report of validation running in the background.
+
+        Returns:
+            ValidationReport | None: The report, or None if the populator does not validate in the background.
+
+        """
+        return self._validation_report
 
     def _set_source(self, source: NVEPathManager | Path | str) -> Path:
         self._check_type(source, (NVEPathManager, Path, str))
@@ -139,6 +218,64 @@ class NVEEnergyModelPopulator(Populator):
         return Path(path)
 
     def _populate(self) -> dict[str, Component | TimeVector | Curve | Expr]:
+        self._registrations = []
+        if self._snapshot is None:
+            return self._populate_database()
+
+        key = self._snapshot.get_key(self._get_database_paths(), self._snapshot_options)
+        snapshot = self._snapshot.load(key)
+        if snapshot is not None:
+            self._data, registrations = snapshot
+            for method, args in registrations:
+                getattr(self, method)(*args)
+            return self._data
+
+        data = self._populate_database()
+        if self._validation_report is not None and not (self._validation_report.done() and not self._validation_report.get_errors()):
+            self.send_debug_event("Background validation is unfinished or found errors, skipping snapshot of populated objects.")
+        else:
+            self._snapshot.save(key, (data, self._registrations))
+        return data
+
+    def _register_id(self, new_id: str, location: Path | str) -> None:
+        self._registrations.append(("_register_id", (new_id, location)))
+        if self._is_new_registration("_register_id", new_id, location):
+            super()._register_id(new_id, location)
+
+    def _register_references(self, id_key: str, refs: set[str]) -> None:
+        self._registrations.append(("_register_references", (id_key, refs)))
+        if self._is_new_registration("_register_references", id_key, frozenset(refs)):
+            super()._register_references(id_key, refs)
+
+    def _is_new_registration(self, *registration: object) -> bool:
+        """Check whether an ID or its references are registered for the first time, so objects reused when populate is called again are not."""
+        if registration in self._registered:
+            return False
+        self._registered.add(registration)
+        return True
+
+    def _get_database_paths(self) -> list[Path | None]:
+        """Get the paths to all files the objects are created from, or None for files which do not exist."""
+        database_ids = [database_id for database_id, __ in self._TIME_VECTOR_LIST] + self._CURVE_LIST + [*self._ATTRIBUTES_DICT, *self._COMPONENT_DICT]
+        paths = []
+        for database_id in database_ids:
+            source, relative_loc = self.database_interpreter.get_source_and_relative_loc(database_id)
+            paths.append(None if relative_loc is None else source / relative_loc)
+        return paths
+
+    def _populate_database(self) -> dict[str, Component | TimeVector | Curve | Expr]:
+        if not self._incremental:
+            return self._populate_all()
+
+        self._manifest.discard()
+        self._changed_ids = set()
+        self._data = {}
+        data = self._populate_all()
+        self._manifest.commit()
+        self.send_debug_event(f"Created objects again for {len(self._changed_ids)} changed IDs.")
+        return data
+
+    def _populate_all(self) -> dict[str, Component | TimeVector | Curve | Expr]:
         t0 = time()
         t = time()
         self._populate_time_vectors()
@@ -167,40 +304,58 @@ class NVEEnergyModelPopulator(Populator):
     def _populate_time_vectors(self) -> None:
         """Create TimeVector objects and add them to the self._data dictionary."""
         self.send_debug_event("-------- TIME VECTORS --------")
+        entries = []
         for timevector_tuple in self._TIME_VECTOR_LIST:
             database_id, require_whole_years = timevector_tuple
-            self.send_debug_event(f"---- {database_id} ----")
             source, relative_loc = self.database_interpreter.get_source_and_relative_loc(database_id)
 
             if relative_loc is None:
                 self.send_info_event(f"Could not find time vector file {database_id} in {source}. Skipping..")
                 continue
+            entries.append((database_id, source / relative_loc, self.data_object_manager.create_time_vectors, (source, relative_loc, require_whole_years)))
 
-            t = time()
-            time_vectors = self.data_object_manager.create_time_vectors(source, relative_loc, require_whole_years)
-            self.send_debug_event(f"Create {database_id} time vectors time: {round(time() - t, 3)}")
-
-            for new_id in time_vectors:
-                self._register_id(new_id, source / relative_loc)
-            self._data.update(time_vectors)
+        self._create_file_objects(entries, "time vectors")
 
     def _populate_curves(self) -> None:
         """Create TimeVector objects and add them to the self._data dictionary."""
         self.send_debug_event("-------- CURVES --------")
+        entries = []
         for database_id in self._CURVE_LIST:
-            self.send_debug_event(f"---- {database_id} ----")
             source, relative_loc = self.database_interpreter.get_source_and_relative_loc(database_id)
             if relative_loc is None:
                 self.send_info_event(f"Could not find curve file {database_id} in {source}. Skipping..")
                 continue
+            entries.append((database_id, source / relative_loc, self.data_object_manager.create_curves, (source, relative_loc)))
 
-            t = time()
-            curves = self.data_object_manager.create_curves(source, relative_loc)
-            self.send_debug_event(f"Create {database_id} curves time: {round(time() - t, 3)}")
+        self._create_file_objects(entries, "curves")
 
-            for new_id in curves:
-                self._register_id(new_id, source / relative_loc)
-            self._data.update(curves)
+    def _create_file_objects(self, entries: list[tuple[str, Path, Callable, tuple]], object_type: str) -> None:
+        """Create the time vectors or curves of each file, or reuse the objects of files which are unchanged since the last run in incremental mode."""
+        reused = {path for __, path, __, __ in entries if self._is_unchanged(path) and path in self._file_objects}
+        tasks = [(function, args, path) for __, path, function, args in entries if path not in reused]
+        results = iter(self._task_runner.run(tasks))
+
+        for database_id, path, __, __ in entries:
+            self.send_debug_event(f"---- {database_id} ----")
+            if path in reused:
+                objects = self._file_objects[path]
+                self.send_debug_event(f"Reusing {database_id} {object_type}, file is unchanged.")
+            else:
+                result = next(results)
+                result.replay_events(self)
+                objects = result.get()
+                self.send_debug_event(f"Create {database_id} {object_type} time: {round(result.seconds, 3)}")
+                if self._incremental:
+                    self._changed_ids.update(objects, self._file_objects.get(path, {}))
+                    self._file_objects[path] = objects
+
+            for new_id in objects:
+                self._register_id(new_id, path)
+            self._data.update(objects)
+
+    def _is_unchanged(self, path: Path) -> bool:
+        """Check whether a file is unchanged since the last run in incremental mode. Always False if not incremental."""
+        return self._incremental and self._manifest.is_unchanged(path)
 
     def _populate_topology_objects(
         self,
@@ -209,16 +364,54 @@ class NVEEnergyModelPopulator(Populator):
     ) -> dict[str, Component | tuple[object, dict]]:  # return components or tuples with attribute object and metadata.
         """Create Component or Attribute objects and add them to the self._data dictionary."""
         self.send_debug_event(f"-------- {object_type} --------")
-        files_map = self._read_components_data(names_mapping)
+        unchanged = self._get_unchanged_tables(names_mapping)
+        changed_mapping = {database_id: names for database_id, names in names_mapping.items() if database_id not in unchanged}
+        files_map = self._read_components_data(changed_mapping)
         if self._validate:
-            self._validate_files(files_map, names_mapping)
+            self._validate_files(files_map, {database_id: names for database_id, names in changed_mapping.items() if database_id in files_map})
+
+        for database_id in unchanged:
+            files_map[database_id] = self._table_objects[database_id][:3]
+            self.send_debug_event(f"Reusing {database_id} data, file is unchanged.")
+        return self._create_topology_objects(files_map, names_mapping, unchanged)
+
+    def _get_unchanged_tables(self, names_map: dict[str, _BaseComponentsNames]) -> set[str]:
+        """
+        Find the attribute files which are unchanged since the last run in incremental mode.
+
+        The IDs of the objects created from changed files in the last run are added to the changed IDs. Then the IDs of objects in unchanged files
+        depending on changed IDs, directly or through other objects in the files, are added until no more are found.
 
-        return self._create_topology_objects(files_map, names_mapping)
+        """
+        if not self._incremental:
+            return set()
+
+        unchanged = set()
+        for database_id in names_map:
+            source, relative_loc = self.database_interpreter.get_source_and_relative_loc(database_id)
+            # fingerprint every file, also those without objects from the last run, so they can be reused in the next run
+            is_unchanged = relative_loc is not None and self._is_unchanged(source / relative_loc)
+            if is_unchanged and database_id in self._table_objects:
+                unchanged.add(database_id)
+            elif database_id in self._table_objects:
+                self._changed_ids.update(*(component for component, __ in self._table_objects[database_id][3]))
+
+        found_changed = True
+        while found_changed:
+            found_changed = False
+            for database_id in unchanged:
+                __, __, __, component_returns, dependencies = self._table_objects[database_id]
+                for (component, __), depends_on in zip(component_returns, dependencies, strict=True):
+                    if not depends_on.isdisjoint(self._changed_ids) and not component.keys() <= self._changed_ids:
+                        self._changed_ids.update(component)
+                        found_changed = True
+        return unchanged
 
     def _create_topology_objects(
         self,
         files_map: dict[str, tuple[pd.DataFrame, pd.DataFrame]],
         names_map: dict[str, _BaseComponentsNames],
+        unchanged: set[str] | None = None,
     ) -> dict[str, Component]:
         components = {}
         self.send_info_event("Creating objects for Model...")
@@ -226,7 +419,16 @@ class NVEEnergyModelPopulator(Populator):
         for database_id, component_names in names_map.items():
             component_df, meta_df, relative_loc = files_map[database_id]
 
-            component_returns = self._get_components(component_df, component_names, meta_df)
+            if unchanged is not None and database_id in unchanged:
+                component_returns = self._update_components(database_id, component_df, component_names, meta_df)
+            else:
+                component_returns = self._get_components(component_df, component_names, meta_df)
+                if self._incremental:
+                    self._changed_ids.update(*(component for component, __ in component_returns))
+
+            if self._incremental:
+                dependencies = self._get_dependencies(component_df, component_returns)
+                self._table_objects[database_id] = (component_df, meta_df, relative_loc, component_returns, dependencies)
 
             for component, refs in component_returns:
                 id_key = next(iter(component))
@@ -237,16 +439,46 @@ class NVEEnergyModelPopulator(Populator):
         self.send_debug_event(f"Created objects in {round(time() - t, 3)} s")
         return components
 
+    def _get_dependencies(self, df: pd.DataFrame, component_returns: list[tuple[dict, set[str]]]) -> list[set[str]]:
+        """Get the IDs each object depends on, which are its references and the IDs of the attribute objects held by it."""
+        return [
+            refs | {value for value in row if isinstance(value, str) and value in self._attribute_objects}
+            for row, (__, refs) in zip(df.to_numpy(dtype=object), component_returns, strict=True)
+        ]
+
+    def _update_components(
+        self,
+        database_id: str,
+        df: pd.DataFrame,
+        component_names: _BaseComponentsNames,
+        meta_data: pd.DataFrame,
+    ) -> list[tuple[dict[str, Component | tuple[object, dict[str, Meta]]], set[str]]]:
+        """Reuse the objects of an unchanged file from the last run, and create the objects whose IDs are changed again from their rows."""
+        component_returns = list(self._table_objects[database_id][3])
+        rows = [i for i, (component, __) in enumerate(component_returns) if not component.keys().isdisjoint(self._changed_ids)]
+        if rows:
+            self.send_debug_event(f"Creating {len(rows)} objects of {database_id} again, they reference changed objects.")
+            for i, component_return in zip(rows, self._get_components(df.iloc[rows], component_names, meta_data), strict=True):
+                component_returns[i] = component_return
+        return component_returns
+
     def _read_components_data(self, names_map: dict[str, _BaseComponentsNames]) -> dict[str, tuple[pd.DataFrame, pd.DataFrame]]:
         files_map: dict[str, tuple[pd.DataFrame, pd.DataFrame]] = {}
         self.send_info_event("Reading database files...")
         t = time()
+        database_ids, relative_locs, tasks = [], [], []
         for database_id in names_map:
             source, relative_loc = self.database_interpreter.get_source_and_relative_loc(database_id)
             if relative_loc is None:
                 self.send_info_event(f"Could not find attribute file {database_id} in {source}. Skipping..")
                 continue
-            files_map[database_id] = (*self.database_interpreter.read_attribute_table(database_id), relative_loc)
+            database_ids.append(database_id)
+            relative_locs.append(relative_loc)
+            tasks.append((self.database_interpreter.read_attribute_table, (database_id,), source / relative_loc))
+
+        for database_id, relative_loc, result in zip(database_ids, relative_locs, self._task_runner.run(tasks), strict=True):
+            result.replay_events(self)
+            files_map[database_id] = (*result.get(), relative_loc)
 
         self.send_debug_event(f"Read files in {round(time() - t, 3)} s")
         return files_map
@@ -254,16 +486,33 @@ class NVEEnergyModelPopulator(Populator):
     def _validate_files(self, files_map: dict[str, tuple[pd.DataFrame, pd.DataFrame]], names_map: dict[str, _BaseComponentsNames]) -> None:
         self.send_info_event("Validating database files...")
         t = time()
+        relative_locs, tasks = [], []
         for database_id, names_class in names_map.items():
             component_df, meta_df, relative_loc = files_map[database_id]
 
-            errors = NVEEnergyModelPopulator._validate_component_data(names_class, component_df, meta_df)
-            if errors:
-                self._validation_errors[relative_loc] = errors
+            if self._validation_report is not None:
+                self._validation_report.submit(str(relative_loc), self._check_component_file, database_id, names_class, component_df, meta_df, relative_loc)
                 continue
 
-        if self._validation_errors:
-            warnings, message = NVEEnergyModelPopulator._format_error_message(self._validation_errors)
+            path = self.database_interpreter.get_filepath(database_id)
+            relative_locs.append(relative_loc)
+            tasks.append((NVEEnergyModelPopulator._validate_table, (self._validation_cache, path, names_class, component_df, meta_df), path))
+
+        if self._validation_report is not None:
+            self.send_debug_event(f"Submitted files for background validation in {round(time() - t, 3)} s")
+            return
+
+        for relative_loc, result in zip(relative_locs, self._task_runner.run(tasks), strict=True):
+            result.replay_events(self)
+            errors = result.get()
+            if errors:
+                with self._validation_errors_lock:
+                    self._validation_errors[relative_loc] = errors
+
+        with self._validation_errors_lock:
+            validation_errors = dict(self._validation_errors)
+        if validation_errors:
+            warnings, message = NVEEnergyModelPopulator._format_error_message(validation_errors)
             if warnings:
                 self.send_warning_event(message)
             else:
@@ -271,6 +520,46 @@ class NVEEnergyModelPopulator(Populator):
 
         self.send_debug_event(f"Validated files in {round(time() - t, 3)} s")
 
+    def _check_component_file(
+        self,
+        database_id: str,
+        names_class: _BaseComponentsNames,
+        component_df: pd.DataFrame,
+        meta_df: pd.DataFrame,
+        relative_loc: Path,
+    ) -> str | None:
+        """Validate a component file in the background. Return a message with the warnings found, or raise the errors found."""
+        path = self.database_interpreter.get_filepath(database_id)
+        errors = NVEEnergyModelPopulator._validate_table(self._validation_cache, path, names_class, component_df, meta_df)
+        if not errors:
+            return None
+        with self._validation_errors_lock:
+            self._validation_errors[relative_loc] = errors
+        warnings, message = NVEEnergyModelPopulator._format_error_message({relative_loc: errors})
+        if not warnings:
+            raise ValueError(message)
+        return message
+
+    @staticmethod
+    def _validate_table(
+        validation_cache: _ValidationCache | None,
+        path: Path,
+        names_class: _BaseComponentsNames,
+        component_df: pd.DataFrame,
+        meta_df: pd.DataFrame,
+    ) -> dict[str, pd.DataFrame]:
+        """Validate the tables of a component file, or reuse the stored validation errors of the file if it is unchanged."""
+        if validation_cache is None:
+            return NVEEnergyModelPopulator._validate_component_data(names_class, component_df, meta_df)
+
+        validator = f"{names_class.__name__}:{names_class.VALIDATION_VERSION}"
+        result = validation_cache.get(path, validator, ())
+        if result is None:
+            errors = NVEEnergyModelPopulator._validate_component_data(names_class, component_df, meta_df)
+            result = (not errors, errors)
+            validation_cache.put(path, validator, (), *result)
+        return result[1]
+
     def _get_components(
         self,
         df: pd.DataFrame,
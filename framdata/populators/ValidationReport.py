@@ -0,0 +1,141 @@
+"""Contain class for collecting the results of validation running in the background."""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import Any, Self
+
+from framcore import Base
+
+
+class ValidationReport(Base):
+    """
+    Run validation of database files on a pool of worker threads, and collect the results in one report.
+
+    Each validation task is registered under the name of the validated file. A task which finds errors raises an exception, and a task which only finds
+    warnings returns a message with them. The report can be awaited, inspected or checked before the populated model is used, e.g. before solving.
+
+    The worker threads are started by the first submitted task, and released once all submitted tasks are finished and the report is waited for, e.g.
+    by check. Tasks submitted later start new worker threads. The report can also be used as a context manager, which waits for the tasks and releases
+    the worker threads on exit.
+
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        Initialize an empty report, which runs its tasks on its own pool of worker threads.
+
+        Args:
+            max_workers (int | None, optional): Maximum number of worker threads. Defaults to None, which uses the default of ThreadPoolExecutor.
+
+        """
+        super().__init__()
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, function: Callable[..., str | None], *args: Any) -> None:  # noqa: ANN401
+        """
+        Run a validation task in the background.
+
+        Args:
+            name (str): Name of the validated file. A task submitted with the name of an earlier task replaces it in the report.
+            function (Callable[..., str | None]): Validation function, which raises an exception for errors and may return a message with warnings.
+            *args (Any): Arguments to the validation function.
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="framdata-validation")
+            self._futures[name] = self._executor.submit(function, *args)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Wait for the submitted validation tasks to finish, and release the worker threads if they are.
+
+        Args:
+            timeout (float | None, optional): Maximum number of seconds to wait. Defaults to None, which waits until all tasks are finished.
+
+        Returns:
+            bool: Whether all tasks are finished.
+
+        """
+        with self._lock:
+            futures = list(self._futures.values())
+        __, not_done = wait(futures, timeout=timeout)
+        if not not_done:
+            self._release_workers()
+        return not not_done
+
+    def done(self) -> bool:
+        """Check whether all submitted validation tasks are finished, without waiting."""
+        with self._lock:
+            return all(future.done() for future in self._futures.values())
+
+    def get_errors(self) -> dict[str, str]:
+        """
+        Wait for the validation tasks and get the errors found.
+
+        Returns:
+            dict[str, str]: Names of the files with errors mapped to the error messages.
+
+        """
+        self.wait()
+        with self._lock:
+            futures = dict(self._futures)
+        errors = {}
+        for name, future in futures.items():
+            exception = future.exception()
+            if exception is not None:
+                errors[name] = str(exception) if isinstance(exception, ValueError) else f"{type(exception).__name__}: {exception}"
+        return errors
+
+    def get_warnings(self) -> dict[str, str]:
+        """
+        Wait for the validation tasks and get the warnings found in files without errors.
+
+        Returns:
+            dict[str, str]: Names of the files with warnings mapped to the warning messages.
+
+        """
+        self.wait()
+        with self._lock:
+            futures = dict(self._futures)
+        return {name: future.result() for name, future in futures.items() if future.exception() is None and future.result()}
+
+    def check(self) -> None:
+        """
+        Wait for the validation tasks, send the warnings found as warning events and raise the errors found.
+
+        Raises:
+            ValueError: If validation found errors in any file.
+
+        """
+        for message in self.get_warnings().values():
+            self.send_warning_event(message)
+        errors = self.get_errors()
+        if errors:
+            message = f"Validation failed for {len(errors)} files:\n" + "\n".join(errors.values())
+            raise ValueError(message)
+
+    def shutdown(self) -> None:
+        """Wait for the submitted validation tasks and release the worker threads."""
+        self.wait()
+
+    def __enter__(self) -> Self:
+        """Return the report."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Wait for the submitted validation tasks and release the worker threads."""
+        self.shutdown()
+
+    def _release_workers(self) -> None:
+        with self._lock:
+            executor = self._executor if all(future.done() for future in self._futures.values()) else None  # a task may have been submitted since
+            if executor is not None:
+                self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
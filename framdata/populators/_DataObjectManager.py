@@ -1,5 +1,6 @@
 """Contain class for creating TimeVectors, Curves and their Loaders."""
 
+from datetime import datetime
 from pathlib import Path
 from time import time
 
@@ -12,20 +13,40 @@ from framdata.loaders import (
     NVEExcelTimeVectorLoader,
     NVEH5TimeVectorLoader,
     NVEParquetTimeVectorLoader,
+    NVETimeVectorLoader,
     NVEYamlTimeVectoroader,
 )
-from framdata.loaders.curve_loaders import NVEYamlCurveLoader
+from framdata.loaders.curve_loaders import NVEH5CurveLoader, NVEYamlCurveLoader
+from framdata.populators._TaskRunner import _BufferedEventsMixin
+from framdata.populators._ValidationCache import _ValidationCache
+from framdata.populators.ValidationReport import ValidationReport
 
 
-class _DataObjectManager(Base):
+class _DataObjectManager(_BufferedEventsMixin, Base):
     """Manage TimeVectors, Curves, and their Loaders."""
 
     def __init__(
         self,
         validate: bool = True,
+        preload: bool = False,
+        memory_map: bool = False,
+        time_window: tuple[datetime | None, datetime | None] | None = None,
+        cache_dir: Path | str | None = None,
+        validation_report: ValidationReport | None = None,
     ) -> None:
         super().__init__()
         self._validate = validate
+        self._preload = preload
+        self._memory_map = memory_map
+        self._time_window = time_window
+        self._cache_dir = cache_dir
+        self._validation_cache = None if cache_dir is None else _ValidationCache(cache_dir)
+        self._validation_report = validation_report
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_validation_report"] = None  # the thread pool of the report can not be pickled, worker processes validate while creating loaders
+        return state
 
     def create_time_vectors(self, source: Path, relative_loc: Path, require_whole_years: bool) -> dict[str, LoadedTimeVector]:
         """
@@ -41,10 +62,19 @@ class _DataObjectManager(Base):
         """
         time_vectors = {}
         t = time()
-        loader: TimeVectorLoader = self._create_loader(TimeVectorLoader, source, relative_loc=relative_loc, req_whole_years=require_whole_years)
-        val_msg = "Create and validate" if self._validate else "Create"
+        loader: NVETimeVectorLoader = self._create_loader(TimeVectorLoader, source, relative_loc=relative_loc, req_whole_years=require_whole_years)
+        if self._validate and self._validation_report is not None:
+            self._validation_report.submit(str(relative_loc), self._validate_file, source, relative_loc, require_whole_years)
+        elif self._validate and self._validation_cache is not None:
+            self._validate_cached(loader, require_whole_years)
+        val_msg = "Create and validate" if self._validate and self._validation_report is None else "Create"
         self.send_debug_event(f"{val_msg} loader for {relative_loc} time: {round(time() - t, 3)}")
 
+        if self._preload:
+            t = time()
+            loader.load_all()
+            self.send_debug_event(f"Preload vectors for {relative_loc} time: {round(time() - t, 3)}")
+
         t = time()
         loader_ids = loader.get_ids()
         # self.send_debug_event(f"Loader get_ids time: {round(time() - t, 3)}")
@@ -89,6 +119,41 @@ class _DataObjectManager(Base):
 
         return curves
 
+    def _validate_file(self, source: Path, relative_loc: Path, require_whole_years: bool) -> None:
+        """
+        Validate the vectors of a time vector file in the background, through the validation cache if there is one.
+
+        The file is validated with its own loader, since the caches of the loader used by the time vectors are not safe to fill from several threads.
+
+        """
+        loader: NVETimeVectorLoader = self._create_loader(TimeVectorLoader, source, relative_loc=relative_loc, req_whole_years=require_whole_years)
+        try:
+            if self._validation_cache is not None:
+                self._validate_cached(loader, require_whole_years)
+            else:
+                loader.validate_vectors()
+        finally:
+            loader.clear_cache()
+
+    def _validate_cached(self, loader: NVETimeVectorLoader, require_whole_years: bool) -> None:
+        """Validate the vectors of a loader, or reuse the stored result of validating its file with the same loader class and options."""
+        path = loader.get_source()
+        validator = f"{type(loader).__name__}:{loader.VALIDATION_VERSION}"
+        options = (require_whole_years, self._time_window)
+        result = self._validation_cache.get(path, validator, options)
+        if result is None:
+            try:
+                loader.validate_vectors()
+            except ValueError as e:
+                result = (False, str(e))
+            else:
+                result = (True, None)
+            self._validation_cache.put(path, validator, options, *result)
+
+        is_valid, message = result
+        if not is_valid:
+            raise ValueError(message)
+
     def _create_loader(
         self,
         data_type: TimeVectorLoader | CurveLoader,
@@ -115,17 +180,49 @@ class _DataObjectManager(Base):
         if relative_loc is not None:
             path = source / relative_loc
         suffix = path.suffix
+        # otherwise validated through the cache or the validation report after creation
+        validate = self._validate and self._validation_cache is None and self._validation_report is None
         if data_type == TimeVectorLoader:
             if suffix in NVEExcelTimeVectorLoader.get_supported_suffixes():
-                return NVEExcelTimeVectorLoader(source=source, relative_loc=relative_loc, require_whole_years=req_whole_years, validate=self._validate)
+                return NVEExcelTimeVectorLoader(
+                    source=source,
+                    relative_loc=relative_loc,
+                    require_whole_years=req_whole_years,
+                    validate=validate,
+                    time_window=self._time_window,
+                    cache_dir=self._cache_dir,
+                )
             if suffix in NVEH5TimeVectorLoader.get_supported_suffixes():
-                return NVEH5TimeVectorLoader(source=source, relative_loc=relative_loc, require_whole_years=req_whole_years, validate=self._validate)
+                return NVEH5TimeVectorLoader(
+                    source=source,
+                    relative_loc=relative_loc,
+                    require_whole_years=req_whole_years,
+                    validate=validate,
+                    memory_map=self._memory_map,
+                    time_window=self._time_window,
+                )
             if suffix in NVEYamlTimeVectoroader.get_supported_suffixes():
-                return NVEYamlTimeVectoroader(source=source, relative_loc=relative_loc, require_whole_years=req_whole_years, validate=self._validate)
+                return NVEYamlTimeVectoroader(
+                    source=source,
+                    relative_loc=relative_loc,
+                    require_whole_years=req_whole_years,
+                    validate=validate,
+                    time_window=self._time_window,
+                    cache_dir=self._cache_dir,
+                )
             if suffix in NVEParquetTimeVectorLoader.get_supported_suffixes():
-                return NVEParquetTimeVectorLoader(source=source, relative_loc=relative_loc, require_whole_years=req_whole_years, validate=self._validate)
+                return NVEParquetTimeVectorLoader(
+                    source=source,
+                    relative_loc=relative_loc,
+                    require_whole_years=req_whole_years,
+                    validate=validate,
+                    memory_map=self._memory_map,
+                    time_window=self._time_window,
+                )
         if data_type == CurveLoader and suffix in NVEYamlCurveLoader.get_supported_suffixes():
             return NVEYamlCurveLoader(source=source, relative_loc=relative_loc)
+        if data_type == CurveLoader and suffix in NVEH5CurveLoader.get_supported_suffixes():
+            return NVEH5CurveLoader(source=source, relative_loc=relative_loc)
 
         msg = f"Could not create an appropriate loader for source: {source} and relative location: {relative_loc}. No defined loader for filetype {suffix}."
         raise NotImplementedError(msg)
@@ -7,9 +7,10 @@ import pandas as pd
 from framcore import Base
 
 from framdata.database_names.DatabaseNames import DatabaseNames as DbN
+from framdata.populators._TaskRunner import _BufferedEventsMixin
 
 
-class _DatabaseInterpreter(Base):
+class _DatabaseInterpreter(_BufferedEventsMixin, Base):
     """Class containing functions for interacting with DatabaseNames methods."""
 
     def __init__(self, source: Path | str) -> None:
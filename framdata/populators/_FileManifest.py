@@ -0,0 +1,52 @@
+"""Contain class for tracking which database files have changed since the previous run of a populator."""
+
+import os
+from pathlib import Path
+
+
+class _FileManifest:
+    """
+    Fingerprints (size and modification time) of the files used in the last successful run.
+
+    Files are checked against the manifest during a run, and their fingerprints are only committed when the run succeeds, so a failed run does not hide
+    changes from the next one.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty manifest, where every file is changed."""
+        self._fingerprints: dict[Path, tuple[int, int] | None] = {}
+        self._pending: dict[Path, tuple[int, int] | None] = {}
+
+    def is_unchanged(self, path: Path) -> bool:
+        """
+        Check whether a file has the same fingerprint as in the last successful run.
+
+        Args:
+            path (Path): Path to the file.
+
+        Returns:
+            bool: True if the file is unchanged, False if it has changed or was not used in the last successful run.
+
+        """
+        path = Path(path)
+        fingerprint = self._fingerprint(path)
+        self._pending[path] = fingerprint
+        return path in self._fingerprints and self._fingerprints[path] == fingerprint
+
+    def commit(self) -> None:
+        """Store the fingerprints of the files checked in the current run as the manifest of the last successful run."""
+        self._fingerprints.update(self._pending)
+        self._pending = {}
+
+    def discard(self) -> None:
+        """Forget the fingerprints of the files checked in an unfinished run."""
+        self._pending = {}
+
+    @staticmethod
+    def _fingerprint(path: Path) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(path)  # noqa: PTH116
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,137 @@
+"""
+Contain class for storing snapshots of populated objects, which are restored instead of populating again while the database is unchanged.
+
+Snapshots are pickled with references to the loaders of the time vectors and curves, but without the data cached by the loaders, so a restored model reads
+its data lazily just like a newly populated one. They are stored in the cache directory under the contract described in framdata.loaders._sidecar_cache.
+"""
+
+import copy
+import hashlib
+import io
+import os
+import pickle
+import uuid
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from time import time
+from typing import Any
+
+from framcore import Base
+from framcore.loaders import Loader
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickle loaders without the data they have cached."""
+
+    def __init__(self, file: io.BytesIO, protocol: int) -> None:
+        super().__init__(file, protocol=protocol)
+        self._protocol = protocol
+
+    def reducer_override(self, obj: object) -> Any:  # noqa: ANN401
+        if not isinstance(obj, Loader):
+            return NotImplemented
+        loader = copy.copy(obj)  # clear_cache replaces the cached attributes, so the original loader keeps its data
+        loader.clear_cache()
+        return loader.__reduce_ex__(self._protocol)
+
+
+class _PopulateSnapshot(Base):
+    """Store and restore the objects created by a populator, keyed by the fingerprints of the database files and the framdata version."""
+
+    _FORMAT_VERSION = 1
+    _SUBDIR = "snapshots"
+    _SUFFIX = ".pickle"
+
+    def __init__(self, cache_dir: Path | str) -> None:
+        """
+        Initialize snapshots stored in a cache directory.
+
+        Args:
+            cache_dir (Path | str): Cache directory.
+
+        """
+        super().__init__()
+        self._snapshot_dir = Path(cache_dir) / self._SUBDIR
+        try:
+            self._framdata_version = version("framdata")
+        except PackageNotFoundError:
+            self._framdata_version = None
+
+    def get_key(self, paths: list[Path | None], options: tuple) -> str:
+        """
+        Get the key of a snapshot of objects created from database files.
+
+        Files are fingerprinted by their path, size and modification time, which only requires a stat of each file.
+
+        Args:
+            paths (list[Path | None]): Paths to the database files the objects are created from, or None for files which do not exist.
+            options (tuple): Options the objects depend on, e.g. the populator class and its arguments. Must have a stable repr.
+
+        Returns:
+            str: Key of the snapshot.
+
+        """
+        fingerprints = []
+        for path in paths:
+            try:
+                stat = os.stat(path) if path is not None else None  # noqa: PTH116
+            except OSError:
+                stat = None
+            fingerprints.append((str(path), None) if stat is None else (str(path), stat.st_size, stat.st_mtime_ns))
+        key = repr((self._FORMAT_VERSION, self._framdata_version, options, fingerprints))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def load(self, key: str) -> Any | None:  # noqa: ANN401
+        """
+        Restore the objects of a snapshot.
+
+        Args:
+            key (str): Key of the snapshot.
+
+        Returns:
+            Any | None: The stored objects, or None if no valid snapshot is stored for the key.
+
+        """
+        t = time()
+        try:
+            with self._get_path(key).open("rb") as f:
+                content = pickle.load(f)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            self.send_debug_event(f"Could not restore snapshot {key}: {e}")
+            return None
+        self.send_debug_event(f"Restored snapshot {key} in {round(time() - t, 3)} s")
+        return content
+
+    def save(self, key: str, content: object) -> None:
+        """
+        Store objects in a snapshot, warning when they can not be pickled or written.
+
+        Args:
+            key (str): Key of the snapshot.
+            content (object): Objects to store.
+
+        """
+        t = time()
+        buffer = io.BytesIO()
+        try:
+            _SnapshotPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(content)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            self.send_warning_event(f"Could not store snapshot of populated objects, they can not be pickled: {e}")
+            return
+
+        path = self._get_path(key)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(buffer.getvalue())
+            tmp_path.replace(path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            self.send_warning_event(f"Could not write snapshot of populated objects to {path}: {e}")
+            return
+        self.send_debug_event(f"Stored snapshot {key} in {round(time() - t, 3)} s")
+
+    def _get_path(self, key: str) -> Path:
+        return self._snapshot_dir / f"{key}{self._SUFFIX}"
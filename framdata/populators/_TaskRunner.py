@@ -0,0 +1,128 @@
+"""
+Contain class for running the per-file tasks of population on a pool of workers.
+
+Tasks are submitted largest file first, so the slowest tasks do not start last, but their results are merged in the order the tasks were given. Events
+sent by objects using _BufferedEventsMixin while they run a task are buffered and returned with the result, so they can be replayed in the main thread in
+the same deterministic order no matter how the tasks were scheduled.
+"""
+
+import contextvars
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from time import time
+from typing import Any, ClassVar
+
+from framcore import Base
+
+_event_buffer: contextvars.ContextVar[list | None] = contextvars.ContextVar("framdata_event_buffer", default=None)
+
+
+class _BufferedEventsMixin:
+    """Buffer the events sent by an object while it runs a task of _TaskRunner, instead of sending them directly."""
+
+    def send_debug_event(self, *args: object, **kwargs: object) -> None:
+        self._send_or_buffer("send_debug_event", args, kwargs)
+
+    def send_info_event(self, *args: object, **kwargs: object) -> None:
+        self._send_or_buffer("send_info_event", args, kwargs)
+
+    def send_warning_event(self, *args: object, **kwargs: object) -> None:
+        self._send_or_buffer("send_warning_event", args, kwargs)
+
+    def _send_or_buffer(self, method: str, args: tuple, kwargs: dict) -> None:
+        buffer = _event_buffer.get()
+        if buffer is None:
+            getattr(super(), method)(*args, **kwargs)
+        else:
+            buffer.append((method, args, kwargs))
+
+
+class _TaskResult:
+    """Result of a task, with the events buffered while it ran and its run time."""
+
+    def __init__(self, value: object, error: BaseException | None, events: list[tuple[str, tuple, dict]], seconds: float) -> None:
+        self.value = value
+        self.error = error
+        self.events = events
+        self.seconds = seconds
+
+    def get(self) -> Any:  # noqa: ANN401
+        """Get the value returned by the task, or raise the exception raised by it."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def replay_events(self, sender: Base) -> None:
+        """Send the events buffered while the task ran through the sender."""
+        for method, args, kwargs in self.events:
+            getattr(sender, method)(*args, **kwargs)
+
+
+def _run_buffered(function: Callable, args: tuple) -> _TaskResult:
+    token = _event_buffer.set([])
+    t = time()
+    try:
+        value, error = function(*args), None
+    except Exception as e:  # noqa: BLE001 - raised in the main thread when the result is merged
+        value, error = None, e
+    finally:
+        events = _event_buffer.get()
+        _event_buffer.reset(token)
+    return _TaskResult(value, error, events, time() - t)
+
+
+class _TaskRunner(Base):
+    """Run independent per-file tasks serially, on a thread pool or on a process pool."""
+
+    _EXECUTORS: ClassVar[dict[str, type[Executor]]] = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+    def __init__(self, executor: str | None = None, max_workers: int | None = None) -> None:
+        """
+        Initialize a runner.
+
+        Args:
+            executor (str | None, optional): 'thread' to run tasks on a thread pool, suited for I/O-bound tasks like reading parquet and HDF5 files,
+                                             or 'process' to run them on a process pool, suited for CPU-bound tasks like parsing Excel files and
+                                             validating tables. The functions, arguments and results of tasks must then be picklable. Defaults to
+                                             None, which runs the tasks serially in the calling thread.
+            max_workers (int | None, optional): Maximum number of workers. Defaults to None, which uses the default of the executor.
+
+        Raises:
+            ValueError: If the executor is not supported.
+
+        """
+        super().__init__()
+        if executor is not None and executor not in self._EXECUTORS:
+            message = f"Unsupported executor '{executor}'. Supported executors are {set(self._EXECUTORS)} or None."
+            raise ValueError(message)
+        self._executor = executor
+        self._max_workers = max_workers
+
+    def run(self, tasks: list[tuple[Callable, tuple, Path | None]]) -> list[_TaskResult]:
+        """
+        Run tasks and wait for all of them to finish.
+
+        Args:
+            tasks (list[tuple[Callable, tuple, Path | None]]): Function, arguments and the path of the file processed by each task. Tasks with larger
+                                                              files are started first. Exceptions raised by a task are returned in its result.
+
+        Returns:
+            list[_TaskResult]: Results in the order of the tasks.
+
+        """
+        if self._executor is None or len(tasks) < 2:  # noqa: PLR2004
+            return [_run_buffered(function, args) for function, args, __ in tasks]
+
+        order = sorted(range(len(tasks)), key=lambda i: self._get_size(tasks[i][2]), reverse=True)
+        with self._EXECUTORS[self._executor](max_workers=self._max_workers) as executor:
+            futures = {i: executor.submit(_run_buffered, tasks[i][0], tasks[i][1]) for i in order}
+            return [futures[i].result() for i in range(len(tasks))]
+
+    @staticmethod
+    def _get_size(path: Path | None) -> int:
+        try:
+            return 0 if path is None else os.stat(path).st_size  # noqa: PTH116
+        except OSError:
+            return 0
@@ -0,0 +1,73 @@
+"""Contain class for caching validation results of database files between runs."""
+
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from framcore import Base
+
+from framdata.loaders._sidecar_cache import SidecarCache
+from framdata.populators._TaskRunner import _BufferedEventsMixin
+
+
+class _ValidationCache(_BufferedEventsMixin, Base):
+    """
+    Persistent cache of the results of validating database files.
+
+    A result is stored per file and validator, and is only used while the file is unchanged (same size and modification time) and the validator, its
+    options and the framdata version are the same as when the result was stored. Results are stored in the validation subdirectory of a cache directory.
+
+    """
+
+    _SUBDIR = "validation"
+
+    def __init__(self, cache_dir: Path | str) -> None:
+        """
+        Initialize a cache stored in a cache directory.
+
+        Args:
+            cache_dir (Path | str): Cache directory.
+
+        """
+        super().__init__()
+        self._cache = SidecarCache(Path(cache_dir) / self._SUBDIR)
+        try:
+            self._framdata_version = version("framdata")
+        except PackageNotFoundError:
+            self._framdata_version = None
+
+    def get(self, path: Path, validator: str, options: tuple) -> tuple[bool, object] | None:
+        """
+        Get the stored result of validating a file.
+
+        Args:
+            path (Path): Path to the validated file.
+            validator (str): Name and version of the validator, e.g. a loader or table schema class.
+            options (tuple): Options the result depends on, e.g. whether whole years are required. Must have a stable repr.
+
+        Returns:
+            tuple[bool, object] | None: Whether the file was valid and the errors found, or None if no result is stored for the current version of the
+                                        file.
+
+        """
+        cached = self._cache.load(path, self._get_kind(validator, options))
+        if cached is None:
+            return None
+        self.send_debug_event(f"Validation cache hit for {path} ({validator}), skipping validation.")
+        return cached[1]
+
+    def put(self, path: Path, validator: str, options: tuple, is_valid: bool, errors: object) -> None:
+        """
+        Store the result of validating a file.
+
+        Args:
+            path (Path): Path to the validated file.
+            validator (str): Name and version of the validator, e.g. a loader or table schema class.
+            options (tuple): Options the result depends on, e.g. whether whole years are required. Must have a stable repr.
+            is_valid (bool): Whether the file was valid.
+            errors (object): The errors found, e.g. a formatted message or error dataframes. Must be picklable.
+
+        """
+        self._cache.save(path, self._get_kind(validator, options), {}, (is_valid, errors))
+
+    def _get_kind(self, validator: str, options: tuple) -> str:
+        return repr((validator, options, self._framdata_version))
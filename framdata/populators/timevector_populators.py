@@ -1,5 +1,6 @@
 """Contain classes for populating a Model with only TimeVectors."""
 
+from datetime import datetime
 from pathlib import Path
 from typing import ClassVar
 
@@ -52,6 +53,13 @@ class NVETimeVectorPopulator(NVEEnergyModelPopulator):
         self,
         source: NVEPathManager | Path | str,  # take path to db instead?
         validate: bool = True,
+        preload: bool = False,
+        memory_map: bool = False,
+        horizon: tuple[datetime, datetime] | None = None,
+        cache_dir: Path | str | None = None,
+        background_validation: bool = False,
+        executor: str | None = None,
+        max_workers: int | None = None,
     ) -> None:
         """
         Initialize obejcts and attributes used by this class.
@@ -64,13 +72,32 @@ class NVETimeVectorPopulator(NVEEnergyModelPopulator):
             source (Path): path manager to a database hierarchy where each database follows the
                            structure defined by DatabaseNames.
             validate (bool): Toggle data validation.
+            preload (bool): Read all vectors of each time vector file into memory in a single pass when its time vectors are created.
+            memory_map (bool): Read time vector files through memory maps and share their buffers instead of copying values where supported.
+            horizon (tuple[datetime, datetime] | None): Start and end of the model horizon. Time vectors are only read and validated for the period
+                                                         they need to describe it.
+            cache_dir (Path | str | None): Directory of a binary cache of parsed Excel and YAML time vector files, which are then only parsed when
+                                           they change, and of their validation results, which are then only validated when they change. Disabled
+                                           if None.
+            background_validation (bool): Validate time vector files on worker threads while the model is built. The results are collected in the
+                                          report returned by get_validation_report, which must be checked before the model is used.
+            executor (str | None): Create the time vectors of the files in parallel, on a 'thread' or 'process' pool. Defaults to None, which
+                                   processes the files serially.
+            max_workers (int | None): Maximum number of workers of the executor. Defaults to None, which uses the default of the executor.
 
         """
-        super().__init__(source, validate)
+        super().__init__(source, validate, preload, memory_map, horizon, cache_dir, background_validation, executor, max_workers)
         self._source: Path = self._set_source(source)
         self._validate = validate
         self.database_interpreter = _DatabaseInterpreter(self._source)
-        self.data_object_manager = _DataObjectManager(validate=self._validate)
+        self.data_object_manager = _DataObjectManager(
+            validate=self._validate,
+            preload=preload,
+            memory_map=memory_map,
+            time_window=horizon,
+            cache_dir=cache_dir,
+            validation_report=self._validation_report,
+        )
 
         self._attribute_objects: dict[str, TimeVector | None] = {}
         self._data: dict[str, TimeVector] = {}
@@ -0,0 +1,66 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from framdata.file_editors import NVEH5TimeVectorEditor
+
+CURVES_YAML = """\
+Metadata:
+  X:
+    Attribute: Volume
+    Unit: Mm3
+  Y:
+    Attribute: Level
+    Unit: m
+c1:
+  Volume: [0.0, 10.0, 20.0]
+  Level: [100.0, 105.0, 108.0]
+c2:
+  Volume: [0, 5]
+  Level: [50, 51]
+"""
+
+
+@pytest.fixture
+def h5_time_vector_metadata() -> dict:
+    return {
+        "IsMaxLevel": True,
+        "IsZeroOneProfile": False,
+        "Is52WeekYears": False,
+        "ExtrapolateFirstPoint": False,
+        "ExtrapolateLastPoint": False,
+        "Frequency": None,
+        "StartDateTime": None,
+        "NumberOfPoints": None,
+        "TimeZone": None,
+        "Unit": None,
+        "Currency": None,
+        "RefPeriodNumberOfYears": None,
+        "RefPeriodStartYear": None,
+    }
+
+
+@pytest.fixture
+def create_h5_time_vector_editor(h5_time_vector_metadata: dict) -> Callable[..., NVEH5TimeVectorEditor]:
+    def create(indexes: dict[str, pd.DatetimeIndex], common_index: pd.DatetimeIndex | None = None) -> NVEH5TimeVectorEditor:
+        editor = NVEH5TimeVectorEditor()
+        editor.set_common_metadata(dict(h5_time_vector_metadata))
+        if common_index is not None:
+            editor.set_common_index(common_index.to_numpy())
+        for vector_id, index in indexes.items():
+            editor.set_vector(vector_id, np.arange(index.size, dtype=float))
+            if index is not common_index:
+                editor.set_index(vector_id, index.to_numpy())
+        return editor
+
+    return create
+
+
+@pytest.fixture
+def curves_yaml(tmp_path: Path) -> Path:
+    path = tmp_path / "curves.yaml"
+    path.write_text(CURVES_YAML, encoding="utf-8")
+    return path
@@ -0,0 +1,147 @@
+import gc
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import h5py
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from framdata.loaders._file_handle_pool import FileHandlePool
+
+TEST_PARQUET = "test_file.parquet"
+TEST_H5 = "test_file.h5"
+
+
+def write_parquet(path: Path, num_rows: int = 3) -> None:
+    pd.DataFrame({"vector": np.arange(num_rows)}).to_parquet(path)
+
+
+def write_h5(path: Path) -> None:
+    with h5py.File(path, mode="w") as f:
+        f.create_dataset("vector", data=np.arange(3))
+
+
+def test_get_parquet_file_reuses_handle(tmp_path: Path):
+    path = tmp_path / TEST_PARQUET
+    write_parquet(path)
+    pool = FileHandlePool()
+
+    with patch("framdata.loaders._file_handle_pool.pq.ParquetFile", wraps=pq.ParquetFile) as mock_parquet_file:
+        first = pool.get_parquet_file(path)
+        second = pool.get_parquet_file(str(path))
+        mock_parquet_file.assert_called_once()
+
+    assert first is second
+
+
+def test_get_parquet_file_reopens_rewritten_file(tmp_path: Path):
+    path = tmp_path / TEST_PARQUET
+    write_parquet(path)
+    pool = FileHandlePool()
+    first = pool.get_parquet_file(path)
+
+    write_parquet(path, num_rows=5)
+    second = pool.get_parquet_file(path)
+
+    assert first is not second
+    assert second.metadata.num_rows == 5  # noqa: PLR2004
+
+
+def test_get_derived_is_invalidated_by_rewrite(tmp_path: Path):
+    path = tmp_path / TEST_PARQUET
+    write_parquet(path)
+    pool = FileHandlePool()
+
+    assert pool.get_derived(path, "key", lambda: 1) == 1
+    assert pool.get_derived(path, "key", lambda: 2) == 1
+
+    write_parquet(path, num_rows=5)
+    assert pool.get_derived(path, "key", lambda: 2) == 2  # noqa: PLR2004
+
+
+class Owner:
+    pass
+
+
+def test_get_derived_is_dropped_when_released_by_all_owners(tmp_path: Path):
+    path = tmp_path / TEST_PARQUET
+    write_parquet(path)
+    pool = FileHandlePool()
+    first, second = Owner(), Owner()
+
+    assert pool.get_derived(path, "key", lambda: 1, owner=first) == 1
+    assert pool.get_derived(path, "key", lambda: 2, owner=second) == 1
+
+    pool.release_derived(path, first)
+    assert pool.get_derived(path, "key", lambda: 2) == 1
+
+    pool.release_derived(path, second)
+    assert pool._derived == {}
+    assert pool.get_derived(path, "key", lambda: 2) == 2  # noqa: PLR2004
+
+
+def test_get_derived_of_garbage_collected_owner_is_dropped(tmp_path: Path):
+    path = tmp_path / TEST_PARQUET
+    write_parquet(path)
+    pool = FileHandlePool()
+    owner = Owner()
+
+    pool.get_derived(path, "key", lambda: 1, owner=owner)
+    del owner
+    gc.collect()
+
+    assert pool.get_derived(path, "key", lambda: 2, owner=Owner()) == 2  # noqa: PLR2004
+
+
+def test_least_recently_used_derived_file_is_dropped(tmp_path: Path):
+    paths = [tmp_path / f"{i}_{TEST_PARQUET}" for i in range(3)]
+    for path in paths:
+        write_parquet(path)
+    pool = FileHandlePool(max_derived_files=2)
+
+    for i, path in enumerate(paths):
+        pool.get_derived(path, "key", lambda i=i: i)
+
+    assert len(pool._derived) == 2  # noqa: PLR2004
+    assert pool.get_derived(paths[0], "key", lambda: "new") == "new"
+    assert pool.get_derived(paths[2], "key", lambda: "new") == 2  # noqa: PLR2004
+
+
+def test_least_recently_used_handle_is_dropped(tmp_path: Path):
+    paths = [tmp_path / f"{i}_{TEST_PARQUET}" for i in range(3)]
+    for path in paths:
+        write_parquet(path)
+    pool = FileHandlePool(max_open_files=2)
+
+    first = pool.get_parquet_file(paths[0])
+    pool.get_parquet_file(paths[1])
+    pool.get_parquet_file(paths[0])
+    pool.get_parquet_file(paths[2])
+
+    assert pool.get_parquet_file(paths[0]) is first
+    assert len(pool._handles) == 2  # noqa: PLR2004
+    assert all(key[0] != str(paths[1].resolve()) for key in pool._handles)
+
+
+def test_release_closes_h5_file(tmp_path: Path):
+    path = tmp_path / TEST_H5
+    write_h5(path)
+    pool = FileHandlePool()
+    h5f = pool.get_h5_file(path)
+
+    pool.release(path)
+
+    assert not h5f  # closed h5py files are falsy
+    write_h5(path)  # truncating is possible once the file is released
+
+
+def test_handles_are_dropped_in_child_process(tmp_path: Path):
+    path = tmp_path / TEST_PARQUET
+    write_parquet(path)
+    pool = FileHandlePool()
+    first = pool.get_parquet_file(path)
+
+    with patch("framdata.loaders._file_handle_pool.os.getpid", return_value=os.getpid() + 1):
+        assert pool.get_parquet_file(path) is not first
@@ -1,10 +1,13 @@
 from pathlib import Path
 from typing import ClassVar
-from unittest.mock import MagicMock, Mock, call
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pandas as pd
 import pytest
+from framcore.populators import Populator
 
+from framdata.populators._FileManifest import _FileManifest
+from framdata.populators._TaskRunner import _TaskRunner
 from framdata.populators.NVEEnergyModelPopulator import NVEEnergyModelPopulator
 from framdata.populators.NVEPathManager import NVEPathManager
 
@@ -61,6 +64,8 @@ def test_populate_time_vectors(tmp_path: Path) -> None:
             self.database_interpreter = mocked_database_interpreter
             self.data_object_manager = mocked_data_object_manager
             self._data = {}
+            self._task_runner = _TaskRunner()
+            self._incremental = False
 
     populator = TestNVEEnergyModelPopulator()
     populator._register_id = Mock()
@@ -79,6 +84,49 @@ def test_populate_time_vectors(tmp_path: Path) -> None:
     assert result == expected
 
 
+def test_populate_time_vectors_incremental(tmp_path: Path) -> None:
+    tmp_file = "test.txt"
+    create_tmp_file(tmp_path / tmp_file)
+
+    mocked_database_interpreter = MagicMock()
+    mocked_database_interpreter.get_source_and_relative_loc = Mock(return_value=(tmp_path, tmp_file))
+    mocked_data_object_manager = MagicMock()
+    mocked_create_time_vectors = Mock(side_effect=[{"tv1": "first"}, {"tv1": "second"}])
+    mocked_data_object_manager.create_time_vectors = mocked_create_time_vectors
+
+    class TestNVEEnergyModelPopulator(NVEEnergyModelPopulator):
+        _TIME_VECTOR_LIST: ClassVar[list[str]] = [("tv1", False)]
+
+        def __init__(self):
+            self.database_interpreter = mocked_database_interpreter
+            self.data_object_manager = mocked_data_object_manager
+            self._data = {}
+            self._task_runner = _TaskRunner()
+            self._incremental = True
+            self._manifest = _FileManifest()
+            self._file_objects = {}
+            self._changed_ids = set()
+
+    populator = TestNVEEnergyModelPopulator()
+    populator._register_id = Mock()
+    populator._populate_time_vectors()
+    populator._manifest.commit()
+    assert populator._changed_ids == {"tv1"}
+
+    populator._changed_ids = set()
+    populator._populate_time_vectors()
+    populator._manifest.commit()
+    assert mocked_create_time_vectors.call_count == 1
+    assert populator._changed_ids == set()
+    assert populator._data == {"tv1": "first"}
+
+    (tmp_path / tmp_file).write_text("changed content")
+    populator._populate_time_vectors()
+    assert mocked_create_time_vectors.call_count == 2  # noqa: PLR2004
+    assert populator._changed_ids == {"tv1"}
+    assert populator._data == {"tv1": "second"}
+
+
 def test_populate_components() -> None:
     component_df = pd.DataFrame()
     meta_data = pd.DataFrame()
@@ -100,6 +148,8 @@ def test_populate_components() -> None:
         def __init__(self):
             self.database_interpreter = mocked_db_interpreter
             self._data = {}
+            self._task_runner = _TaskRunner()
+            self._incremental = False
 
             self._validate = False
 
@@ -122,6 +172,89 @@ def test_populate_components() -> None:
     populator._register_references.assert_has_calls([call("component1", {"ref1", "ref2"}), call("component2", {"ref3"})])
 
 
+def test_populate_components_incremental_reuses_unchanged_tables(tmp_path: Path) -> None:
+    tmp_file = "components.xlsx"
+    create_tmp_file(tmp_path / tmp_file)
+    component_df = pd.DataFrame({"id": ["component1", "component2"]})
+    mocked_db_interpreter = MagicMock()
+    mocked_db_interpreter.get_source_and_relative_loc = Mock(return_value=(tmp_path, tmp_file))
+    mocked_read_attribute_table = Mock(return_value=(component_df, pd.DataFrame()))
+    mocked_db_interpreter.read_attribute_table = mocked_read_attribute_table
+
+    components = [({"component1": "data1"}, {"ref1"}), ({"component2": "data2"}, set())]
+
+    class TestNVEEnergyModelPopulator(NVEEnergyModelPopulator):
+        _COMPONENT_DICT: ClassVar[dict] = {"component_file_name": object}
+
+        def __init__(self):
+            self.database_interpreter = mocked_db_interpreter
+            self._data = {}
+            self._attribute_objects = {}
+            self._task_runner = _TaskRunner()
+            self._validate = False
+            self._incremental = True
+            self._manifest = _FileManifest()
+            self._table_objects = {}
+            self._changed_ids = set()
+
+    populator = TestNVEEnergyModelPopulator()
+    populator._get_components = Mock(return_value=components)
+    populator._register_id = Mock()
+    populator._register_references = Mock()
+    first = populator._populate_topology_objects(populator._COMPONENT_DICT, "TEST")
+    populator._manifest.commit()
+
+    populator._changed_ids = set()
+    second = populator._populate_topology_objects(populator._COMPONENT_DICT, "TEST")
+    populator._manifest.commit()
+
+    assert first == second == {"component1": "data1", "component2": "data2"}
+    mocked_read_attribute_table.assert_called_once()
+    populator._get_components.assert_called_once()
+    assert populator._changed_ids == set()
+
+    populator._changed_ids = {"ref1"}
+    populator._get_components = Mock(return_value=[({"component1": "new data1"}, {"ref1"})])
+    third = populator._populate_topology_objects(populator._COMPONENT_DICT, "TEST")
+
+    assert third == {"component1": "new data1", "component2": "data2"}
+    mocked_read_attribute_table.assert_called_once()
+    assert populator._get_components.call_args.args[0]["id"].tolist() == ["component1"]
+
+
+def test_populate_twice_does_not_register_reused_objects_again(tmp_path: Path) -> None:
+    create_tmp_file(tmp_path / "vectors.parquet")
+    create_tmp_file(tmp_path / "components.xlsx")
+
+    class TestNVEEnergyModelPopulator(NVEEnergyModelPopulator):
+        _TIME_VECTOR_LIST: ClassVar[list[tuple[str, bool]]] = [("tv1", False)]
+        _CURVE_LIST: ClassVar[list[str]] = []
+        _ATTRIBUTES_DICT: ClassVar[dict] = {}
+        _COMPONENT_DICT: ClassVar[dict] = {"component_file_name": object}
+
+    populator = TestNVEEnergyModelPopulator(tmp_path, validate=False, incremental=True)
+    populator.database_interpreter = MagicMock()
+    populator.database_interpreter.get_source_and_relative_loc = Mock(
+        side_effect=lambda database_id: (tmp_path, "vectors.parquet" if database_id == "tv1" else "components.xlsx"),
+    )
+    populator.database_interpreter.read_attribute_table = Mock(return_value=(pd.DataFrame({"id": ["component1"]}), pd.DataFrame()))
+    populator.data_object_manager = MagicMock()
+    populator.data_object_manager.create_time_vectors = Mock(return_value={"tv1": "vector"})
+    populator._get_components = Mock(return_value=[({"component1": "data1"}, {"tv1"})])
+
+    with (
+        patch("framdata.populators.NVEEnergyModelPopulator.set_global_energy_equivalent"),
+        patch.object(Populator, "_register_id", autospec=True, side_effect=Populator._register_id) as register_id,
+        patch.object(Populator, "_register_references", autospec=True, side_effect=Populator._register_references) as register_references,
+    ):
+        populator.populate()
+        registered = (list(register_id.call_args_list), list(register_references.call_args_list))
+        populator.populate()
+
+    assert registered == (register_id.call_args_list, register_references.call_args_list)
+    assert [c.args[1] for c in register_id.call_args_list] == ["tv1", "component1"]
+
+
 def test_get_components() -> None:
     test_data = pd.DataFrame(
         [
@@ -3,6 +3,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import openpyxl
 import pandas as pd
 import pytest
 from framcore.timeindexes import ListTimeIndex
@@ -68,85 +69,94 @@ def test_get_values(tmp_path: Path, test_time_vector: pd.DataFrame):
     test_excel = tmp_path / TEST_FILENAME
     test_time_vector.to_excel(test_excel, sheet_name="Data", index=False)
     test_loader = NVEExcelTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, validate=False, require_whole_years=False)
-    test_loader._is_horizontal_format = MagicMock(return_value=False)
 
     expected = test_time_vector[EXPECTED_VECTOR].to_numpy()
     result = test_loader.get_values(vector_id=EXPECTED_VECTOR)
     assert np.array_equal(result, expected)
-    test_loader._is_horizontal_format.assert_called_once()
 
 
-def test_get_values_caches(tmp_path: Path, test_time_vector: pd.DataFrame):
+def test_get_values_parses_workbook_once(tmp_path: Path, test_time_vector: pd.DataFrame):
     test_excel = tmp_path / TEST_FILENAME
     test_time_vector.to_excel(test_excel, sheet_name="Data", index=False)
     test_loader = NVEExcelTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, validate=False, require_whole_years=False)
-    test_loader._is_horizontal_format = MagicMock(return_value=False)
 
-    __ = test_loader.get_values(vector_id=EXPECTED_VECTOR)
-    assert isinstance(test_loader._data, pd.DataFrame)
-    assert EXPECTED_VECTOR in test_loader._data.columns
-    expected = test_time_vector[EXPECTED_VECTOR]
-    result = test_loader._data[EXPECTED_VECTOR]
-    pd.testing.assert_series_equal(result, expected)
+    with patch("framdata.loaders.time_vector_loaders.openpyxl.load_workbook", wraps=openpyxl.load_workbook) as mock_load_workbook:
+        assert test_loader.get_ids() == [EXPECTED_VECTOR, "wrong_vector"]
+        __ = test_loader.get_values(vector_id=EXPECTED_VECTOR)
+        __ = test_loader.get_values(vector_id="wrong_vector")
+        mock_load_workbook.assert_called_once()
+
+    assert isinstance(test_loader._data, np.ndarray)
+    assert test_loader._data.shape == (2, 5)
+    assert test_loader._columns == {EXPECTED_VECTOR: 0, "wrong_vector": 1}
+    assert test_loader._datetimes.tolist() == test_time_vector[DATETIME_INDEX].tolist()
 
 
-def test_get_values_reads_cache(test_time_vector_horizontal_format: pd.DataFrame, test_time_vector: pd.DataFrame):
+def test_get_values_reads_cache(test_time_vector: pd.DataFrame):
     class TestNveExcelTimeVectorLoader(NVEExcelTimeVectorLoader):
         def __init__(self):
-            self._data = test_time_vector
+            self._data = test_time_vector[[EXPECTED_VECTOR, "wrong_vector"]].to_numpy().T
+            self._columns = {EXPECTED_VECTOR: 0, "wrong_vector": 1}
+            self._datetimes = pd.DatetimeIndex(test_time_vector[DATETIME_INDEX])
+            self._raw_meta = None
             self._index = None
 
             self._meta = None
+            self._time_window = None
+            self._positions = {}
 
     test_loader = TestNveExcelTimeVectorLoader()
     test_loader.get_source = MagicMock(return_value="")
-    test_loader._process_horizontal_format = MagicMock(return_value=test_time_vector)
-    test_loader._is_horizontal_format = MagicMock(return_value=True)
-    with patch("pandas.read_excel") as mock_read_excel:
-        __ = test_loader.get_values(vector_id=EXPECTED_VECTOR)
+    with patch("framdata.loaders.time_vector_loaders.openpyxl.load_workbook") as mock_load_workbook:
+        result = test_loader.get_values(vector_id=EXPECTED_VECTOR)
         test_loader.get_source.assert_not_called()
-        mock_read_excel.assert_not_called()
-        test_loader._process_horizontal_format.assert_not_called()
-        test_loader._process_horizontal_format.assert_not_called()
+        mock_load_workbook.assert_not_called()
+    assert np.array_equal(result, test_time_vector[EXPECTED_VECTOR].to_numpy())
 
 
-def test_get_values_horizontal_format(
-    tmp_path: Path,
-    test_time_vector: pd.DataFrame,
-    test_time_vector_horizontal_format: pd.DataFrame,
-):
+def test_get_values_horizontal_format(tmp_path: Path, test_time_vector_horizontal_format: pd.DataFrame):
     test_excel = tmp_path / TEST_FILENAME
     test_time_vector_horizontal_format.to_excel(test_excel, sheet_name="Data", index=False)
     test_loader = NVEExcelTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, validate=False, require_whole_years=False)
-    test_loader._is_horizontal_format = MagicMock(return_value=True)
-    test_loader._process_horizontal_format = MagicMock(return_value=test_time_vector)
 
-    expected = test_time_vector[EXPECTED_VECTOR].to_numpy()
     result = test_loader.get_values(vector_id=EXPECTED_VECTOR)
-    assert np.array_equal(result, expected)
-    test_loader._is_horizontal_format.assert_called_once()
 
-    # calls format processing
-    pd.testing.assert_frame_equal(
-        test_time_vector_horizontal_format,
-        test_loader._process_horizontal_format.call_args.args[0],
-        check_dtype=False,
-    )
+    assert np.array_equal(result, np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+    assert test_loader.get_ids() == [EXPECTED_VECTOR, "wrong_vector"]
+    assert [str(d) for d in test_loader._datetimes] == [
+        "2024-12-30 00:00:00",
+        "2025-12-29 00:00:00",
+        "2029-12-31 00:00:00",
+        "2040-01-02 00:00:00",
+        "2045-01-02 00:00:00",
+    ]
+
+
+def test_get_values_non_numeric(tmp_path: Path, test_time_vector: pd.DataFrame):
+    test_excel = tmp_path / TEST_FILENAME
+    test_time_vector[EXPECTED_VECTOR] = ["a", 2.0, 3.0, 4.0, 5.0]
+    test_time_vector.to_excel(test_excel, sheet_name="Data", index=False)
+    test_loader = NVEExcelTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, validate=False, require_whole_years=False)
 
-    pd.testing.assert_frame_equal(test_time_vector, test_loader._data, check_dtype=False)  # caches
+    with pytest.raises(RuntimeError, match="must consist of only float or integer numbers"):
+        test_loader.get_values(vector_id=EXPECTED_VECTOR)
 
 
 # ----- GET_INDEX ----- #
 def test_get_index(test_metadata: dict, test_time_vector: pd.DataFrame):
     class TestNveExcelTimeVectorLoader(NVEExcelTimeVectorLoader):
         def __init__(self):
-            self._data = test_time_vector
+            self._data = test_time_vector[[EXPECTED_VECTOR, "wrong_vector"]].to_numpy().T
+            self._columns = {EXPECTED_VECTOR: 0, "wrong_vector": 1}
+            self._datetimes = pd.DatetimeIndex(test_time_vector[DATETIME_INDEX])
+            self._raw_meta = None
             self._index = None
 
             self._meta = None
+            self._time_window = None
+            self._positions = {}
 
     test_loader = TestNveExcelTimeVectorLoader()
-    test_loader.get_values = MagicMock(return_value=test_time_vector)
     test_loader.get_metadata = MagicMock(return_value=test_metadata)
 
     result = test_loader.get_index("")  # argument shouldnt matter in this loader
@@ -166,26 +176,6 @@ def test_get_index(test_metadata: dict, test_time_vector: pd.DataFrame):
 
 
 # ----- FORMATTING ----- #
-def test_process_horizontal_format(test_time_vector: pd.DataFrame, test_time_vector_horizontal_format: pd.DataFrame):
-    class TestNveExcelTimeVectorLoader(NVEExcelTimeVectorLoader):
-        def __init__(self):
-            self._data = None
-            self._index = None
-            self._meta = None
-
-    test_loader = TestNveExcelTimeVectorLoader()
-    test_loader._to_iso_datetimes = MagicMock(
-        return_value=pd.date_range(start="2025-03-14 00:00:00", periods=5, freq="h"),
-    )
-
-    result = test_loader._process_horizontal_format(test_time_vector_horizontal_format)
-    assert set(result.columns) == set(test_time_vector.columns)  # check column equality
-    expected = test_time_vector[list(result.columns)]  # get correct order
-
-    # names of index and dtypes becomes different here but that doesnt matter so we disable checks for those
-    pd.testing.assert_frame_equal(result, expected, check_dtype=False, check_names=False)
-
-
 @pytest.mark.parametrize(
     ("test_input", "expected"),
     [
@@ -221,3 +211,36 @@ def test_to_iso_datetime_raises_error():
     msg = f"Loader {test_loader} could not convert value '{test_input}' to datetime format. Check formatting, for example number of spaces."
     with pytest.raises(RuntimeError, match=re.escape(msg)):
         test_loader._to_iso_datetimes(pd.Series([test_input]))
+
+
+def test_to_iso_datetimes_mixed_formats():
+    class TestNveExcelTimeVectorLoader(NVEExcelTimeVectorLoader):
+        def __init__(self):
+            self._source = "test_source"
+            self._relative_loc = "relative_loc"
+
+    test_loader = TestNveExcelTimeVectorLoader()
+    test_input = pd.Series(["2025-10-10 01:01", 2026, "2025-10", "2025-10-10", "2025-10-10 01", "2025-10-10 01:01:01"])
+
+    result = [str(v) for v in test_loader._to_iso_datetimes(test_input)]
+
+    assert result == [
+        "2025-10-01 00:00:00",
+        "2025-10-10 00:00:00",
+        "2025-10-10 01:00:00",
+        "2025-10-10 01:01:00",
+        "2025-10-10 01:01:01",
+        "2025-12-29 00:00:00",
+    ]
+
+
+def test_to_iso_datetimes_reports_first_invalid_value():
+    class TestNveExcelTimeVectorLoader(NVEExcelTimeVectorLoader):
+        def __init__(self):
+            self._source = "test_source"
+            self._relative_loc = "relative_loc"
+
+    test_loader = TestNveExcelTimeVectorLoader()
+    msg = f"Loader {test_loader} could not convert value '2025-13' to datetime format. Check formatting, for example number of spaces."
+    with pytest.raises(RuntimeError, match=re.escape(msg)):
+        test_loader._to_iso_datetimes(pd.Series([2025, "2025-13", "2025-10-10  01"]))
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from framdata.file_editors import NVEH5CurveEditor
+from framdata.loaders.curve_loaders import NVEH5CurveLoader, NVEYamlCurveLoader
+
+TEST_FILENAME = "test_curves.h5"
+
+
+def test_save_to_h5_round_trip(tmp_path: Path):
+    editor = NVEH5CurveEditor()
+    editor.set_curve("pq", [0.0, 50.0, 100.0], [0.0, 40.0, 90.0], "MW", "m3/s")
+    editor.set_curve("single", [1.0], [2.0], "MW", "m3/s")
+    editor.set_metadata("pq", {"Description": "PQ curve"})
+    editor.set_common_metadata({"Source": "test"})
+
+    editor.save_to_h5(tmp_path / TEST_FILENAME, compression="gzip", compression_level=4)
+
+    loader = NVEH5CurveLoader(tmp_path / TEST_FILENAME)
+    assert loader.get_ids() == ["pq", "single"]
+    assert loader.get_x_axis("pq").tolist() == [0.0, 50.0, 100.0]
+    assert loader.get_y_axis("single").tolist() == [2.0]
+    assert loader.get_x_unit("pq") == "MW"
+    assert loader.get_y_unit("single") == "m3/s"
+    assert loader.get_metadata("pq") == {"Source": "test", "Description": "PQ curve"}
+    assert loader.interpolate(["pq", "single"], [25.0]).tolist() == [[20.0], [2.0]]
+
+    reopened = NVEH5CurveEditor(tmp_path / TEST_FILENAME)
+    assert reopened.get_curve_ids() == ["pq", "single"]
+    assert reopened.get_units("pq") == ("MW", "m3/s")
+    assert np.array_equal(reopened.get_curve("pq")[1], [0.0, 40.0, 90.0])
+
+
+def test_get_units_first_and_after_clear_cache(tmp_path: Path):
+    editor = NVEH5CurveEditor()
+    editor.set_curve("pq", [0.0, 100.0], [0.0, 90.0], "MW", "m3/s")
+    editor.save_to_h5(tmp_path / TEST_FILENAME)
+    loader = NVEH5CurveLoader(tmp_path / TEST_FILENAME)
+
+    assert loader.get_x_unit("pq") == "MW"
+    assert loader.get_y_unit("pq") == "m3/s"
+
+    loader.clear_cache()
+    assert loader.get_ids() == ["pq"]
+    assert loader.get_x_unit("pq") == "MW"
+
+    loader.clear_cache()
+    assert loader.get_y_unit("pq") == "m3/s"
+
+
+def test_convert_yaml_curves(tmp_path: Path, curves_yaml: Path):
+    yaml_loader = NVEYamlCurveLoader(curves_yaml)
+    editor = NVEH5CurveEditor()
+
+    editor.set_curves_from_loader(yaml_loader)
+    editor.save_to_h5(tmp_path / TEST_FILENAME)
+
+    loader = NVEH5CurveLoader(tmp_path / TEST_FILENAME)
+    for curve_id in yaml_loader.get_ids():
+        assert np.array_equal(loader.get_x_axis(curve_id), yaml_loader.get_x_axis(curve_id))
+        assert np.array_equal(loader.get_y_axis(curve_id), yaml_loader.get_y_axis(curve_id))
+        assert loader.get_x_unit(curve_id) == "Mm3"
+    assert loader.get_metadata("c2")["Y"]["Attribute"] == "Level"
+
+
+def test_set_curve_unequal_axes():
+    editor = NVEH5CurveEditor()
+
+    with pytest.raises(ValueError, match="one dimensional with equal length"):
+        editor.set_curve("c", [0.0, 1.0], [0.0], "MW", "m3/s")
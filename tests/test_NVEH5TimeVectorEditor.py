@@ -0,0 +1,124 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pandas as pd
+import pytest
+
+from framdata.database_names.H5Names import H5Names
+from framdata.file_editors import NVEH5TimeVectorEditor
+from framdata.loaders import NVEH5TimeVectorLoader
+
+TEST_FILENAME = "test_time_vectors.h5"
+
+
+def test_save_to_h5_writes_int64_indexes_and_format_version(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]):
+    index = pd.to_datetime(["2025-01-01 00:00", "2025-01-01 02:00", "2025-01-01 03:00"])
+    other_index = pd.to_datetime(["2025-01-01 00:00", "2025-01-01 01:00"])
+    editor = create_h5_time_vector_editor({"v1": index, "v2": other_index})
+
+    editor.save_to_h5(tmp_path / TEST_FILENAME)
+
+    with h5py.File(tmp_path / TEST_FILENAME, mode="r") as f:
+        assert f.attrs[H5Names.FORMAT_VERSION_ATTRIBUTE] == H5Names.FORMAT_VERSION
+        assert f[H5Names.INDEX_GROUP]["v1"].dtype == np.int64
+        assert np.array_equal(f[H5Names.INDEX_GROUP]["v1"][()], index.asi8)
+
+
+def test_save_to_h5_collapses_identical_indexes(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]):
+    index = pd.to_datetime(["2025-01-01 00:00", "2025-01-01 02:00", "2025-01-01 03:00"])
+    other_index = pd.to_datetime(["2025-01-01 00:00", "2025-01-01 01:00"])
+    editor = create_h5_time_vector_editor({"v1": index, "v2": index.copy(), "v3": other_index})
+
+    editor.save_to_h5(tmp_path / TEST_FILENAME)
+
+    with h5py.File(tmp_path / TEST_FILENAME, mode="r") as f:
+        assert np.array_equal(f[H5Names.COMMON_PREFIX + H5Names.INDEX_GROUP][()], index.asi8)
+        assert set(f[H5Names.INDEX_GROUP].keys()) == {"v3"}
+
+    loader = NVEH5TimeVectorLoader(tmp_path / TEST_FILENAME, require_whole_years=False, validate=False)
+    assert list(loader.get_index("v2")._datetime_list) == index.tolist()
+    assert list(loader.get_index("v3")._datetime_list) == other_index.tolist()
+
+
+def test_save_to_h5_time_zone_aware_index(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]):
+    index = pd.date_range(start="2025-01-01", periods=3, freq="h", tz="UTC")
+    editor = create_h5_time_vector_editor({"v1": index})
+
+    with pytest.raises(ValueError, match="only be stored for vectors with TimeZone"):
+        editor.save_to_h5(tmp_path / TEST_FILENAME)
+
+    editor.set_common_metadata(editor.get_common_metadata() | {"TimeZone": "Europe/Oslo"})
+    editor.save_to_h5(tmp_path / TEST_FILENAME)
+
+    with h5py.File(tmp_path / TEST_FILENAME, mode="r") as f:
+        assert np.array_equal(f[H5Names.INDEX_GROUP]["v1"][()], index.tz_convert("Europe/Oslo").tz_localize(None).asi8)
+
+
+def test_read_legacy_and_int64_indexes_as_datetime64(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]):
+    index = pd.to_datetime(["2025-01-01 00:00", "2025-01-01 02:00", "2025-01-01 03:00"])
+    create_h5_time_vector_editor({"v1": index, "v2": index[:2]}).save_to_h5(tmp_path / TEST_FILENAME)
+    with h5py.File(tmp_path / TEST_FILENAME, mode="a") as f:
+        del f[H5Names.INDEX_GROUP]["v2"]
+        f[H5Names.INDEX_GROUP].create_dataset("v2", data=np.char.encode(index[:2].astype(str).to_numpy(dtype=str), encoding="utf-8"))
+
+    editor = NVEH5TimeVectorEditor(tmp_path / TEST_FILENAME)
+
+    assert editor.get_index("v1").dtype == np.dtype("datetime64[ns]")
+    assert editor.get_index("v2").dtype == np.dtype("datetime64[ns]")
+    assert np.array_equal(editor.get_index("v2"), index[:2].to_numpy())
+
+
+def test_save_to_h5_compressed_layout(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]):
+    index = pd.date_range(start="2025-01-01", periods=100, freq="h")
+    editor = create_h5_time_vector_editor({"v1": index})
+
+    editor.save_to_h5(tmp_path / TEST_FILENAME, compression="gzip", compression_level=4, chunk_size=24, fletcher32=True)
+
+    loader = NVEH5TimeVectorLoader(tmp_path / TEST_FILENAME, require_whole_years=False, validate=False)
+    assert loader.get_layout("v1") == {
+        H5Names.CHUNKS: (24,),
+        H5Names.COMPRESSION: "gzip",
+        H5Names.COMPRESSION_OPTS: 4,
+        H5Names.SHUFFLE: True,
+        H5Names.FLETCHER32: True,
+    }
+    assert [chunk["v1"].size for chunk in loader.iter_chunks("v1", chunk_size=50)] == [48, 48, 4]
+    assert np.array_equal(loader.get_values("v1"), np.arange(100, dtype=float))
+
+
+def test_save_to_h5_invalid_compression(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]):
+    editor = create_h5_time_vector_editor({"v1": pd.date_range(start="2025-01-01", periods=3, freq="h")})
+
+    with pytest.raises(ValueError, match="Unsupported compression 'zstd'"):
+        editor.save_to_h5(tmp_path / TEST_FILENAME, compression="zstd")
+
+
+def test_save_to_h5_matrix_layout(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]):
+    index = pd.date_range(start="2025-01-01", periods=6, freq="h")
+    editor = create_h5_time_vector_editor({"v1": index, "v2": index, "v3": index})
+    editor.set_vector("v2", np.full(6, 2.0))
+
+    editor.save_to_h5(tmp_path / TEST_FILENAME, matrix_layout=True, chunk_size=4)
+
+    with h5py.File(tmp_path / TEST_FILENAME, mode="r") as f:
+        assert H5Names.VECTORS_GROUP not in f
+        assert f[H5Names.VECTOR_MATRIX].shape == (6, 3)
+        assert f[H5Names.VECTOR_MATRIX].chunks == (4, 3)
+
+    loader = NVEH5TimeVectorLoader(tmp_path / TEST_FILENAME, require_whole_years=False, validate=False)
+    assert loader.get_ids() == ["v1", "v2", "v3"]
+    result = loader.get_values_many(["v3", "v2"], start=index[2].to_pydatetime(), end=index[4].to_pydatetime())
+    assert result["v3"].tolist() == [2.0, 3.0, 4.0]
+    assert result["v2"].tolist() == [2.0, 2.0, 2.0]
+    assert [chunk["v1"].tolist() for chunk in loader.iter_chunks(["v1", "v2"], chunk_size=4)] == [[0.0, 1.0, 2.0, 3.0], [4.0, 5.0]]
+    assert np.array_equal(NVEH5TimeVectorEditor(tmp_path / TEST_FILENAME).get_vector("v2"), np.full(6, 2.0))
+
+
+def test_save_to_h5_matrix_layout_unequal_lengths(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]):
+    index = pd.date_range(start="2025-01-01", periods=3, freq="h")
+    editor = create_h5_time_vector_editor({"v1": index, "v2": index[:2]})
+
+    with pytest.raises(ValueError, match="equal length to be saved in the matrix layout"):
+        editor.save_to_h5(tmp_path / TEST_FILENAME, matrix_layout=True)
@@ -0,0 +1,91 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pandas as pd
+import pytest
+
+from framdata.database_names.H5Names import H5Names
+from framdata.file_editors import NVEH5TimeVectorEditor, NVEH5TimeVectorInPlaceEditor
+from framdata.loaders import NVEH5TimeVectorLoader
+
+TEST_FILENAME = "test_time_vectors.h5"
+
+
+@pytest.fixture
+def h5_path(tmp_path: Path, create_h5_time_vector_editor: Callable[..., NVEH5TimeVectorEditor]) -> Path:
+    index = pd.date_range(start="2025-01-01", periods=4, freq="h")
+    editor = create_h5_time_vector_editor({"v1": index, "v2": index}, common_index=index)
+    editor.set_vector("v2", np.ones(4))
+    editor.save_to_h5(tmp_path / TEST_FILENAME)
+    return tmp_path / TEST_FILENAME
+
+
+def test_set_vector_in_place_keeps_other_vectors(h5_path: Path):
+    with NVEH5TimeVectorInPlaceEditor(h5_path) as editor:
+        editor.set_vector("v1", np.full(4, 7.0))
+        assert editor.get_vector("v2", slice(1, 3)).tolist() == [1.0, 1.0]
+
+    loader = NVEH5TimeVectorLoader(h5_path, require_whole_years=False, validate=False)
+    assert loader.get_values("v1").tolist() == [7.0] * 4
+    assert loader.get_values("v2").tolist() == [1.0] * 4
+
+
+def test_extend_contiguous_vector_and_index(h5_path: Path):
+    with NVEH5TimeVectorInPlaceEditor(h5_path, chunk_size=3) as editor:
+        editor.set_index("v1", pd.date_range(start="2025-01-01", periods=4, freq="h").to_numpy())
+        editor.extend_vector("v1", np.array([4.0, 5.0]))
+        editor.extend_index("v1", pd.date_range(start="2025-01-01 04:00", periods=2, freq="h").to_numpy())
+
+        assert editor.get_vector("v1").tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+        assert editor.get_index("v1")[-1] == np.datetime64("2025-01-01T05:00")
+
+    with h5py.File(h5_path, mode="r") as f:
+        assert f[H5Names.VECTORS_GROUP]["v1"].maxshape == (None,)
+        assert f[H5Names.VECTORS_GROUP]["v2"].maxshape == (4,)
+
+
+def test_set_vector_from_chunks(h5_path: Path, h5_time_vector_metadata: dict):
+    with NVEH5TimeVectorInPlaceEditor(h5_path, compression="gzip") as editor:
+        editor.set_vector_from_chunks("v3", (np.full(2, i, dtype=float) for i in range(3)))
+        editor.set_metadata("v3", h5_time_vector_metadata)
+        editor.set_index("v3", pd.date_range(start="2025-01-01", periods=6, freq="h").to_numpy())
+
+        assert editor.get_vector_ids() == ["v1", "v2", "v3"]
+        assert editor.get_metadata("v3")["IsMaxLevel"] is True
+
+    loader = NVEH5TimeVectorLoader(h5_path, require_whole_years=False, validate=False)
+    assert loader.get_values("v3").tolist() == [0.0, 0.0, 1.0, 1.0, 2.0, 2.0]
+    assert loader.get_layout("v3")[H5Names.COMPRESSION] == "gzip"
+
+
+def test_set_vector_from_empty_chunks(h5_path: Path):
+    with NVEH5TimeVectorInPlaceEditor(h5_path) as editor, pytest.raises(ValueError, match="empty iterable of chunks"):
+        editor.set_vector_from_chunks("v3", [])
+
+
+def test_get_missing_vector(h5_path: Path):
+    with NVEH5TimeVectorInPlaceEditor(h5_path) as editor, pytest.raises(KeyError, match="Found no ID 'v3'"):
+        editor.get_vector("v3")
+
+
+def test_swmr_append_and_refresh(tmp_path: Path, h5_time_vector_metadata: dict):
+    h5_path = tmp_path / TEST_FILENAME
+    editor = NVEH5TimeVectorInPlaceEditor(h5_path, chunk_size=2, swmr=True)
+    editor.set_common_metadata(h5_time_vector_metadata)
+    editor.set_common_index(pd.date_range(start="2025-01-01", periods=2, freq="h").to_numpy())
+    editor.set_vector("v1", np.array([1.0, 2.0]))
+    editor.start_swmr()
+
+    try:
+        loader = NVEH5TimeVectorLoader(h5_path, require_whole_years=False, validate=False, swmr=True)
+        assert loader.get_values("v1").tolist() == [1.0, 2.0]
+
+        editor.extend_vector("v1", np.array([3.0]))
+        editor.extend_common_index(pd.to_datetime(["2025-01-01 02:00"]).to_numpy())
+        loader.refresh()
+
+        assert loader.get_values("v1").tolist() == [1.0, 2.0, 3.0]
+    finally:
+        editor.close()
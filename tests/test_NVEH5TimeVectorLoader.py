@@ -1,5 +1,6 @@
 import re
 from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
@@ -146,3 +147,103 @@ def test_read_non_existant_field_or_fallback(tmp_path: Path, test_data: dict) ->
     )
     with h5py.File(h5_path, mode="r") as f, pytest.raises(KeyError, match=re.escape(expected_message)):
         result = loader._read_vector_field(f, field_name, vector_name, h5py.Dataset, use_fallback=True)[()]
+
+
+def test_get_values_many_opens_file_once(tmp_path: Path, test_data: dict) -> None:
+    h5_path = tmp_path / TEST_FILENAME
+    write_to_h5(h5_path, test_data)
+    loader = TestH5Loader(source=h5_path)
+
+    with patch("framdata.loaders._file_handle_pool.h5py.File", wraps=h5py.File) as mock_file:
+        result = loader.get_values_many([EXPECTED_VECTOR, "wrong_vector"])
+        mock_file.assert_called_once()
+
+    assert np.array_equal(result[EXPECTED_VECTOR], test_data["vectors"][EXPECTED_VECTOR])
+    assert np.array_equal(result["wrong_vector"], test_data["vectors"]["wrong_vector"])
+
+
+def test_get_values_in_window_reads_hyperslab(tmp_path: Path, test_data: dict) -> None:
+    h5_path = tmp_path / TEST_FILENAME
+    write_to_h5(h5_path, test_data)
+    loader = TestH5Loader(source=h5_path)
+
+    result = loader.get_values(EXPECTED_VECTOR, start=datetime(2025, 3, 14, 2), end=datetime(2025, 3, 14, 4))
+
+    assert np.array_equal(result, np.array([3, 4]))
+    assert EXPECTED_VECTOR not in loader._data
+
+
+def test_iter_chunks_reads_slabs(tmp_path: Path, test_data: dict) -> None:
+    test_data["vectors"]["short_vector"] = np.array([1, 2, 3])
+    h5_path = tmp_path / TEST_FILENAME
+    write_to_h5(h5_path, test_data)
+    loader = TestH5Loader(source=h5_path)
+
+    result = list(loader.iter_chunks([EXPECTED_VECTOR, "short_vector"], chunk_size=2))
+
+    assert [chunk[EXPECTED_VECTOR].tolist() for chunk in result] == [[1, 2], [3, 4], [5]]
+    assert [chunk["short_vector"].tolist() for chunk in result if "short_vector" in chunk] == [[1, 2], [3]]
+    assert loader._data is None
+
+
+def test_get_index_per_vector_with_interning(tmp_path: Path, test_data: dict, test_metadata: dict) -> None:
+    irregular_index = pd.to_datetime(["2025-03-14 00:00", "2025-03-14 02:00", "2025-03-14 03:00"])
+    encoded_index = np.char.encode(irregular_index.astype("S").to_numpy(dtype=str), encoding="utf-8")
+    list_metadata = test_metadata | {"Frequency": None, "StartDateTime": None, "NumberOfPoints": None}
+    test_data["vectors"]["list_vector_1"] = np.array([1, 2, 3])
+    test_data["vectors"]["list_vector_2"] = np.array([4, 5, 6])
+    test_data["index"] = {"list_vector_1": encoded_index, "list_vector_2": encoded_index.copy()}
+    test_data["metadata"] = {"list_vector_1": list_metadata, "list_vector_2": dict(list_metadata)}
+    h5_path = tmp_path / TEST_FILENAME
+    write_to_h5(h5_path, test_data)
+    loader = TestH5Loader(source=h5_path)
+
+    common_result = loader.get_index(EXPECTED_VECTOR)
+    list_result = loader.get_index("list_vector_1")
+
+    assert isinstance(common_result, FixedFrequencyTimeIndex)
+    assert isinstance(list_result, ListTimeIndex)
+    assert list(list_result._datetime_list) == irregular_index.tolist()
+    assert loader.get_index("wrong_vector") is common_result
+    assert loader.get_index("list_vector_2") is list_result
+    assert loader.get_metadata("list_vector_2") is loader.get_metadata("list_vector_1")
+
+
+def test_get_index_per_vector_decodes_each_index_once(tmp_path: Path, test_data: dict, test_metadata: dict) -> None:
+    irregular_index = pd.to_datetime(["2025-03-14 00:00", "2025-03-14 02:00", "2025-03-14 03:00"])
+    encoded_index = np.char.encode(irregular_index.astype("S").to_numpy(dtype=str), encoding="utf-8")
+    list_metadata = test_metadata | {"Frequency": None, "StartDateTime": None, "NumberOfPoints": None}
+    test_data["vectors"]["list_vector_1"] = np.array([1, 2, 3])
+    test_data["vectors"]["list_vector_2"] = np.array([4, 5, 6])
+    test_data["index"] = {"list_vector_1": encoded_index, "list_vector_2": encoded_index.copy()}
+    test_data["metadata"] = {"list_vector_1": list_metadata, "list_vector_2": dict(list_metadata)}
+    h5_path = tmp_path / TEST_FILENAME
+    write_to_h5(h5_path, test_data)
+    loader = TestH5Loader(source=h5_path)
+
+    with patch.object(loader, "_decode_index", wraps=loader._decode_index) as mock_decode:
+        first = loader.get_index("list_vector_1")
+        second = loader.get_index("list_vector_2")
+
+    assert second is first
+    assert sorted(call.args[1].name for call in mock_decode.call_args_list) == ["/index/list_vector_1", "/index/list_vector_2"]
+
+
+def test_get_values_memory_map(tmp_path: Path, test_data: dict) -> None:
+    h5_path = tmp_path / TEST_FILENAME
+    write_to_h5(h5_path, test_data)
+    with h5py.File(h5_path, mode="a") as f:
+        f["vectors"].create_dataset("chunked_vector", data=np.array([1.0, 2.0, 3.0, 4.0, 5.0]), chunks=(2,))
+    loader = NVEH5TimeVectorLoader(source=h5_path, require_whole_years=False, validate=False, memory_map=True)
+
+    result = loader.get_values(EXPECTED_VECTOR)
+    windowed = loader.get_values(EXPECTED_VECTOR, start=datetime(2025, 3, 14, 2), end=datetime(2025, 3, 14, 4))
+    chunked = loader.get_values("chunked_vector")
+
+    assert isinstance(result, np.memmap)
+    assert not result.flags.writeable
+    assert np.array_equal(result, test_data["vectors"][EXPECTED_VECTOR])
+    assert isinstance(windowed, np.memmap)
+    assert np.array_equal(windowed, np.array([3, 4]))
+    assert not isinstance(chunked, np.memmap)
+    assert np.array_equal(chunked, np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
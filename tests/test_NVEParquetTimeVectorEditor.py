@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from framdata.database_names.TimeVectorMetadataNames import TimeVectorMetadataNames as TvMn
+from framdata.file_editors import NVEParquetTimeVectorEditor
+
+TEST_FILENAME = "test_time_vectors.parquet"
+
+
+def test_save_to_parquet_writes_regular_index_metadata(tmp_path: Path):
+    editor = NVEParquetTimeVectorEditor()
+    editor.set_index_column(pd.Series(pd.date_range(start="2025-01-01", periods=4, freq="h")))
+    editor.set_vector("vector", pd.Series([1.0, 2.0, 3.0, 4.0]))
+
+    editor.save_to_parquet(tmp_path / TEST_FILENAME)
+
+    result, __ = TvMn.cast_meta(pq.ParquetFile(tmp_path / TEST_FILENAME).schema_arrow.metadata)
+    assert result[TvMn.START] == pd.Timestamp("2025-01-01")
+    assert result[TvMn.FREQUENCY] == pd.Timedelta("1h")
+    assert result[TvMn.NUM_POINTS] == 4  # noqa: PLR2004
+
+
+def test_save_to_parquet_irregular_index_leaves_metadata(tmp_path: Path):
+    editor = NVEParquetTimeVectorEditor()
+    editor.set_index_column(pd.Series(pd.to_datetime(["2025-01-01 00:00", "2025-01-01 01:00", "2025-01-01 03:00"])))
+    editor.set_vector("vector", pd.Series([1.0, 2.0, 3.0]))
+
+    editor.save_to_parquet(tmp_path / TEST_FILENAME)
+
+    __, missing_keys = TvMn.cast_meta(pq.ParquetFile(tmp_path / TEST_FILENAME).schema_arrow.metadata)
+    assert {TvMn.START, TvMn.FREQUENCY, TvMn.NUM_POINTS} <= missing_keys
@@ -1,8 +1,11 @@
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from framcore.timeindexes import FixedFrequencyTimeIndex, ListTimeIndex
 
@@ -106,7 +109,8 @@ def test_get_index_all_metadata_defined(tmp_path: Path, test_metadata: dict, tes
     assert result.__dict__ == expected.__dict__
 
 
-def test_get_index_no_frequency(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
+def test_get_index_no_frequency_detects_regular_index(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
+    expected_frequency = test_metadata["Frequency"]
     test_metadata["Frequency"] = None
 
     class TestNveParquetTimeVectorLoader(NVEParquetTimeVectorLoader):
@@ -117,6 +121,31 @@ def test_get_index_no_frequency(tmp_path: Path, test_metadata: dict, test_time_v
     test_time_vector.to_parquet(test_parquet)
     test_loader = TestNveParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
 
+    expected = FixedFrequencyTimeIndex(
+        start_time=test_metadata["StartDateTime"],
+        period_duration=expected_frequency,
+        num_periods=len(test_time_vector),
+        is_52_week_years=test_metadata["Is52WeekYears"],
+        extrapolate_first_point=test_metadata["ExtrapolateFirstPoint"],
+        extrapolate_last_point=test_metadata["ExtrapolateLastPoint"],
+    )
+    result = test_loader.get_index("")
+    assert isinstance(result, FixedFrequencyTimeIndex)
+    assert result.__dict__ == expected.__dict__
+
+
+def test_get_index_no_frequency_irregular_index(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
+    test_metadata["Frequency"] = None
+    test_time_vector[DATETIME_INDEX] = pd.to_datetime(["2025-03-14 00:00", "2025-03-14 01:00", "2025-03-14 03:00", "2025-03-14 04:00", "2025-03-15 00:00"])
+
+    class TestNveParquetTimeVectorLoader(NVEParquetTimeVectorLoader):
+        def get_metadata(self, vector_id: str):
+            return test_metadata
+
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet)
+    test_loader = TestNveParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
+
     expected = ListTimeIndex(
         datetime_list=pd.DatetimeIndex(test_time_vector[DATETIME_INDEX], tz=test_metadata["TimeZone"]).tolist(),
         is_52_week_years=test_metadata["Is52WeekYears"],
@@ -155,6 +184,31 @@ def test_get_index_no_start(tmp_path: Path, test_metadata: dict, test_time_vecto
     assert result.__dict__ == expected.__dict__
 
 
+def test_get_index_no_start_with_timezone(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
+    timezone = ZoneInfo("Europe/Oslo")
+    test_metadata["StartDateTime"] = None
+    test_metadata["TimeZone"] = timezone
+
+    class TestNveParquetTimeVectorLoader(NVEParquetTimeVectorLoader):
+        def get_metadata(self, vector_id: str):
+            return test_metadata
+
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet)
+    test_loader = TestNveParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
+    expected = FixedFrequencyTimeIndex(
+        start_time=pd.Timestamp("2025-03-14 00:00:00", tz=timezone),
+        period_duration=test_metadata["Frequency"],
+        num_periods=test_metadata["NumberOfPoints"],
+        is_52_week_years=test_metadata["Is52WeekYears"],
+        extrapolate_first_point=test_metadata["ExtrapolateFirstPoint"],
+        extrapolate_last_point=test_metadata["ExtrapolateLastPoint"],
+    )
+    result = test_loader.get_index("")
+    assert isinstance(result, FixedFrequencyTimeIndex)
+    assert result.__dict__ == expected.__dict__
+
+
 def test_get_index_no_num_points(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
     true_num_points = test_metadata["NumberOfPoints"]
     test_metadata["NumberOfPoints"] = None
@@ -177,3 +231,194 @@ def test_get_index_no_num_points(tmp_path: Path, test_metadata: dict, test_time_
     result = test_loader.get_index("")
     assert isinstance(result, FixedFrequencyTimeIndex)
     assert result.__dict__ == expected.__dict__
+
+
+def test_get_values_many_reads_file_once(tmp_path: Path, test_time_vector: pd.DataFrame):
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet)
+    test_loader = NVEParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
+
+    with patch("framdata.loaders._file_handle_pool.pq.ParquetFile", wraps=pq.ParquetFile) as mock_parquet_file:
+        result = test_loader.get_values_many([EXPECTED_VECTOR, "wrong_vector"])
+        __ = test_loader.get_values(EXPECTED_VECTOR)
+        __ = test_loader.get_ids()
+        mock_parquet_file.assert_called_once()
+
+    assert list(result) == [EXPECTED_VECTOR, "wrong_vector"]
+    assert np.array_equal(result[EXPECTED_VECTOR], test_time_vector[EXPECTED_VECTOR].to_numpy())
+    assert np.array_equal(result["wrong_vector"], test_time_vector["wrong_vector"].to_numpy())
+
+
+def test_load_all(tmp_path: Path, test_time_vector: pd.DataFrame):
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet)
+    test_loader = NVEParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
+
+    result = test_loader.load_all()
+
+    assert set(result) == {EXPECTED_VECTOR, "wrong_vector"}
+    assert set(test_loader._data) == {EXPECTED_VECTOR, "wrong_vector"}
+
+
+def test_get_values_memory_map_returns_read_only_views(tmp_path: Path, test_time_vector: pd.DataFrame):
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet)
+    test_loader = NVEParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False, memory_map=True)
+
+    result = test_loader.get_values(vector_id=EXPECTED_VECTOR)
+
+    assert np.array_equal(result, test_time_vector[EXPECTED_VECTOR].to_numpy())
+    assert not result.flags.writeable
+    assert result.base is not None  # view of the Arrow buffer, not an owned copy
+
+
+def test_get_values_memory_map_several_row_groups(tmp_path: Path, test_time_vector: pd.DataFrame):
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet, row_group_size=2)
+    assert pq.ParquetFile(test_parquet).metadata.num_row_groups == 3  # noqa: PLR2004
+    test_loader = NVEParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False, memory_map=True)
+
+    result = test_loader.get_values_many([EXPECTED_VECTOR, "wrong_vector"])
+
+    for vector_id, values in result.items():
+        assert np.array_equal(values, test_time_vector[vector_id].to_numpy())
+        assert values.ndim == 1
+        assert not values.flags.writeable
+
+
+def test_get_values_and_index_in_window(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
+    class TestNveParquetTimeVectorLoader(NVEParquetTimeVectorLoader):
+        def get_metadata(self, vector_id: str):
+            return test_metadata
+
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet, row_group_size=2)
+    test_loader = TestNveParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
+    start, end = datetime(2025, 3, 14, 1, 30), datetime(2025, 3, 14, 3)
+
+    values = test_loader.get_values(EXPECTED_VECTOR, start=start, end=end)
+    index = test_loader.get_index(EXPECTED_VECTOR, start=start, end=end)
+
+    assert np.array_equal(values, np.array([2, 3]))
+    assert isinstance(index, FixedFrequencyTimeIndex)
+    assert index.__dict__ == FixedFrequencyTimeIndex(
+        start_time=pd.to_datetime("2025-03-14 01:00:00"),
+        period_duration=test_metadata["Frequency"],
+        num_periods=2,
+        is_52_week_years=test_metadata["Is52WeekYears"],
+        extrapolate_first_point=test_metadata["ExtrapolateFirstPoint"],
+        extrapolate_last_point=test_metadata["ExtrapolateLastPoint"],
+    ).__dict__
+    assert test_loader._data is None  # values read for a window given in the call are not cached
+
+
+def test_time_window_list_index_reads_bounding_points(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
+    test_metadata["Frequency"] = None
+    test_time_vector[DATETIME_INDEX] = pd.to_datetime(["2025-03-14 00:00", "2025-03-14 01:00", "2025-03-14 03:00", "2025-03-14 04:00", "2025-03-15 00:00"])
+
+    class TestNveParquetTimeVectorLoader(NVEParquetTimeVectorLoader):
+        def get_metadata(self, vector_id: str):
+            return test_metadata
+
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet, row_group_size=2)
+    test_loader = TestNveParquetTimeVectorLoader(
+        source=tmp_path,
+        relative_loc=TEST_FILENAME,
+        require_whole_years=False,
+        validate=False,
+        time_window=(datetime(2025, 3, 14, 1, 30), datetime(2025, 3, 14, 3, 30)),
+    )
+
+    values = test_loader.get_values(EXPECTED_VECTOR)
+    index = test_loader.get_index(EXPECTED_VECTOR)
+
+    assert np.array_equal(values, np.array([2, 3, 4]))
+    assert index._datetime_list == test_time_vector[DATETIME_INDEX].iloc[1:4].tolist()
+
+
+def test_time_window_without_overlap_reads_whole_vector(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
+    class TestNveParquetTimeVectorLoader(NVEParquetTimeVectorLoader):
+        def get_metadata(self, vector_id: str):
+            return test_metadata
+
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet)
+    test_loader = TestNveParquetTimeVectorLoader(
+        source=tmp_path,
+        relative_loc=TEST_FILENAME,
+        require_whole_years=False,
+        validate=False,
+        time_window=(datetime(2030, 1, 1), datetime(2031, 1, 1)),
+    )
+
+    assert np.array_equal(test_loader.get_values(EXPECTED_VECTOR), test_time_vector[EXPECTED_VECTOR].to_numpy())
+
+
+def test_iter_chunks(tmp_path: Path, test_time_vector: pd.DataFrame):
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet, row_group_size=2)
+    test_loader = NVEParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
+
+    result = list(test_loader.iter_chunks(EXPECTED_VECTOR, chunk_size=2))
+
+    assert [list(chunk) for chunk in result] == [[EXPECTED_VECTOR]] * 3
+    assert [chunk[EXPECTED_VECTOR].tolist() for chunk in result] == [[1, 2], [3, 4], [5]]
+    assert test_loader._data is None  # streamed chunks are not cached
+
+
+def test_validate_vectors_streams_values(tmp_path: Path, test_time_vector: pd.DataFrame):
+    test_time_vector.loc[2, EXPECTED_VECTOR] = -1
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet, row_group_size=2)
+    test_loader = NVEParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
+
+    with pytest.raises(ValueError, match=f"{EXPECTED_VECTOR} contains 1 negative values."):
+        test_loader.validate_vectors()
+    assert test_loader._data is None
+
+
+def test_validate_vectors_counts_block_and_checks_shared_index_once(tmp_path: Path, test_metadata: dict, test_time_vector: pd.DataFrame):
+    class TestNveParquetTimeVectorLoader(NVEParquetTimeVectorLoader):
+        def get_metadata(self, vector_id: str):
+            return test_metadata
+
+    test_time_vector[EXPECTED_VECTOR] = [1.0, np.nan, 3.0, -4.0, -5.0]
+    test_time_vector["wrong_vector"] = [-1.0, 0.0, 0.0, 0.0, 0.0]
+    test_parquet = tmp_path / TEST_FILENAME
+    test_time_vector.to_parquet(test_parquet, row_group_size=2)
+    test_loader = TestNveParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=True, validate=False)
+    index_type = type(test_loader.get_index(EXPECTED_VECTOR))
+
+    with patch.object(index_type, "is_whole_years", autospec=True, return_value=True) as is_whole_years:
+        with pytest.raises(ValueError) as error:  # noqa: PT011
+            test_loader.validate_vectors()
+
+    assert is_whole_years.call_count == 1
+    assert f"{EXPECTED_VECTOR} contains 2 negative values." in str(error.value)
+    assert f"{EXPECTED_VECTOR} contains 1 nan values." in str(error.value)
+    assert "wrong_vector contains 1 negative values." in str(error.value)
+
+
+@pytest.mark.parametrize("num_vectors", [4, 32])
+def test_validate_vectors_memory_does_not_grow_with_vector_count(tmp_path: Path, num_vectors: int):
+    chunk_elements = []
+
+    class TestNveParquetTimeVectorLoader(NVEParquetTimeVectorLoader):
+        _CHUNK_SIZE = 4
+        _VALIDATION_ELEMENTS = 8
+
+        def iter_chunks(self, vector_ids=None, chunk_size=None):
+            for chunk in super().iter_chunks(vector_ids, chunk_size):
+                chunk_elements.append(sum(values.size for values in chunk.values()))
+                yield chunk
+
+    tv_df = pd.DataFrame({f"v{i}": np.arange(10.0) for i in range(num_vectors)})
+    tv_df[DATETIME_INDEX] = pd.date_range(start="2025-03-14 00:00:00", periods=10, freq="h")
+    tv_df.to_parquet(tmp_path / TEST_FILENAME)
+    test_loader = TestNveParquetTimeVectorLoader(source=tmp_path, relative_loc=TEST_FILENAME, require_whole_years=False, validate=False)
+
+    test_loader.validate_vectors()
+
+    assert max(chunk_elements) == TestNveParquetTimeVectorLoader._VALIDATION_ELEMENTS
+    assert sum(chunk_elements) == 10 * num_vectors
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from framdata.loaders.curve_loaders import NVEYamlCurveLoader
+
+
+@pytest.fixture
+def loader(curves_yaml: Path) -> NVEYamlCurveLoader:
+    return NVEYamlCurveLoader(curves_yaml)
+
+
+def test_axes_are_parsed_once_to_read_only_arrays(loader: NVEYamlCurveLoader):
+    x_axis = loader.get_x_axis("c1")
+
+    assert np.array_equal(x_axis, [0.0, 10.0, 20.0])
+    assert np.array_equal(loader.get_y_axis("c2"), [50, 51])
+    assert loader.get_x_axis("c1") is x_axis
+    assert not x_axis.flags.writeable
+
+
+def test_ids_units_and_metadata(loader: NVEYamlCurveLoader):
+    assert loader.get_ids() == ["c1", "c2"]
+    assert loader.get_x_unit("c1") == "Mm3"
+    assert loader.get_y_unit("c1") == "m"
+    assert loader.get_metadata("c1")["Y"]["Attribute"] == "Level"
+
+
+def test_get_axes_pads_curves(loader: NVEYamlCurveLoader):
+    x_axes, y_axes, lengths = loader.get_axes(["c2", "c1"])
+
+    assert lengths.tolist() == [2, 3]
+    assert x_axes[0].tolist() == [0.0, 5.0, np.inf]
+    assert np.isnan(y_axes[0, 2])
+    assert y_axes[1].tolist() == [100.0, 105.0, 108.0]
+
+
+def test_interpolate_matches_np_interp(loader: NVEYamlCurveLoader):
+    points = np.array([-5.0, 0.0, 2.5, 10.0, 15.0, 30.0])
+
+    values = loader.interpolate(["c1", "c2"], points)
+
+    for row, curve_id in enumerate(["c1", "c2"]):
+        expected = np.interp(points, loader.get_x_axis(curve_id), loader.get_y_axis(curve_id))
+        assert np.allclose(values[row], expected)
+
+
+def test_interpolate_points_per_curve(loader: NVEYamlCurveLoader):
+    values = loader.interpolate(["c1", "c2"], [[5.0, 20.0], [2.5, 5.0]])
+
+    assert values.tolist() == [[102.5, 108.0], [50.5, 51.0]]
+
+    with pytest.raises(ValueError, match="one row per curve"):
+        loader.interpolate(["c1"], [[5.0], [2.5]])
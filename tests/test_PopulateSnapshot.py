@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from framdata.populators import _PopulateSnapshot as snapshot_module
+from framdata.populators._PopulateSnapshot import _PopulateSnapshot
+
+
+class CachingLoader:
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.data = None
+
+    def load(self) -> list[int]:
+        if self.data is None:
+            self.data = [1, 2, 3]
+        return self.data
+
+    def clear_cache(self) -> None:
+        self.data = None
+
+
+@pytest.fixture
+def snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> _PopulateSnapshot:
+    monkeypatch.setattr(snapshot_module, "Loader", CachingLoader)
+    return _PopulateSnapshot(tmp_path / "cache")
+
+
+def test_key_changes_with_files_and_options(tmp_path: Path, snapshot: _PopulateSnapshot):
+    path = tmp_path / "file.txt"
+    path.write_text("a")
+    key = snapshot.get_key([path, None], ("options",))
+
+    assert snapshot.get_key([path, None], ("options",)) == key
+    assert snapshot.get_key([path, None], ("other options",)) != key
+    path.write_text("ab")
+    assert snapshot.get_key([path, None], ("options",)) != key
+
+
+def test_save_and_load_without_loaded_data(snapshot: _PopulateSnapshot):
+    loader = CachingLoader("source")
+    loader.load()
+    content = ({"tv1": ("vector", loader), "tv2": ("vector", loader)}, [("_register_id", ("tv1", "file"))])
+
+    assert snapshot.load("key") is None
+    snapshot.save("key", content)
+    data, registrations = snapshot.load("key")
+
+    assert loader.data == [1, 2, 3]  # the original loader keeps its data
+    assert registrations == [("_register_id", ("tv1", "file"))]
+    restored = data["tv1"][1]
+    assert restored is data["tv2"][1]
+    assert restored.source == "source"
+    assert restored.data is None
+    assert restored.load() == [1, 2, 3]
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from framdata.loaders import NVEExcelTimeVectorLoader
+from framdata.loaders._file_handle_pool import file_handle_pool
+from framdata.loaders._sidecar_cache import SidecarCache
+
+TEST_FILENAME = "test_file.txt"
+KIND = "test"
+
+
+def test_save_and_load(tmp_path: Path):
+    source = tmp_path / TEST_FILENAME
+    source.write_text("content")
+    cache = SidecarCache(tmp_path / "cache")
+
+    assert cache.load(source, KIND) is None
+    assert cache.save(source, KIND, {"values": np.arange(3.0), "empty": np.empty(0)}, {"meta": 1})
+
+    arrays, content = cache.load(source, KIND)
+    assert isinstance(arrays["values"], np.memmap)
+    assert not arrays["values"].flags.writeable
+    assert arrays["values"].tolist() == [0.0, 1.0, 2.0]
+    assert arrays["empty"].size == 0
+    assert content == {"meta": 1}
+    assert cache.load(source, "other kind") is None
+
+
+def test_save_unpicklable_content_is_skipped(tmp_path: Path):
+    source = tmp_path / TEST_FILENAME
+    source.write_text("content")
+    cache = SidecarCache(tmp_path / "cache")
+
+    assert not cache.save(source, KIND, {}, {"function": lambda: None})
+    assert cache.load(source, KIND) is None
+    assert not list((tmp_path / "cache").rglob("*.tmp"))
+
+
+def test_save_and_load_do_not_hash_settled_file(tmp_path: Path):
+    source = tmp_path / TEST_FILENAME
+    source.write_text("content")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**10))
+    cache = SidecarCache(tmp_path / "cache")
+
+    with patch.object(SidecarCache, "_hash") as mock_hash:
+        assert cache.save(source, KIND, {"values": np.arange(3.0)}, None)
+        assert cache.load(source, KIND) is not None
+        mock_hash.assert_not_called()
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.load(source, KIND) is None
+
+
+def test_load_of_racy_entry_checks_content(tmp_path: Path):
+    source = tmp_path / TEST_FILENAME
+    source.write_text("content")
+    cache = SidecarCache(tmp_path / "cache")
+    cache.save(source, KIND, {"values": np.arange(3.0)}, None)  # just written, the modification time can not be trusted yet
+    assert cache.load(source, KIND) is not None
+
+    stat = source.stat()
+    source.write_text("changed")  # same size, different content
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.load(source, KIND) is None
+
+
+def test_excel_loader_skips_parsing_with_cache(tmp_path: Path):
+    source = tmp_path / "test_time_vectors.xlsx"
+    pd.DataFrame({"vector": [1.0, 2.0, 3.0], "DateTime": pd.date_range("2025-01-01", periods=3, freq="D")}).to_excel(source, sheet_name="Data", index=False)
+    loader = NVEExcelTimeVectorLoader(source, require_whole_years=False, validate=False, cache_dir=tmp_path / "cache")
+    expected = loader.get_values("vector")
+
+    file_handle_pool.release(source)
+    loader = NVEExcelTimeVectorLoader(source, require_whole_years=False, validate=False, cache_dir=tmp_path / "cache")
+    with patch("framdata.loaders.time_vector_loaders.openpyxl.load_workbook", wraps=openpyxl.load_workbook) as mock_load_workbook:
+        result = loader.get_values("vector")
+        mock_load_workbook.assert_not_called()
+
+    assert np.array_equal(result, expected)
+    assert loader._datetimes.tolist() == pd.date_range("2025-01-01", periods=3, freq="D").tolist()
@@ -0,0 +1,46 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from framcore import Base
+
+from framdata.populators._TaskRunner import _BufferedEventsMixin, _TaskRunner
+
+
+class EventSender(_BufferedEventsMixin, Base):
+    def work(self, name: str) -> str:
+        self.send_debug_event(f"working on {name}")
+        if name == "fail":
+            message = "task failed"
+            raise ValueError(message)
+        return name.upper()
+
+
+def create_files(tmp_path: Path, sizes: dict[str, int]) -> dict[str, Path]:
+    paths = {}
+    for name, size in sizes.items():
+        paths[name] = tmp_path / name
+        paths[name].write_bytes(b"0" * size)
+    return paths
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_run_merges_results_and_events_in_task_order(tmp_path: Path, executor: str | None):
+    paths = create_files(tmp_path, {"small": 1, "large": 1000, "fail": 10})
+    sender = EventSender()
+    tasks = [(sender.work, (name,), path) for name, path in paths.items()]
+
+    results = _TaskRunner(executor, max_workers=2).run(tasks)
+
+    assert [result.value for result in results] == ["SMALL", "LARGE", None]
+    with pytest.raises(ValueError, match="task failed"):
+        results[2].get()
+    replay_target = Mock()
+    for result in results:
+        result.replay_events(replay_target)
+    assert [c.args[0] for c in replay_target.send_debug_event.call_args_list] == ["working on small", "working on large", "working on fail"]
+
+
+def test_unsupported_executor():
+    with pytest.raises(ValueError, match="Unsupported executor 'gpu'"):
+        _TaskRunner("gpu")
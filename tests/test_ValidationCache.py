@@ -0,0 +1,48 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from framdata.populators._DataObjectManager import _DataObjectManager
+from framdata.populators._ValidationCache import _ValidationCache
+
+TEST_FILENAME = "test_file.txt"
+VALIDATOR = "TestNames:1"
+
+
+def test_put_and_get(tmp_path: Path):
+    source = tmp_path / TEST_FILENAME
+    source.write_text("content")
+    cache = _ValidationCache(tmp_path / "cache")
+    errors = {"metadata": pd.DataFrame({"column": ["Unit"], "is_warning": [False]})}
+
+    assert cache.get(source, VALIDATOR, (True,)) is None
+    cache.put(source, VALIDATOR, (True,), False, errors)
+
+    is_valid, cached_errors = cache.get(source, VALIDATOR, (True,))
+    assert not is_valid
+    assert cached_errors["metadata"].equals(errors["metadata"])
+    assert cache.get(source, VALIDATOR, (False,)) is None
+    assert cache.get(source, "TestNames:2", (True,)) is None
+
+    source.write_text("changed content")
+    assert cache.get(source, VALIDATOR, (True,)) is None
+
+
+def test_data_object_manager_reuses_validation_result(tmp_path: Path):
+    source = tmp_path / TEST_FILENAME
+    source.write_text("content")
+    manager = _DataObjectManager(cache_dir=tmp_path / "cache")
+    loader = MagicMock()
+    loader.get_source.return_value = source
+    loader.VALIDATION_VERSION = 1
+    loader.validate_vectors.side_effect = ValueError("Found errors in loader")
+
+    with pytest.raises(ValueError, match="Found errors in loader"):
+        manager._validate_cached(loader, True)
+    with patch.object(_ValidationCache, "send_debug_event") as send_debug_event, pytest.raises(ValueError, match="Found errors in loader"):
+        manager._validate_cached(loader, True)
+
+    assert loader.validate_vectors.call_count == 1
+    send_debug_event.assert_called_once()
@@ -0,0 +1,83 @@
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from framdata.loaders import NVEParquetTimeVectorLoader
+from framdata.populators._DataObjectManager import _DataObjectManager
+from framdata.populators.ValidationReport import ValidationReport
+
+
+def fail(message: str) -> None:
+    raise ValueError(message)
+
+
+def test_collects_errors_and_warnings():
+    report = ValidationReport(max_workers=2)
+
+    report.submit("valid.xlsx", lambda: None)
+    report.submit("warnings.xlsx", lambda: "Warnings found in metadata")
+    report.submit("errors.parquet", fail, "Found errors in loader")
+
+    assert report.wait()
+    assert report.done()
+    assert report.get_errors() == {"errors.parquet": "Found errors in loader"}
+    assert report.get_warnings() == {"warnings.xlsx": "Warnings found in metadata"}
+    with patch.object(ValidationReport, "send_warning_event") as send_warning_event, pytest.raises(ValueError, match="Found errors in loader"):
+        report.check()
+    send_warning_event.assert_called_once_with("Warnings found in metadata")
+    report.shutdown()
+
+
+def test_runs_in_background():
+    release = threading.Event()
+    report = ValidationReport()
+
+    report.submit("slow.h5", release.wait)
+
+    assert not report.wait(timeout=0.01)
+    assert not report.done()
+    release.set()
+    report.check()
+    report.shutdown()
+
+
+def test_releases_workers_when_finished():
+    report = ValidationReport()
+
+    report.submit("first.h5", lambda: None)
+    report.check()
+    assert report._executor is None
+
+    with report:
+        report.submit("second.h5", lambda: "Warnings found in metadata")
+        assert report._executor is not None
+    assert report._executor is None
+    assert report.get_warnings() == {"second.h5": "Warnings found in metadata"}
+
+
+def test_background_validation_uses_its_own_loader(tmp_path: Path):
+    pd.DataFrame({"vector": [1.0, 2.0], "DateTime": pd.date_range("2025-01-01", periods=2, freq="h")}).to_parquet(tmp_path / "vectors.parquet")
+    report = ValidationReport()
+    manager = _DataObjectManager(validation_report=report)
+    create_loader = _DataObjectManager._create_loader
+    created, validated = [], []
+
+    def record_loader(*args, **kwargs):
+        created.append(create_loader(*args, **kwargs))
+        return created[-1]
+
+    with (
+        patch.object(_DataObjectManager, "_create_loader", autospec=True, side_effect=record_loader),
+        patch.object(NVEParquetTimeVectorLoader, "validate_vectors", autospec=True, side_effect=validated.append),
+    ):
+        time_vectors = manager.create_time_vectors(tmp_path, Path("vectors.parquet"), False)
+        report.check()
+
+    assert list(time_vectors) == ["vector"]
+    assert len(created) == 2  # noqa: PLR2004
+    assert validated == [created[1]]
+    assert created[1] is not created[0]
+    report.shutdown()